@@ -11,6 +11,7 @@ import os
 import logging
 import time
 import signal
+import json
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any, Optional
@@ -28,6 +29,12 @@ except ImportError as e:
     print(f"[ERROR] Settings import failed: {e}")
     sys.exit(1)
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Override settings with Docker environment variables for debugging
 batch_size_env = os.getenv('SCRAPER_BATCH_SIZE')
 max_jobs_env = os.getenv('MAX_JOBS_PER_SESSION')
@@ -44,7 +51,7 @@ if max_jobs_env:
 
 # Enhanced logging for V2
 logging.basicConfig(
-    level=getattr(logging, LOGGING_SETTINGS.get('level', 'INFO')),
+    level=LOG_LEVEL_INT,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
         logging.StreamHandler(sys.stdout),
@@ -57,7 +64,27 @@ class AutomatedPipelineV2:
     def __init__(self):
         self.running = True
         self.start_time = datetime.now()
-        self.stats = {
+        self.stats = self._empty_stats()
+        # Stats of the run that wrote the last checkpoint (reported, never added to)
+        self.previous_run = None
+        
+        # Persisted stats so a crash mid-run keeps its progress metadata
+        self._state_path = Path(PATHS['state_dir']) / 'pipeline_v2.stats.json'
+        self._state_path.parent.mkdir(parents=True, exist_ok=True)
+        self._load_checkpoint()
+        
+        # Set up signal handlers for graceful shutdown
+        signal.signal(signal.SIGINT, self.signal_handler)
+        signal.signal(signal.SIGTERM, self.signal_handler)
+        
+    def signal_handler(self, signum, frame):
+        logger.info("Received signal %s, initiating graceful shutdown...", signum)
+        self.running = False
+    
+    @staticmethod
+    def _empty_stats():
+        """Per-run counters, reset at the start of every pipeline run"""
+        return {
             'phases_completed': 0,
             'total_jobs_processed': 0,
             'total_jobs_cleaned': 0,
@@ -68,14 +95,31 @@ class AutomatedPipelineV2:
             'errors': 0,
             'last_run': None
         }
-        
-        # Set up signal handlers for graceful shutdown
-        signal.signal(signal.SIGINT, self.signal_handler)
-        signal.signal(signal.SIGTERM, self.signal_handler)
-        
-    def signal_handler(self, signum, frame):
-        logger.info(f"Received signal {signum}, initiating graceful shutdown...")
-        self.running = False
+    
+    def _load_checkpoint(self):
+        """Keep the stats of the last checkpoint written by a previous run as previous_run"""
+        if not self._state_path.exists():
+            return
+        try:
+            data = self._state_path.read_bytes()
+            saved = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+            self.previous_run = {k: v for k, v in saved.items() if k in self.stats}
+            logger.info("[RESUME] Loaded pipeline stats checkpoint (last run: %s)", self.previous_run.get('last_run'))
+        except Exception as e:
+            logger.warning(f"[WARNING] Could not load stats checkpoint: {e}")
+    
+    async def _checkpoint(self):
+        """Persist stats atomically (write to temp file, then rename)"""
+        try:
+            if ORJSON_AVAILABLE:
+                data = orjson.dumps(self.stats)
+            else:
+                data = json.dumps(self.stats).encode('utf-8')
+            tmp_path = self._state_path.with_suffix('.tmp')
+            await asyncio.to_thread(tmp_path.write_bytes, data)
+            await asyncio.to_thread(os.replace, tmp_path, self._state_path)
+        except Exception as e:
+            logger.warning(f"[WARNING] Could not write stats checkpoint: {e}")
     
     async def wait_for_database(self, max_attempts=30):
         """Wait for database to be ready"""
@@ -93,7 +137,7 @@ class AutomatedPipelineV2:
                 
             except Exception as e:
                 if attempt < max_attempts - 1:
-                    logger.info(f"Database not ready (attempt {attempt + 1}/{max_attempts}), retrying in 5s...")
+                    logger.info("Database not ready (attempt %d/%d), retrying in 5s...", attempt + 1, max_attempts)
                     await asyncio.sleep(5)
                 else:
                     logger.error(f"[ERROR] Database connection failed after {max_attempts} attempts: {e}")
@@ -116,7 +160,7 @@ class AutomatedPipelineV2:
             # Check if we should skip if recent data exists
             existing_df = scraper.load_job_urls_from_csv()
             if existing_df is not None and len(existing_df) > 0:
-                logger.info(f"[INFO] Found {len(existing_df)} existing URLs, using them")
+                logger.info("[INFO] Found %d existing URLs, using them", len(existing_df))
                 df = existing_df
             else:
                 logger.info("[INFO] No existing data found")
@@ -125,7 +169,7 @@ class AutomatedPipelineV2:
                 return 0
             
             if df is not None and len(df) > 0:
-                logger.info(f"[SUCCESS] Phase 1 completed: {len(df)} job URLs collected")
+                logger.info("[SUCCESS] Phase 1 completed: %d job URLs collected", len(df))
                 return len(df)
             else:
                 logger.error("[ERROR] Phase 1 failed: No URLs collected")
@@ -166,7 +210,7 @@ class AutomatedPipelineV2:
             resume = existing_jobs is not None and len(existing_jobs) > 0
             
             if resume:
-                logger.info(f"[RESUME] Resuming from {len(existing_jobs)} existing jobs")
+                logger.info("[RESUME] Resuming from %d existing jobs", len(existing_jobs))
             
             # Run enhanced scraping
             logger.info("[START] Starting enhanced scraping with:")
@@ -193,13 +237,14 @@ class AutomatedPipelineV2:
             self.stats['cleaning_failures'] = result.get('cleaning_failures', 0)
             self.stats['database_failures'] = result.get('database_failures', 0)
             
-            logger.info(f"[SUCCESS] Phase 2 completed:")
-            logger.info(f"   📊 Jobs scraped: {result.get('scraped_count', 0)}")
-            logger.info(f"   🧹 Jobs cleaned: {result.get('cleaned_count', 0)}")
-            logger.info(f"   💾 Jobs loaded to DB: {result.get('loaded_count', 0)}")
-            logger.info(f"   ❌ Validation failures: {result.get('validation_failures', 0)}")
-            logger.info(f"   🔧 Cleaning failures: {result.get('cleaning_failures', 0)}")
-            logger.info(f"   💥 Database failures: {result.get('database_failures', 0)}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("[SUCCESS] Phase 2 completed:")
+                logger.info("   📊 Jobs scraped: %d", result.get('scraped_count', 0))
+                logger.info("   🧹 Jobs cleaned: %d", result.get('cleaned_count', 0))
+                logger.info("   💾 Jobs loaded to DB: %d", result.get('loaded_count', 0))
+                logger.info("   ❌ Validation failures: %d", result.get('validation_failures', 0))
+                logger.info("   🔧 Cleaning failures: %d", result.get('cleaning_failures', 0))
+                logger.info("   💥 Database failures: %d", result.get('database_failures', 0))
             
             return result.get('loaded_count', 0)
             
@@ -226,13 +271,13 @@ class AutomatedPipelineV2:
             # Limit processing in automation mode to prevent long runs
             max_jobs = min(len(missing_jobs), 50)  # Reduced since V2 should have fewer gaps
             
-            logger.info(f"[PROCESS] Processing {max_jobs} remaining jobs for contact enhancement")
+            logger.info("[PROCESS] Processing %d remaining jobs for contact enhancement", max_jobs)
             enhanced_jobs = await process_contact_enhancement(missing_jobs, max_jobs)
             
             if enhanced_jobs:
                 report = await save_enhanced_results(enhanced_jobs, missing_jobs)
                 contacts_found = report['processing_summary']['emails_found'] + report['processing_summary']['phones_found']
-                logger.info(f"[SUCCESS] Phase 3 completed: {contacts_found} additional contacts found")
+                logger.info("[SUCCESS] Phase 3 completed: %d additional contacts found", contacts_found)
                 return contacts_found
             else:
                 logger.warning("[WARNING] Phase 3 completed with no enhancements")
@@ -247,7 +292,13 @@ class AutomatedPipelineV2:
         """Run the complete V2 automated pipeline with enhanced integration"""
         logger.info("[START] Starting V2 automated job scraper pipeline...")
         logger.info("[INFO] V2 Features: Enhanced validation + Comprehensive cleaning + Single DB load")
-        logger.info(f"[CONFIG] Configuration: batch_size={SCRAPER_SETTINGS['batch_size']}, headless={SCRAPER_SETTINGS.get('headless', True)}")
+        logger.info("[CONFIG] Configuration: batch_size=%s, headless=%s",
+                    SCRAPER_SETTINGS['batch_size'], SCRAPER_SETTINGS.get('headless', True))
+        
+        # Counters describe this run only (continuous mode calls this repeatedly)
+        if self.stats['last_run']:
+            self.previous_run = self.stats
+        self.stats = self._empty_stats()
         
         # Wait for database
         if not await self.wait_for_database():
@@ -262,18 +313,21 @@ class AutomatedPipelineV2:
                 urls_collected = await self.run_phase1_links()
                 if urls_collected > 0:
                     self.stats['phases_completed'] += 1
+                await self._checkpoint()
             
             # Phase 2: Enhanced scraping with integrated cleaning and DB loading
             if self.running:
                 jobs_loaded = await self.run_phase2_enhanced_scraping()
                 if jobs_loaded >= 0:  # 0 is valid (no jobs to process)
                     self.stats['phases_completed'] += 1
+                await self._checkpoint()
             
             # Phase 3: Contact enhancement for remaining gaps only
             if self.running:
                 contacts_enhanced = await self.run_phase3_contacts()
                 if contacts_enhanced >= 0:  # 0 is valid (no enhancement needed)
                     self.stats['phases_completed'] += 1
+                await self._checkpoint()
             
             # No separate Phase 4 - database loading is integrated in Phase 2
             
@@ -281,18 +335,23 @@ class AutomatedPipelineV2:
             
             # Final report
             self.stats['last_run'] = datetime.now().isoformat()
+            await self._checkpoint()
             
             logger.info("[SUCCESS] V2 PIPELINE COMPLETED SUCCESSFULLY!")
-            logger.info(f"[SUMMARY] Enhanced Summary:")
-            logger.info(f"   [TIME] Duration: {pipeline_duration:.1f} seconds")
-            logger.info(f"   [SUCCESS] Phases completed: {self.stats['phases_completed']}/3")
-            logger.info(f"   [STATS] Jobs scraped: {self.stats['total_jobs_processed']}")
-            logger.info(f"   [STATS] Jobs cleaned: {self.stats['total_jobs_cleaned']}")
-            logger.info(f"   [DATABASE] Jobs in database: {self.stats['total_jobs_loaded']}")
-            logger.info(f"   [ERROR] Validation failures: {self.stats['validation_failures']}")
-            logger.info(f"   [ERROR] Cleaning failures: {self.stats['cleaning_failures']}")
-            logger.info(f"   [ERROR] Database failures: {self.stats['database_failures']}")
-            logger.info(f"   [ERROR] Total errors: {self.stats['errors']}")
+            logger.info("[SUMMARY] Enhanced Summary:")
+            logger.info("   [TIME] Duration: %.1f seconds", pipeline_duration)
+            logger.info("   [SUCCESS] Phases completed: %d/3", self.stats['phases_completed'])
+            logger.info("   [STATS] Jobs scraped: %d", self.stats['total_jobs_processed'])
+            logger.info("   [STATS] Jobs cleaned: %d", self.stats['total_jobs_cleaned'])
+            logger.info("   [DATABASE] Jobs in database: %d", self.stats['total_jobs_loaded'])
+            logger.info("   [ERROR] Validation failures: %d", self.stats['validation_failures'])
+            logger.info("   [ERROR] Cleaning failures: %d", self.stats['cleaning_failures'])
+            logger.info("   [ERROR] Database failures: %d", self.stats['database_failures'])
+            logger.info("   [ERROR] Total errors: %d", self.stats['errors'])
+            if self.previous_run:
+                logger.info("   [RESUME] Previous run: %s, %d/3 phases, %d errors",
+                            self.previous_run.get('last_run'), self.previous_run.get('phases_completed', 0),
+                            self.previous_run.get('errors', 0))
             
             return self.stats['errors'] == 0
             
@@ -310,16 +369,16 @@ class AutomatedPipelineV2:
         
         while self.running:
             try:
-                logger.info(f"[SCHEDULE] Starting scheduled V2 pipeline run (interval: {interval_hours}h)")
+                logger.info("[SCHEDULE] Starting scheduled V2 pipeline run (interval: %dh)", interval_hours)
                 success = await self.run_full_pipeline_v2()
                 
                 if success:
-                    logger.info(f"[SUCCESS] Scheduled V2 run completed successfully")
+                    logger.info("[SUCCESS] Scheduled V2 run completed successfully")
                 else:
                     logger.warning(f"[WARNING] Scheduled V2 run completed with errors")
                 
                 if self.running:
-                    logger.info(f"[WAIT] Sleeping for {interval_hours} hours until next run...")
+                    logger.info("[WAIT] Sleeping for %d hours until next run...", interval_hours)
                     await asyncio.sleep(interval_seconds)
                     
             except asyncio.CancelledError:
@@ -347,6 +406,7 @@ async def main():
         sys.exit(0 if success else 1)
 
 if __name__ == "__main__":
+    init_runtime()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
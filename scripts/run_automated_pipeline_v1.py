@@ -323,6 +323,7 @@ async def main():
         sys.exit(0 if success else 1)
 
 if __name__ == "__main__":
+    init_runtime()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
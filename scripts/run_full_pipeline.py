@@ -8,32 +8,42 @@ Executes the complete 1-2-1 workflow:
 3. Contact Enhancement (contact_scraper.py)
 """
 
+import argparse
 import asyncio
+import multiprocessing
+import os
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import AsyncExitStack, asynccontextmanager
 import logging
+import queue
 from pathlib import Path
 from datetime import datetime
 import json
-from typing import Dict, Optional
+from itertools import islice
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Iterable, Iterator, List, Optional
 
-# Add paths for imports
-project_root = Path(__file__).parent.parent
-sys.path.append(str(project_root / "src"))
-sys.path.append(str(project_root / "src" / "config"))
-sys.path.append(str(project_root / "src" / "utils"))
-sys.path.append(str(project_root / "src" / "database"))
+# Put src/ (package imports) plus src/config and src/utils (the bare `settings` and
+# `file_manager` modules the scrapers use) on the path once, so each module is only
+# ever imported under one name
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+for _path in (SRC_DIR, SRC_DIR / "config", SRC_DIR / "utils"):
+    if str(_path) not in sys.path:
+        sys.path.append(str(_path))
 
 # Import enhanced components
 from scrapers.link_job import JobURLScraper
 from scrapers.job_scraper import JobScraper
-from config.settings import SCRAPER_SETTINGS
+from scrapers.job_scraper_v1 import build_context_settings
 from scrapers.contact_scraper import ContactScraper
 
 # Import new components with fallbacks
 try:
     from settings import (SCRAPER_SETTINGS, DATABASE_SETTINGS, FILE_MANAGEMENT_SETTINGS, 
-                         VALIDATION_SETTINGS, LOGGING_SETTINGS, PATHS)
+                         VALIDATION_SETTINGS, LOGGING_SETTINGS, PATHS, BROWSER_SETTINGS,
+                         CAPTCHA_SETTINGS, LOG_LEVEL_INT, init_runtime)
     SETTINGS_AVAILABLE = True
 except ImportError as e:
     raise ImportError(
@@ -57,28 +67,79 @@ except ImportError:
     FILE_MANAGER_AVAILABLE = False
     logging.warning("FileManager not available")
 
+from utils.rate_limit import RateLimiter
+from utils.url_cache import URLStatusCache, classify_scraped_job, write_pending_job_urls
+
 try:
-    from data_loader import JobDataLoader
+    from database.data_loader import JobDataLoader
     DATA_LOADER_AVAILABLE = True
 except ImportError:
     DATA_LOADER_AVAILABLE = False
     logging.warning("JobDataLoader not available")
 
-# Setup logging
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+# Jobs per load_jobs_batch call when streaming scraped_jobs.json into the database
+DB_LOAD_BATCH_SIZE = 500
+
+# Setup logging: records go through a queue so file/console writes happen on the
+# listener thread instead of blocking the event loop
+_log_queue = queue.SimpleQueue()
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_handlers = [logging.FileHandler('data/logs/pipeline.log'), logging.StreamHandler()]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+log_listener = QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
 logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('data/logs/pipeline.log'),
-        logging.StreamHandler()
-    ]
+    level=LOG_LEVEL_INT,
+    handlers=[QueueHandler(_log_queue)],
+    force=True  # scraper modules imported above already called basicConfig
 )
+log_listener.start()
 logger = logging.getLogger(__name__)
 
+def batched(iterable: Iterable, n: int) -> Iterator[List]:
+    """Yield lists of up to n items (itertools.batched is 3.12+)"""
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, n)):
+        yield batch
+
+def load_json_file(path: Path):
+    """Parse a JSON file (orjson when available)"""
+    data = Path(path).read_bytes()
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+def dump_json_file(path: Path, data):
+    """Write pretty-printed UTF-8 JSON straight to bytes (orjson when available)"""
+    if ORJSON_AVAILABLE:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        payload = json.dumps(data, ensure_ascii=False, indent=2, default=str).encode('utf-8')
+    Path(path).write_bytes(payload)
+
 class FullPipeline:
-    def __init__(self, enable_database: bool = True, enable_sessions: bool = True):
+    def __init__(self, enable_database: bool = True, enable_sessions: bool = True,
+                 reuse_existing_urls: Optional[bool] = None, resume: Optional[bool] = None,
+                 enhance_contacts: Optional[bool] = None):
         self.start_time = None
-        self.phase_times = {}
+        self.phase_times = {}  # phase name -> duration in seconds
+        self._phase_starts = {}
         self.pipeline_stats = {
             'total_urls_collected': 0,
             'total_jobs_scraped': 0,
@@ -93,6 +154,11 @@ class FullPipeline:
         self.enable_sessions = enable_sessions and FILE_MANAGER_AVAILABLE
         self.enable_validation = VALIDATION_SETTINGS.get('validate_on_scrape', True)
         
+        # Run choices from CLI flags (None = ask interactively)
+        self.reuse_existing_urls = reuse_existing_urls
+        self.resume = resume
+        self.enhance_contacts = enhance_contacts
+        
         # Configuration
         self.arbeitsagentur_url = "https://www.arbeitsagentur.de/jobsuche/suche?angebotsart=4&ausbildungsart=0&arbeitszeit=vz&branche=22;1;2;9;3;5;7;10;11;16;12;21;26;15;17;19;20;8;23;29&veroeffentlichtseit=7&sort=veroeffdatum"
         
@@ -101,11 +167,37 @@ class FullPipeline:
         self.input_dir = Path(PATHS.get('input_dir', self.data_dir / 'input'))
         self.output_dir = Path(PATHS.get('output_dir', self.data_dir / 'output'))
         self.logs_dir = Path(PATHS.get('logs_dir', self.data_dir / 'logs'))
+        self.temp_dir = Path(PATHS.get('temp_dir', self.data_dir / 'temp'))
         
         # Ensure directories exist
         for dir_path in [self.input_dir, self.output_dir, self.logs_dir]:
             dir_path.mkdir(parents=True, exist_ok=True)
         
+        # One navigation cap shared by the Phase 2 and Phase 3 scrapers
+        self.request_sem = asyncio.Semaphore(SCRAPER_SETTINGS.get('max_concurrent_requests', 20))
+        # Phases 1 and 2 both hit arbeitsagentur.de; one token bucket keeps the CAPTCHA rate down
+        self.arbeitsagentur_rl = RateLimiter(requests_per_second=SCRAPER_SETTINGS.get('requests_per_second', 3))
+        # Job URLs scraped (or 404) within this many days are skipped in Phase 2
+        self.url_cache_ttl_days = SCRAPER_SETTINGS.get('url_cache_ttl_days', 7)
+        
+        # Browser options for the shared Playwright instance
+        self.headless = SCRAPER_SETTINGS.get('headless', False)
+        self.browser_args = BROWSER_SETTINGS.get('args', ('--disable-blink-features=AutomationControlled',))
+        
+        # TrOCR inference holds the GIL, so CAPTCHAs are solved in worker processes.
+        # Workers start on first use; spawn avoids forking a process with torch and threads loaded
+        self._cpu_pool = ProcessPoolExecutor(
+            max_workers=CAPTCHA_SETTINGS.get('trocr_workers') or max(1, (os.cpu_count() or 2) // 2),
+            mp_context=multiprocessing.get_context('spawn')
+        )
+        
+        # Phase 2 scraper prepared alongside Phase 1; one browser context shared by all phases
+        self._job_scraper = None
+        self._existing_jobs = []
+        self._browser_task = None
+        self._playwright = None
+        self._browser = None
+        
         # Initialize enhanced components
         self.file_manager = None
         self.data_loader = None
@@ -135,65 +227,77 @@ class FullPipeline:
         logger.info(f"  - Data validation: {self.enable_validation}")
         logger.info(f"  - Session ID: {self.session_id}")
     
-    def log_phase_start(self, phase_name: str, description: str):
-        """Log the start of a pipeline phase"""
+    @asynccontextmanager
+    async def _phase(self, phase_name: str, description: str):
+        """Log the start of a pipeline phase and record its duration (monotonic) on exit"""
         logger.info("=" * 80)
-        logger.info(f"STARTING {phase_name}")
-        logger.info(f"Description: {description}")
+        logger.info("STARTING %s", phase_name)
+        logger.info("Description: %s", description)
         logger.info("=" * 80)
-        self.phase_times[phase_name] = time.time()
+        self._phase_starts[phase_name] = time.monotonic()
+        try:
+            yield
+        finally:
+            self.phase_times[phase_name] = time.monotonic() - self._phase_starts.pop(phase_name)
     
     def log_phase_end(self, phase_name: str):
-        """Log the end of a pipeline phase"""
-        if phase_name in self.phase_times:
-            duration = time.time() - self.phase_times[phase_name]
-            logger.info(f"SUCCESS: {phase_name} completed in {duration:.2f} seconds")
+        """Log the successful end of a pipeline phase"""
+        if phase_name in self._phase_starts:
+            duration = time.monotonic() - self._phase_starts[phase_name]
+            logger.info("SUCCESS: %s completed in %.2f seconds", phase_name, duration)
             logger.info("-" * 80)
     
+    async def ask_yes_no(self, choice: Optional[bool], prompt: str) -> bool:
+        """Return the CLI choice, or prompt in a worker thread so the event loop keeps running"""
+        if choice is not None:
+            return choice
+        answer = await asyncio.to_thread(input, prompt)
+        return answer.strip().lower() == 'y'
+    
     async def phase_1_link_collection(self) -> bool:
         """Phase 1: Collect all job URLs using link_job.py"""
-        self.log_phase_start("PHASE 1: LINK COLLECTION", 
-                           "Scraping job URLs from arbeitsagentur.de")
-        
-        try:
-            # Initialize link scraper
-            link_scraper = JobURLScraper(self.arbeitsagentur_url)
-            
-            # Check if we already have URLs
-            existing_df = link_scraper.load_job_urls_from_csv()
-            
-            if existing_df is not None and len(existing_df) > 0:
-                logger.info(f"Found existing {len(existing_df)} job URLs")
-                user_choice = input(f"Found {len(existing_df)} existing URLs. Use them? (y/n): ")
+        async with self._phase("PHASE 1: LINK COLLECTION",
+                               "Scraping job URLs from arbeitsagentur.de"):
+            try:
+                # Initialize link scraper
+                link_scraper = JobURLScraper(self.arbeitsagentur_url, rate_limiter=self.arbeitsagentur_rl,
+                                             context=await self._get_context())
+            
+                # Check if we already have URLs (only the URL set is needed, not a DataFrame)
+                existing_urls = await asyncio.to_thread(link_scraper.load_existing_url_set)
+            
+                if existing_urls:
+                    logger.info(f"Found existing {len(existing_urls)} job URLs")
+                    use_existing = await self.ask_yes_no(
+                        self.reuse_existing_urls,
+                        f"Found {len(existing_urls)} existing URLs. Use them? (y/n): "
+                    )
                 
-                if user_choice.lower() == 'y':
-                    logger.info("Using existing job URLs")
+                    if use_existing:
+                        logger.info("Using existing job URLs")
+                        self.log_phase_end("PHASE 1: LINK COLLECTION")
+                        return True
+                    else:
+                        logger.info("Re-scraping job URLs...")
+            
+                # Run link scraping
+                logger.info("Starting job URL collection...")
+                df = await link_scraper.run_scraping(existing_urls=existing_urls)
+            
+                if df is not None and len(df) > 0:
+                    logger.info(f"Successfully collected {len(df)} job URLs")
                     self.log_phase_end("PHASE 1: LINK COLLECTION")
                     return True
                 else:
-                    logger.info("Re-scraping job URLs...")
-            
-            # Run link scraping
-            logger.info("Starting job URL collection...")
-            df = link_scraper.run_scraping()
-            
-            if df is not None and len(df) > 0:
-                logger.info(f"Successfully collected {len(df)} job URLs")
-                self.log_phase_end("PHASE 1: LINK COLLECTION")
-                return True
-            else:
-                logger.error("Failed to collect job URLs")
-                return False
+                    logger.error("Failed to collect job URLs")
+                    return False
                 
-        except Exception as e:
-            logger.error(f"Error in Phase 1: {e}")
-            return False
+            except Exception as e:
+                logger.error(f"Error in Phase 1: {e}")
+                return False
     
-    async def phase_2_job_scraping(self) -> bool:
-        """Phase 2: Enhanced job scraping with database integration and session management"""
-        self.log_phase_start("PHASE 2: JOB SCRAPING", 
-                           "Enhanced job extraction with database integration")
-        
+    async def _prepare_phase_2(self) -> bool:
+        """Phase 2 setup that does not depend on Phase 1 output (DB, scraper, progress)"""
         try:
             # Initialize database connection if enabled
             if self.enable_database:
@@ -205,148 +309,228 @@ class FullPipeline:
                 else:
                     logger.info("[SUCCESS] Database connection established")
             
-            # Check if job URLs exist
-            job_urls_path = self.input_dir / "job_urls.csv"
-            if not job_urls_path.exists():
-                logger.error("job_urls.csv not found. Run Phase 1 first.")
-                return False
-            
-            # Initialize enhanced job scraper
-            job_scraper = JobScraper(
+            # Initialize enhanced job scraper (CAPTCHA model load is blocking, keep it off the loop)
+            self._job_scraper = await asyncio.to_thread(
+                JobScraper,
                 auto_solve_captcha=True,
                 use_sessions=self.enable_sessions,
-                validate_data=self.enable_validation
+                validate_data=self.enable_validation,
+                request_sem=self.request_sem,
+                rate_limiter=self.arbeitsagentur_rl,
+                context=await self._get_context(),
+                cpu_pool=self._cpu_pool
             )
             
             # Check existing progress
-            existing_jobs = await job_scraper.load_existing_progress()
-            if existing_jobs:
-                logger.info(f"Found {len(existing_jobs)} previously scraped jobs")
-                resume_choice = input("Resume from existing progress? (y/n): ")
-                resume = resume_choice.lower() == 'y'
-            else:
-                resume = False
-            
-            # Enhanced job scraping
-            logger.info("Starting enhanced job scraping...")
-            logger.info(f"Features: Database={self.enable_database}, Sessions={self.enable_sessions}, Validation={self.enable_validation}")
-            logger.info("First job may require CAPTCHA solving, others should be fast")
-            
-            await job_scraper.run(
-                input_csv_path=str(job_urls_path),
-                resume=resume,
-                auto_solve_captcha=True
-            )
-            
-            # Get enhanced statistics
-            scraper_stats = job_scraper.get_scraping_statistics()
-            self.pipeline_stats['total_jobs_scraped'] = scraper_stats['scraping_performance']['total_processed']
-            self.pipeline_stats['captcha_encounters'] = scraper_stats['captcha_performance']['encounters']
-            self.pipeline_stats['validation_errors'] = scraper_stats['scraping_performance']['validation_failures']
-            
-            # Database integration: Load scraped data into database
-            if self.enable_database and self.data_loader:
-                logger.info("Loading scraped data into database...")
-                scraped_jobs_path = self.output_dir / "scraped_jobs.json"
-                
-                if scraped_jobs_path.exists():
-                    with open(scraped_jobs_path, 'r', encoding='utf-8') as f:
-                        jobs_data = json.load(f)
-                    
-                    inserted_count = await self.data_loader.load_jobs_batch(jobs_data)
-                    self.pipeline_stats['database_insertions'] = inserted_count
-                    logger.info(f"[SUCCESS] Inserted {inserted_count} jobs into database")
-                else:
-                    logger.warning("No scraped jobs file found for database loading")
-            
-            logger.info("Enhanced job scraping completed")
-            self.log_phase_end("PHASE 2: JOB SCRAPING")
+            self._existing_jobs = await self._job_scraper.load_existing_progress()
             return True
             
         except Exception as e:
-            logger.error(f"Error in Phase 2: {e}")
+            logger.error(f"Error preparing Phase 2: {e}")
             return False
-        finally:
-            # Close database connection
-            if self.enable_database:
-                await close_database()
     
-    async def phase_3_contact_enhancement(self) -> bool:
-        """Phase 3: Enhance missing contacts using contact_scraper.py"""
-        self.log_phase_start("PHASE 3: CONTACT ENHANCEMENT", 
-                           "Deep mining for missing contact information")
-        
+    async def phase_2_job_scraping(self) -> bool:
+        """Phase 2: Enhanced job scraping with database integration and session management"""
         try:
-            # Check if missing emails report exists
-            missing_emails_path = self.output_dir / "missing_emails.json"
-            if not missing_emails_path.exists():
-                logger.warning("missing_emails.json not found")
-                logger.info("This means all jobs have contact info or Phase 2 wasn't completed")
-                self.log_phase_end("PHASE 3: CONTACT ENHANCEMENT")
-                return True
-            
-            # Load missing emails data
-            import json
-            with open(missing_emails_path, 'r', encoding='utf-8') as f:
-                missing_jobs = json.load(f)
+            if not await self._prepare_phase_2():
+                return False
+            return await self._execute_phase_2()
+        finally:
+            await self._close_database()
+    
+    async def _execute_phase_2(self) -> bool:
+        """Run Phase 2 scraping using the scraper prepared by _prepare_phase_2"""
+        async with self._phase("PHASE 2: JOB SCRAPING",
+                               "Enhanced job extraction with database integration"):
+            try:
+                # Check if job URLs exist
+                job_urls_path = self.input_dir / "job_urls.csv"
+                if not job_urls_path.exists():
+                    logger.error("job_urls.csv not found. Run Phase 1 first.")
+                    return False
+            
+                job_scraper = self._job_scraper
+                existing_jobs = self._existing_jobs
+                if existing_jobs:
+                    logger.info(f"Found {len(existing_jobs)} previously scraped jobs")
+                    resume = await self.ask_yes_no(self.resume, "Resume from existing progress? (y/n): ")
+                else:
+                    resume = False
+            
+                # Enhanced job scraping
+                logger.info("Starting enhanced job scraping...")
+                logger.info(f"Features: Database={self.enable_database}, Sessions={self.enable_sessions}, Validation={self.enable_validation}")
+                logger.info("First job may require CAPTCHA solving, others should be fast")
+            
+                # Skip URLs already scraped (or known 404) within the cache TTL.
+                # Without resume the output is rebuilt from scratch, so only 404s are skipped.
+                url_cache = URLStatusCache()
+                try:
+                    scraped_urls = {job.get('source_url') for job in existing_jobs} if resume else None
+                    pending_csv_path = await asyncio.to_thread(
+                        write_pending_job_urls, url_cache, job_urls_path,
+                        self.temp_dir / "pending_job_urls.csv",
+                        self.url_cache_ttl_days, scraped_urls
+                    )
+                
+                    await job_scraper.run(
+                        input_csv_path=str(pending_csv_path),
+                        resume=resume,
+                        auto_solve_captcha=True
+                    )
+                
+                    url_cache.mark_many({
+                        job['source_url']: classify_scraped_job(job)
+                        for job in job_scraper.last_scraped_jobs if job.get('source_url')
+                    })
+                finally:
+                    url_cache.close()
+            
+                # Get enhanced statistics
+                scraper_stats = job_scraper.get_scraping_statistics()
+                self.pipeline_stats['total_jobs_scraped'] = scraper_stats['scraping_performance']['total_processed']
+                self.pipeline_stats['captcha_encounters'] = scraper_stats['captcha_performance']['encounters']
+                self.pipeline_stats['validation_errors'] = scraper_stats['scraping_performance']['validation_failures']
+            
+                # Database integration: Load scraped data into database
+                if self.enable_database and self.data_loader:
+                    logger.info("Loading scraped data into database...")
+                    scraped_jobs_path = self.output_dir / "scraped_jobs.json"
+                
+                    if scraped_jobs_path.exists():
+                        # Stream the file so parsing overlaps insertion and progress survives interrupts
+                        self.pipeline_stats['database_insertions'] = 0
+                        with open(scraped_jobs_path, 'rb') as f:
+                            jobs = ijson.items(f, 'item', use_float=True) if IJSON_AVAILABLE else load_json_file(scraped_jobs_path)
+                            for batch in batched(jobs, DB_LOAD_BATCH_SIZE):
+                                self.pipeline_stats['database_insertions'] += await self.data_loader.load_jobs_batch(batch)
+                    
+                        inserted_count = self.pipeline_stats['database_insertions']
+                        logger.info(f"[SUCCESS] Inserted {inserted_count} jobs into database")
+                    else:
+                        logger.warning("No scraped jobs file found for database loading")
             
-            if not missing_jobs:
-                logger.info("No jobs with missing contacts found!")
-                self.log_phase_end("PHASE 3: CONTACT ENHANCEMENT")
+                logger.info("Enhanced job scraping completed")
+                self.log_phase_end("PHASE 2: JOB SCRAPING")
                 return True
             
-            logger.info(f"Found {len(missing_jobs)} jobs with missing contact info")
+            except Exception as e:
+                logger.error(f"Error in Phase 2: {e}")
+                return False
+    
+    async def phase_3_contact_enhancement(self) -> bool:
+        """Phase 3: Enhance missing contacts using contact_scraper.py"""
+        async with self._phase("PHASE 3: CONTACT ENHANCEMENT",
+                               "Deep mining for missing contact information"):
+            try:
+                # Check if missing emails report exists
+                missing_emails_path = self.output_dir / "missing_emails.json"
+                if not missing_emails_path.exists():
+                    logger.warning("missing_emails.json not found")
+                    logger.info("This means all jobs have contact info or Phase 2 wasn't completed")
+                    self.log_phase_end("PHASE 3: CONTACT ENHANCEMENT")
+                    return True
             
-            # Ask user if they want to proceed with enhancement
-            enhance_choice = input(f"Enhance {len(missing_jobs)} jobs with missing contacts? (y/n): ")
-            if enhance_choice.lower() != 'y':
-                logger.info("Skipping contact enhancement")
-                self.log_phase_end("PHASE 3: CONTACT ENHANCEMENT")
-                return True
+                # Load missing emails data
+                missing_jobs = await asyncio.to_thread(load_json_file, missing_emails_path)
             
-            # Initialize contact scraper
-            from playwright.async_api import async_playwright
+                if not missing_jobs:
+                    logger.info("No jobs with missing contacts found!")
+                    self.log_phase_end("PHASE 3: CONTACT ENHANCEMENT")
+                    return True
             
-            playwright = await async_playwright().start()
-            browser = await playwright.chromium.launch(headless=SCRAPER_SETTINGS.get('headless', True))
-            context = await browser.new_context()
+                logger.info(f"Found {len(missing_jobs)} jobs with missing contact info")
             
-            contact_scraper = ContactScraper(context=context)
+                # Ask user if they want to proceed with enhancement
+                enhance = await self.ask_yes_no(
+                    self.enhance_contacts,
+                    f"Enhance {len(missing_jobs)} jobs with missing contacts? (y/n): "
+                )
+                if not enhance:
+                    logger.info("Skipping contact enhancement")
+                    self.log_phase_end("PHASE 3: CONTACT ENHANCEMENT")
+                    return True
             
-            # Process missing contacts
-            logger.info("Starting deep contact mining...")
-            logger.info("This may take longer as we scrape company websites")
+                # Initialize contact scraper on the context Phase 2 already warmed up (cookies, connections)
+                contact_scraper = ContactScraper(context=await self._get_context(), request_sem=self.request_sem)
             
-            enhanced_jobs = await contact_scraper.process_missing_contacts(missing_jobs)
+                # Process missing contacts
+                logger.info("Starting deep contact mining...")
+                logger.info("This may take longer as we scrape company websites")
             
-            # Save enhanced results
-            enhanced_path = self.output_dir / "enhanced_contacts.json"
-            with open(enhanced_path, 'w', encoding='utf-8') as f:
-                json.dump(enhanced_jobs, f, ensure_ascii=False, indent=2)
+                enhanced_jobs = await contact_scraper.process_missing_contacts(missing_jobs)
             
-            # Generate summary report
-            original_missing = len([job for job in missing_jobs if not job.get('email')])
-            enhanced_found = len([job for job in enhanced_jobs if job.get('email')])
-            improvement = enhanced_found - (len(missing_jobs) - original_missing)
+                # Save enhanced results
+                enhanced_path = self.output_dir / "enhanced_contacts.json"
+                await asyncio.to_thread(dump_json_file, enhanced_path, enhanced_jobs)
             
-            logger.info(f"Contact Enhancement Results:")
-            logger.info(f"   Jobs processed: {len(enhanced_jobs)}")
-            logger.info(f"   Additional contacts found: {improvement}")
-            logger.info(f"   Success rate: {(improvement/original_missing)*100:.1f}%")
+                # Generate summary report
+                # enhanced_jobs is missing_jobs in the same order, so one zipped pass counts both
+                original_missing = enhanced_found = 0
+                for missing_job, enhanced_job in zip(missing_jobs, enhanced_jobs):
+                    original_missing += not missing_job.get('email')
+                    enhanced_found += bool(enhanced_job.get('email'))
+                improvement = enhanced_found - (len(missing_jobs) - original_missing)
             
-            await browser.close()
+                logger.info(f"Contact Enhancement Results:")
+                logger.info(f"   Jobs processed: {len(enhanced_jobs)}")
+                logger.info(f"   Additional contacts found: {improvement}")
+                if original_missing:
+                    logger.info(f"   Success rate: {(improvement/original_missing)*100:.1f}%")
             
-            logger.info("Contact enhancement completed")
-            self.log_phase_end("PHASE 3: CONTACT ENHANCEMENT")
-            return True
+                logger.info("Contact enhancement completed")
+                self.log_phase_end("PHASE 3: CONTACT ENHANCEMENT")
+                return True
             
-        except Exception as e:
-            logger.error(f"Error in Phase 3: {e}")
-            return False
+            except Exception as e:
+                logger.error(f"Error in Phase 3: {e}")
+                return False
+    
+    async def _get_context(self):
+        """Return the browser context shared by all phases, launching it on first use"""
+        if self._browser_task is None:
+            self._browser_task = asyncio.create_task(self._launch_browser())
+        return await self._browser_task
+    
+    async def _launch_browser(self):
+        """Start Playwright and create the shared browser context"""
+        from playwright.async_api import async_playwright
+        
+        self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch(
+            headless=self.headless,
+            args=self.browser_args
+        )
+        return await self._browser.new_context(**build_context_settings())
+    
+    async def _close_browser(self):
+        """Tear down the shared browser, including one still launching in the background"""
+        if self._browser_task is not None and not self._browser_task.done():
+            self._browser_task.cancel()
+            try:
+                await self._browser_task
+            except (asyncio.CancelledError, Exception):
+                pass
+        if self._browser:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
+        self._browser_task = None
+    
+    async def _close_database(self):
+        """Close the database pool if this pipeline opened it"""
+        if self.enable_database:
+            await close_database()
     
     def generate_final_report(self):
         """Generate comprehensive final pipeline execution report"""
-        total_time = time.time() - self.start_time
+        # Everything below is INFO output; skip the directory scan and formatting when filtered
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        
+        total_time = time.monotonic() - self.start_time
         
         logger.info("=" * 80)
         logger.info("🎯 ENHANCED FULL PIPELINE COMPLETED!")
@@ -365,8 +549,8 @@ class FullPipeline:
         
         # Phase timing breakdown
         logger.info("\n[TIME]  PHASE TIMING BREAKDOWN:")
-        for phase, start_time in self.phase_times.items():
-            logger.info(f"   {phase}")
+        for phase, duration in self.phase_times.items():
+            logger.info("   %s: %.2f seconds", phase, duration)
         
         # Enhanced features status
         logger.info("\n🚀 ENHANCED FEATURES STATUS:")
@@ -377,19 +561,27 @@ class FullPipeline:
             logger.info(f"   🔑 Session ID: {self.session_id}")
         
         # Output files summary
-        output_files = list(self.output_dir.glob("*.csv")) + list(self.output_dir.glob("*.json"))
+        # Single directory pass; DirEntry caches the stat result from the scan
+        output_files = []
+        if self.output_dir.is_dir():
+            with os.scandir(self.output_dir) as it:
+                output_files = sorted(
+                    ((e.name, e.stat().st_size) for e in it
+                     if e.is_file() and e.name.endswith(('.csv', '.json'))),
+                    key=lambda entry: (entry[0].endswith('.json'), entry[0])
+                )
         logger.info(f"\n📁 OUTPUT FILES GENERATED: {len(output_files)}")
-        for file_path in output_files:
-            file_size = file_path.stat().st_size / (1024*1024)  # MB
-            logger.info(f"   📄 {file_path.name} ({file_size:.2f} MB)")
+        for file_name, size_bytes in output_files:
+            file_size = size_bytes / (1024*1024)  # MB
+            logger.info(f"   📄 {file_name} ({file_size:.2f} MB)")
         
         # Session files if enabled
         if self.enable_sessions and self.file_manager:
             try:
                 file_stats = self.file_manager.get_statistics()
                 logger.info(f"\n📂 SESSION FILES:")
-                logger.info(f"   📁 Session directory: {file_stats.get('session_directory', 'N/A')}")
-                logger.info(f"   📄 Total files created: {file_stats.get('total_files_created', 0)}")
+                logger.info(f"   📁 Session directory: {file_stats.get('session_dir', 'N/A')}")
+                logger.info(f"   📄 Total files created: {len(file_stats.get('files', []))}")
             except Exception as e:
                 logger.debug(f"Could not get session file statistics: {e}")
         
@@ -415,30 +607,44 @@ class FullPipeline:
     
     async def run(self):
         """Execute the full 1-2-1 pipeline"""
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         
         logger.info("Starting Full Job Scraping Pipeline (1-2-1)")
         logger.info("Pipeline: Link Collection -> Job Scraping -> Contact Enhancement")
         
         try:
-            # Phase 1: Link Collection
-            if not await self.phase_1_link_collection():
-                logger.error("Pipeline failed at Phase 1")
-                return False
-            
-            # Phase 2: Job Scraping  
-            if not await self.phase_2_job_scraping():
-                logger.error("Pipeline failed at Phase 2")
-                return False
-            
-            # Phase 3: Contact Enhancement
-            if not await self.phase_3_contact_enhancement():
-                logger.error("Pipeline failed at Phase 3")
-                return False
-            
-            # Generate final report
-            self.generate_final_report()
-            return True
+            # Every exit path (failure, exception, cancellation) tears down here, in reverse order
+            async with AsyncExitStack() as stack:
+                stack.callback(self._cpu_pool.shutdown, wait=False, cancel_futures=True)
+                stack.push_async_callback(self._close_browser)
+                stack.push_async_callback(self._close_database)
+                
+                # Start the shared browser right away; Phase 1 and the Phase 2 setup both wait on it
+                self._browser_task = asyncio.create_task(self._launch_browser())
+                
+                # Phase 1: Link Collection, overlapped with Phase 2 setup (DB, scraper, progress).
+                # If either task raises, the TaskGroup cancels the other before propagating
+                async with asyncio.TaskGroup() as tg:
+                    phase_1_task = tg.create_task(self.phase_1_link_collection())
+                    phase_2_prep_task = tg.create_task(self._prepare_phase_2())
+                
+                if not phase_1_task.result():
+                    logger.error("Pipeline failed at Phase 1")
+                    return False
+                
+                # Phase 2: Job Scraping  
+                if not phase_2_prep_task.result() or not await self._execute_phase_2():
+                    logger.error("Pipeline failed at Phase 2")
+                    return False
+                
+                # Phase 3: Contact Enhancement
+                if not await self.phase_3_contact_enhancement():
+                    logger.error("Pipeline failed at Phase 3")
+                    return False
+                
+                # Generate final report
+                self.generate_final_report()
+                return True
             
         except KeyboardInterrupt:
             logger.info("Pipeline interrupted by user")
@@ -447,8 +653,25 @@ class FullPipeline:
             logger.error(f"Unexpected error in pipeline: {e}")
             return False
 
-async def main():
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse pipeline CLI flags; omitted choices fall back to interactive prompts"""
+    parser = argparse.ArgumentParser(description="Run the full 1-2-1 job scraping pipeline")
+    parser.add_argument('--reuse-existing-urls', action=argparse.BooleanOptionalAction, default=None,
+                        help="Reuse job_urls.csv from a previous run instead of re-scraping")
+    parser.add_argument('--resume', action=argparse.BooleanOptionalAction, default=None,
+                        help="Resume job scraping from existing progress")
+    enhance_group = parser.add_mutually_exclusive_group()
+    enhance_group.add_argument('--enhance-contacts', action='store_true',
+                               help="Run contact enhancement without asking")
+    enhance_group.add_argument('--skip-enhance', action='store_true',
+                               help="Skip the contact enhancement phase")
+    return parser.parse_args(argv)
+
+async def main(argv=None):
     """Enhanced main entry point with configuration options"""
+    args = parse_args(argv)
+    enhance_contacts = False if args.skip_enhance else (True if args.enhance_contacts else None)
+    
     # Configuration options
     enable_database = DATABASE_AVAILABLE and DATABASE_SETTINGS.get('enable_logging', True)
     enable_sessions = FILE_MANAGER_AVAILABLE and FILE_MANAGEMENT_SETTINGS.get('use_sessions', True)
@@ -458,7 +681,10 @@ async def main():
     
     pipeline = FullPipeline(
         enable_database=enable_database,
-        enable_sessions=enable_sessions
+        enable_sessions=enable_sessions,
+        reuse_existing_urls=args.reuse_existing_urls,
+        resume=args.resume,
+        enhance_contacts=enhance_contacts
     )
     
     success = await pipeline.run()
@@ -471,5 +697,11 @@ async def main():
         return 1
 
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
+    init_runtime()
+    if UVLOOP_AVAILABLE:
+        uvloop.install()
+    try:
+        exit_code = asyncio.run(main())
+    finally:
+        log_listener.stop()
     sys.exit(exit_code)
\ No newline at end of file
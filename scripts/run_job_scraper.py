@@ -11,23 +11,29 @@ import logging
 from pathlib import Path
 from datetime import datetime
 
-# Add config path and import centralized settings
-project_root = Path(__file__).parent.parent
-sys.path.append(str(project_root / "src" / "config"))
+# Put src/ (package imports) and src/config (the bare `settings` module the
+# scrapers use) on the path once, so settings is only ever imported under one name
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+for _path in (SRC_DIR, SRC_DIR / "config"):
+    if str(_path) not in sys.path:
+        sys.path.append(str(_path))
 
 try:
-    from settings import PATHS
+    from settings import PATHS, init_runtime
 except ImportError as e:
     raise ImportError(
         f"[ERROR] Settings import failed: {e}\n"
         "Please ensure src/config/settings.py exists and contains required settings."
     )
 
-# Add src to Python path
-sys.path.append(str(project_root / "src"))
-
 from scrapers.job_scraper import JobScraper
 
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -126,5 +132,8 @@ async def main():
         return False
 
 if __name__ == "__main__":
+    init_runtime()
+    if UVLOOP_AVAILABLE:
+        uvloop.install()
     success = asyncio.run(main())
     sys.exit(0 if success else 1)
\ No newline at end of file
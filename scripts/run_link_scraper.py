@@ -5,28 +5,35 @@ Standalone script for collecting job URLs from arbeitsagentur.de
 Can be run independently or as part of full pipeline
 """
 
+import asyncio
 import sys
 import logging
 from pathlib import Path
 from datetime import datetime
 
-# Add config path and import centralized settings
-project_root = Path(__file__).parent.parent
-sys.path.append(str(project_root / "src" / "config"))
+# Put src/ (package imports) and src/config (the bare `settings` module the
+# scrapers use) on the path once, so settings is only ever imported under one name
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+for _path in (SRC_DIR, SRC_DIR / "config"):
+    if str(_path) not in sys.path:
+        sys.path.append(str(_path))
 
 try:
-    from settings import PATHS
+    from settings import PATHS, init_runtime
 except ImportError as e:
     raise ImportError(
         f"[ERROR] Settings import failed: {e}\n"
         "Please ensure src/config/settings.py exists and contains required settings."
     )
 
-# Add src to Python path
-sys.path.append(str(project_root / "src"))
-
 from scrapers.link_job import JobURLScraper
 
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -34,7 +41,7 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def main():
+async def main():
     """Main function for Phase 1: Link Collection"""
     logger.info("=� PHASE 1: JOB URL COLLECTION")
     logger.info("=" * 50)
@@ -58,13 +65,13 @@ def main():
                 return True
             elif choice == 'i':
                 logger.info("= Running incremental scrape...")
-                df = scraper.incremental_scrape()
+                df = await scraper.incremental_scrape()
             else:
                 logger.info("= Running full re-scrape...")
-                df = scraper.run_scraping()
+                df = await scraper.run_scraping()
         else:
             logger.info("=w No existing data found, starting fresh scrape...")
-            df = scraper.run_scraping()
+            df = await scraper.run_scraping()
         
         # Verify results
         if df is not None and len(df) > 0:
@@ -85,5 +92,8 @@ def main():
         return False
 
 if __name__ == "__main__":
-    success = main()
+    init_runtime()
+    if UVLOOP_AVAILABLE:
+        uvloop.install()
+    success = asyncio.run(main())
     sys.exit(0 if success else 1)
\ No newline at end of file
@@ -4,22 +4,30 @@ Scheduled Job Scraper for Vietnam Timezone
 Runs the scraper at 2 AM Vietnam time when job websites open back up
 """
 
+import asyncio
 import os
 import sys
 import time
-import schedule
 import subprocess
+import threading
 import logging
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 
-# Setup logging
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+LOGS_DIR = PROJECT_ROOT / 'data' / 'logs'
+
+sys.path.append(str(PROJECT_ROOT / "src" / "config"))
+from settings import init_runtime
+
+# Setup logging (the log directory must exist before the FileHandler opens)
+LOGS_DIR.mkdir(parents=True, exist_ok=True)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
         logging.StreamHandler(sys.stdout),
-        logging.FileHandler(Path(__file__).parent.parent / 'data' / 'logs' / 'scheduler.log')
+        logging.FileHandler(LOGS_DIR / 'scheduler.log')
     ]
 )
 logger = logging.getLogger(__name__)
@@ -27,9 +35,26 @@ logger = logging.getLogger(__name__)
 # Vietnam timezone (UTC+7)
 VIETNAM_TZ = timezone(timedelta(hours=7))
 
+# Timestamp format for log lines (the zone is spelled out as "(Vietnam time)")
+DT_FMT = '%Y-%m-%d %H:%M:%S'
+
+# Daily run time (Vietnam time)
+RUN_HOUR = 2
+
+# Container readiness probe: the app container must accept exec and reach the database
+READY_PROBE = [
+    "docker-compose", "exec", "-T", "job-scraper", "python", "-c",
+    "import socket; socket.create_connection(('postgres', 5432), timeout=2).close()"
+]
+READY_TIMEOUT = 60      # seconds
+READY_POLL_INTERVAL = 0.5
+
+# Hard limit for one automated pipeline run
+PIPELINE_TIMEOUT = 7200  # 2 hours
+
 class JobScraperScheduler:
     def __init__(self):
-        self.project_root = Path(__file__).parent.parent
+        self.project_root = PROJECT_ROOT
         self.docker_compose_file = self.project_root / "docker-compose.yml"
         
     def get_vietnam_time(self):
@@ -39,7 +64,7 @@ class JobScraperScheduler:
     def run_scraper_job(self):
         """Execute the job scraping pipeline"""
         vietnam_time = self.get_vietnam_time()
-        logger.info(f"🚀 Starting scheduled job scrape at {vietnam_time.strftime('%Y-%m-%d %H:%M:%S')} (Vietnam time)")
+        logger.info(f"🚀 Starting scheduled job scrape at {vietnam_time.strftime(DT_FMT)} (Vietnam time)")
         
         try:
             # Change to project directory
@@ -59,78 +84,114 @@ class JobScraperScheduler:
             )
             logger.info("✅ Docker containers started successfully")
             
-            # Wait a bit for containers to fully start
-            time.sleep(30)
+            # Wait until the containers are actually ready
+            self.wait_for_containers()
             
             # Run the automated pipeline
             logger.info("🔄 Executing automated scraping pipeline...")
-            result = subprocess.run(
+            self.run_streaming(
                 ["docker-compose", "exec", "-T", "job-scraper", "python", "scripts/run_automated_pipeline.py"],
-                check=True,
-                capture_output=True,
-                text=True,
-                timeout=7200  # 2 hours timeout
+                timeout=PIPELINE_TIMEOUT
             )
             
             logger.info("🎉 Scraping pipeline completed successfully!")
-            logger.info(f"Pipeline output: {result.stdout}")
             
         except subprocess.TimeoutExpired:
             logger.error("⏰ Scraping pipeline timed out after 2 hours")
         except subprocess.CalledProcessError as e:
+            # Output was already forwarded line by line
             logger.error(f"❌ Pipeline execution failed: {e}")
-            logger.error(f"Error output: {e.stderr}")
         except Exception as e:
             logger.error(f"💥 Unexpected error during scraping: {e}")
         
         finally:
             # Log completion
             vietnam_time_end = self.get_vietnam_time()
-            logger.info(f"📊 Scraping session ended at {vietnam_time_end.strftime('%Y-%m-%d %H:%M:%S')} (Vietnam time)")
+            logger.info(f"📊 Scraping session ended at {vietnam_time_end.strftime(DT_FMT)} (Vietnam time)")
+    
+    def wait_for_containers(self):
+        """Poll READY_PROBE until it succeeds; raise if READY_TIMEOUT passes first"""
+        deadline = time.monotonic() + READY_TIMEOUT
+        while time.monotonic() < deadline:
+            probe = subprocess.run(READY_PROBE, capture_output=True)
+            if probe.returncode == 0:
+                logger.info("✅ Containers ready")
+                return
+            time.sleep(READY_POLL_INTERVAL)
+        raise RuntimeError(f"Containers not ready after {READY_TIMEOUT}s")
+    
+    def run_streaming(self, cmd, timeout):
+        """Run cmd, forwarding its combined output to the log as each line arrives"""
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1
+        )
+        # Reading blocks until the pipe closes, so the deadline is enforced by a timer
+        timer = threading.Timer(timeout, proc.kill)
+        timer.start()
+        try:
+            for line in proc.stdout:
+                logger.info(f"[PIPELINE] {line.rstrip()}")
+            proc.wait()
+        finally:
+            timed_out = not timer.is_alive()
+            timer.cancel()
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+            proc.stdout.close()
+        
+        if timed_out:
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, cmd)
     
     def start_scheduler(self):
         """Start the scheduling system"""
         logger.info("🕐 Job Scraper Scheduler started")
         logger.info("⏰ Scheduled to run daily at 2:00 AM Vietnam time (UTC+7)")
         
-        # Schedule for 2 AM Vietnam time
-        schedule.every().day.at("02:00").do(self.run_scraper_job)
-        
         # Also allow immediate test run if script is called with 'test' argument
         if len(sys.argv) > 1 and sys.argv[1] == 'test':
             logger.info("🧪 Running test scrape immediately...")
             self.run_scraper_job()
             return
         
-        # Main scheduling loop
+        try:
+            asyncio.run(self.scheduler_loop())
+        except KeyboardInterrupt:
+            logger.info("🛑 Scheduler stopped by user")
+    
+    def next_run_time(self, now):
+        """Next RUN_HOUR:00 in Vietnam time after now"""
+        target = now.replace(hour=RUN_HOUR, minute=0, second=0, microsecond=0)
+        if target <= now:
+            target += timedelta(days=1)
+        return target
+    
+    async def scheduler_loop(self):
+        """Sleep until the next run, execute it off the event loop, repeat"""
+        loop = asyncio.get_running_loop()
         while True:
             try:
-                schedule.run_pending()
-                current_time = self.get_vietnam_time()
-                
-                # Log status every hour
-                if current_time.minute == 0:
-                    next_run = schedule.next_run()
-                    if next_run:
-                        logger.info(f"⏳ Next scheduled run: {next_run.strftime('%Y-%m-%d %H:%M:%S')}")
+                now = self.get_vietnam_time()
+                target = self.next_run_time(now)
+                logger.info(f"⏳ Next scheduled run: {target.strftime(DT_FMT)} (Vietnam time)")
+                await asyncio.sleep((target - now).total_seconds())
+                await loop.run_in_executor(None, self.run_scraper_job)
                 
-                time.sleep(60)  # Check every minute
-                
-            except KeyboardInterrupt:
-                logger.info("🛑 Scheduler stopped by user")
-                break
             except Exception as e:
                 logger.error(f"💥 Scheduler error: {e}")
-                time.sleep(300)  # Wait 5 minutes before retrying
+                await asyncio.sleep(300)  # Wait 5 minutes before retrying
 
 def main():
     """Main function"""
+    init_runtime()
     scheduler = JobScraperScheduler()
     
-    # Ensure required directories exist
-    logs_dir = Path(__file__).parent.parent / 'data' / 'logs'
-    logs_dir.mkdir(parents=True, exist_ok=True)
-    
     try:
         scheduler.start_scheduler()
     except Exception as e:
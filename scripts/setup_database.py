@@ -4,7 +4,9 @@ Database setup script for Job Scraper
 Creates PostgreSQL database and tables with proper schema
 """
 
+import argparse
 import asyncio
+import re
 import sys
 import logging
 from pathlib import Path
@@ -12,35 +14,99 @@ from pathlib import Path
 # Add src directory to path
 project_root = Path(__file__).parent.parent
 sys.path.append(str(project_root / "src"))
+sys.path.append(str(project_root / "src" / "config"))
 
-async def setup_database():
-    """Set up the database with comprehensive schema"""
+from settings import init_runtime
+
+# Opening delimiters whose body may contain ';' mapped to their closing delimiter;
+# dollar quotes ($$ or $tag$) close with the same tag
+SQL_QUOTES = {"'": "'", '"': '"', '/*': '*/'}
+DOLLAR_TAG_RE = re.compile(r'\$(?:[A-Za-z_][A-Za-z_0-9]*)?\$')
+
+def iter_sql_statements(f):
+    """Yield statements from a SQL file, split on ';' outside literals, $tag$ bodies and comments"""
+    buffer = []
+    closing = None  # delimiter that ends the quoted section we are in
+    for line in f:
+        start = 0
+        i = 0
+        while i < len(line):
+            if closing:
+                end = line.find(closing, i)
+                if end < 0:
+                    break
+                # A doubled '' simply closes and reopens the literal
+                i = end + len(closing)
+                closing = None
+                continue
+            if line.startswith('--', i):
+                # Comment runs to end of line; keep the newline only
+                buffer.append(line[start:i])
+                start = len(line.rstrip('\n'))
+                break
+            opener = line[i:i + 2] if line.startswith('/*', i) else line[i]
+            if opener in SQL_QUOTES:
+                closing = SQL_QUOTES[opener]
+                i += len(opener)
+                continue
+            if opener == '$':
+                match = DOLLAR_TAG_RE.match(line, i)
+                if match:
+                    closing = match.group()
+                    i = match.end()
+                    continue
+            if opener == ';':
+                buffer.append(line[start:i])
+                statement = ''.join(buffer).strip()
+                if statement:
+                    yield statement
+                buffer = []
+                start = i + 1
+            i += 1
+        buffer.append(line[start:])
+    
+    statement = ''.join(buffer).strip()
+    if statement:
+        yield statement
+
+async def setup_database(dedupe_jobs: bool = False):
+    """Set up the database with comprehensive schema
+    
+    dedupe_jobs deletes all but the first-scraped job per ref_nr/content_hash before
+    the unique indexes are built; without it, duplicates stop the setup.
+    """
     try:
-        from database.connection import init_database, close_database, db_manager
+        from database.connection import init_database, close_database, db_manager, SCHEMA_LOCK_ID
+        from database.migrations import run_migrations
         
         print("Setting up job scraper database...")
         
         # Initialize connection
-        success = await init_database()
+        # Migrations run below, where --dedupe-jobs can be honoured
+        success = await init_database(upgrade_schema=False)
         if not success:
-            print("L Failed to connect to database")
+            print("[ERROR] Failed to connect to database")
             return False
         
-        print(" Connected to database")
+        print("Connected to database")
         
         # Create schema from SQL file
         schema_file = project_root / "src" / "database" / "schema.sql"
         if schema_file.exists():
-            print("= Loading schema from schema.sql...")
-            
-            with open(schema_file, 'r', encoding='utf-8') as f:
-                schema_sql = f.read()
+            print("Loading schema from schema.sql...")
             
-            # Execute schema
+            # Execute schema statement by statement in one transaction
             async with db_manager.get_transaction() as conn:
-                await conn.execute(schema_sql)
+                await conn.execute("SELECT pg_advisory_xact_lock($1)", SCHEMA_LOCK_ID)
+                # Upgrade existing tables first so schema.sql applies cleanly
+                migrated = await run_migrations(conn, dedupe_jobs=dedupe_jobs)
+                if migrated:
+                    print(f"Applied {migrated} data migration(s)")
+                with open(schema_file, 'r', encoding='utf-8') as f:
+                    for statement in iter_sql_statements(f):
+                        await conn.execute(statement)
             
-            print(" Database schema created successfully")
+            print("Database schema created successfully")
             
             # Verify tables
             tables_query = '''
@@ -51,12 +117,12 @@ async def setup_database():
             '''
             tables = await db_manager.execute_query(tables_query)
             
-            print(f"= Created {len(tables)} tables:")
+            print(f"Created {len(tables)} tables:")
             for table in tables:
                 print(f"   - {table['table_name']}")
             
         else:
-            print(" schema.sql not found, creating basic jobs table...")
+            print("[WARNING] schema.sql not found, creating basic jobs table...")
             
             # Fallback: create basic table
             basic_sql = """
@@ -77,20 +143,27 @@ async def setup_database():
             )
             """
             await db_manager.execute_command(basic_sql)
-            print(" Basic jobs table created")
+            print("Basic jobs table created")
         
         await close_database()
-        print("< Database setup completed successfully!")
+        print("Database setup completed successfully!")
         return True
         
     except Exception as e:
-        print(f"L Database setup failed: {e}")
+        print(f"[ERROR] Database setup failed: {e}")
         return False
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Create or upgrade the job scraper database")
+    parser.add_argument("--dedupe-jobs", action="store_true",
+                        help="Delete all but the first-scraped job per ref_nr/content_hash "
+                             "so the unique indexes can be built")
+    args = parser.parse_args()
+    
     # Set up logging
     logging.basicConfig(level=logging.INFO)
+    init_runtime()
     
     # Run setup
-    success = asyncio.run(setup_database())
+    success = asyncio.run(setup_database(dedupe_jobs=args.dedupe_jobs))
     sys.exit(0 if success else 1)
\ No newline at end of file
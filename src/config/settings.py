@@ -3,8 +3,12 @@ Configuration settings for the job scraper
 Comprehensive configuration for all components: scraping, database, validation, file management
 """
 
+import functools
+import logging
 import os
+from dataclasses import dataclass, field
 from pathlib import Path
+from types import MappingProxyType
 
 # =============================================================================
 # API Configurations
@@ -28,19 +32,22 @@ SCRAPER_SETTINGS = {
     'max_jobs_per_session': 1000,   # Large session capacity
     'enable_resume': True,          # Enable resume functionality
     'use_sessions': True,           # Use session-based file management
+    'max_concurrent_requests': 20,  # Cap on concurrent page navigations across scrapers
+    'requests_per_second': 3,       # Token-bucket rate limit against arbeitsagentur.de
+    'url_cache_ttl_days': 7,        # Re-check cached job URL statuses after this many days
 }
 
 # Browser Configuration
 BROWSER_SETTINGS = {
     'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
     'viewport': {'width': 1920, 'height': 1080},
-    'args': [
+    'args': (
         '--disable-blink-features=AutomationControlled',
         '--disable-web-security',
         '--disable-features=VizDisplayCompositor',
         '--no-sandbox',
-        '--disable-dev-shm-usage'
-    ],
+        '--disable-dev-shm-usage',
+    ),
     'download_behavior': 'allow',
     'timezone_id': 'Europe/Berlin',
     'locale': 'de-DE',
@@ -59,6 +66,7 @@ CAPTCHA_SETTINGS = {
     'trocr_model': 'anuashok/ocr-captcha-v3',
     'reload_captcha_between_attempts': True,
     'max_total_attempts': 20,       # Maximum total attempts across all strategies
+    'trocr_workers': None,          # TrOCR worker processes in the full pipeline (None = half the CPUs)
 }
 
 # =============================================================================
@@ -79,25 +87,43 @@ DATABASE_SETTINGS = {
     'enable_logging': True,
 }
 
+@dataclass(slots=True, frozen=True)
+class DatabaseConfig:
+    """Typed, immutable view of DATABASE_SETTINGS (see DB_CONFIG)"""
+    host: str = 'localhost'
+    port: int = 5432
+    database: str = 'job_market_data'
+    username: str = 'postgres'
+    password: str = field(default='working', repr=False)
+    min_connections: int = 5
+    max_connections: int = 20
+    connection_timeout: int = 60
+    command_timeout: int = 30
+    ssl_mode: str = 'prefer'
+    enable_logging: bool = True
+
 # =============================================================================
 # File Management Configuration
 # =============================================================================
 
 # Base paths
-BASE_DIR = Path(__file__).parent.parent.parent  # job-scraper root directory
+_dirname = os.path.dirname
+BASE_DIR = Path(_dirname(_dirname(_dirname(os.path.abspath(__file__)))))  # job-scraper root directory
 DATA_DIR = BASE_DIR / "data"
 
 PATHS = {
-    'base_dir': str(BASE_DIR),
-    'data_dir': str(DATA_DIR),
-    'input_dir': str(DATA_DIR / "input"),
-    'output_dir': str(DATA_DIR / "output"),
-    'logs_dir': str(DATA_DIR / "logs"),
-    'temp_dir': str(DATA_DIR / "temp"),
-    'backup_dir': str(DATA_DIR / "backup"),
+    'base_dir': BASE_DIR,
+    'data_dir': DATA_DIR,
+    'input_dir': DATA_DIR / "input",
+    'output_dir': DATA_DIR / "output",
+    'logs_dir': DATA_DIR / "logs",
+    'temp_dir': DATA_DIR / "temp",
+    'backup_dir': DATA_DIR / "backup",
+    'state_dir': DATA_DIR / "state",
+    'cache_dir': DATA_DIR / "cache",
     
-    # Specific files
-    'input_csv': str(DATA_DIR / "input" / "job_urls.csv"),
+    # Specific files (bare names are relative to the session directory)
+    'input_csv': DATA_DIR / "input" / "job_urls.csv",
     'progress_csv': 'scraped_jobs_progress.csv',
     'consolidated_json': 'scraped_jobs_consolidated.json',
     'missing_emails_json': 'missing_emails.json',
@@ -169,7 +195,7 @@ CONTACT_SCRAPER_SETTINGS = {
 # =============================================================================
 
 LOGGING_SETTINGS = {
-    'level': 'DEBUG',                        # DEBUG, INFO, WARNING, ERROR - Set to DEBUG for troubleshooting
+    'level': 'INFO',                         # DEBUG, INFO, WARNING, ERROR - Set to DEBUG for troubleshooting
     'format': '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     'date_format': '%Y-%m-%d %H:%M:%S',
     'enable_file_logging': True,
@@ -253,22 +279,40 @@ elif os.getenv('ENVIRONMENT') == 'development':
     PERFORMANCE_SETTINGS['enable_profiling'] = True
     TESTING_SETTINGS['enable_test_mode'] = True
 
+# Numeric logging values, parsed once after the environment overrides
+_SIZE_UNITS = {'KB': 1024, 'MB': 1024 ** 2, 'GB': 1024 ** 3}
+LOG_LEVEL_INT = getattr(logging, LOGGING_SETTINGS['level'])
+LOG_FILE_MAX_BYTES = (
+    int(LOGGING_SETTINGS['log_file_max_size'][:-2]) * _SIZE_UNITS[LOGGING_SETTINGS['log_file_max_size'][-2:].upper()]
+)
+
+# Database config snapshot after the environment overrides
+DB_CONFIG = DatabaseConfig(**DATABASE_SETTINGS)
+
+# Read-only views of settings nothing patches at runtime (SCRAPER_SETTINGS stays a
+# plain dict: run_automated_pipeline overrides batch limits from the environment)
+PATHS = MappingProxyType(PATHS)
+DATABASE_SETTINGS = MappingProxyType(DATABASE_SETTINGS)
+CAPTCHA_SETTINGS = MappingProxyType(CAPTCHA_SETTINGS)
+BROWSER_SETTINGS = MappingProxyType(BROWSER_SETTINGS)
+
 # =============================================================================
 # Validation and Environment Check
 # =============================================================================
 
+# Directories validate_settings() makes sure exist
+REQUIRED_DIRS = (PATHS['data_dir'], PATHS['input_dir'], PATHS['output_dir'], PATHS['logs_dir'])
+
 def validate_settings():
     """Validate configuration settings"""
     errors = []
     
-    # Check required directories
-    required_dirs = [PATHS['data_dir'], PATHS['input_dir'], PATHS['output_dir']]
-    for dir_path in required_dirs:
-        if not Path(dir_path).exists():
-            try:
-                Path(dir_path).mkdir(parents=True, exist_ok=True)
-            except Exception as e:
-                errors.append(f"Cannot create directory {dir_path}: {e}")
+    # Check required directories (makedirs is a no-op when they already exist)
+    for dir_path in REQUIRED_DIRS:
+        try:
+            os.makedirs(dir_path, exist_ok=True)
+        except OSError as e:
+            errors.append(f"Cannot create directory {dir_path}: {e}")
     
     # Check API key
     if not TWOCAPTCHA_API_KEY or TWOCAPTCHA_API_KEY == "your_api_key_here":
@@ -280,6 +324,19 @@ def validate_settings():
     
     return errors
 
+@functools.cache
+def _component_levels():
+    """(logger, numeric level) pairs for LOGGING_SETTINGS['component_levels'], resolved once"""
+    return tuple(
+        (logging.getLogger(name), getattr(logging, level))
+        for name, level in LOGGING_SETTINGS['component_levels'].items()
+    )
+
+def apply_component_levels():
+    """Apply the per-component log levels"""
+    for component_logger, level in _component_levels():
+        component_logger.setLevel(level)
+
 def get_config_summary():
     """Get configuration summary for logging"""
     return {
@@ -291,12 +348,18 @@ def get_config_summary():
         'logging_level': LOGGING_SETTINGS['level'],
     }
 
-# Validate settings on import
-_validation_errors = validate_settings()
-if _validation_errors:
-    import warnings
-    for error in _validation_errors:
-        warnings.warn(f"Configuration warning: {error}")
+def init_runtime():
+    """
+    Validate settings, create the required directories and apply the per-component
+    log levels; call once from an entry point's main (importing settings does no
+    filesystem work)
+    """
+    apply_component_levels()
+    errors = validate_settings()
+    if errors:
+        import warnings
+        warnings.warn("Configuration warnings:\n  " + "\n  ".join(errors))
+    return errors
 
 # =============================================================================
 # Export commonly used settings groups
@@ -308,15 +371,21 @@ __all__ = [
     'BROWSER_SETTINGS', 
     'CAPTCHA_SETTINGS',
     'DATABASE_SETTINGS',
+    'DatabaseConfig',
+    'DB_CONFIG',
     'PATHS',
     'FILE_MANAGEMENT_SETTINGS',
     'VALIDATION_SETTINGS',
     'DATA_CLEANING_SETTINGS',
     'CONTACT_SCRAPER_SETTINGS',
     'LOGGING_SETTINGS',
+    'LOG_LEVEL_INT',
+    'LOG_FILE_MAX_BYTES',
     'PERFORMANCE_SETTINGS',
     'MONITORING_SETTINGS',
     'TESTING_SETTINGS',
     'validate_settings',
+    'init_runtime',
+    'apply_component_levels',
     'get_config_summary'
 ]
\ No newline at end of file
@@ -7,21 +7,22 @@ import asyncio
 import asyncpg
 import logging
 from contextlib import asynccontextmanager
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, AsyncIterator
 import json
 from pathlib import Path
 import sys
+import time
 
 # Add config to path
 sys.path.append(str(Path(__file__).parent.parent / "config"))
 
 try:
-    # Try to import from config package
-    from settings import DATABASE_SETTINGS
+    # Same module the rest of the pipeline imports, so there is one settings instance
+    from settings import DB_CONFIG, DatabaseConfig, init_runtime
 except ImportError:
     try:
         # Fallback: try direct import from config directory
-        from config.settings import DATABASE_SETTINGS
+        from config.settings import DB_CONFIG, DatabaseConfig, init_runtime
     except ImportError:
         # No fallback - require proper settings.py
         raise ImportError(
@@ -30,26 +31,71 @@ except ImportError:
             "Run: python scripts/setup_database.py to initialize."
         )
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# json/jsonb codecs registered on every pooled connection. Text format keeps the
+# encoder simple; a binary-format codec could hand orjson's bytes over directly
+# (prefixed with the jsonb version byte) and skip the decode to str.
+if ORJSON_AVAILABLE:
+    def _json_encode(value) -> str:
+        return orjson.dumps(value, default=str).decode('utf-8')
+    _json_decode = orjson.loads
+else:
+    def _json_encode(value) -> str:
+        return json.dumps(value, default=str)
+    _json_decode = json.loads
+
+# Per-connection prepared-statement LRU (asyncpg default is 100)
+STATEMENT_CACHE_SIZE = 1024
+
+# Newest schema_version row in schema.sql; older databases are upgraded on connect
+SCHEMA_VERSION = '1.1.0'
+SCHEMA_VERSION_SQL = "SELECT EXISTS (SELECT 1 FROM schema_version WHERE version = $1)"
+
+# Advisory lock key serializing schema upgrades when several processes connect at once
+SCHEMA_LOCK_ID = 0x6a6f6273
+
+# Hot catalog/health queries; kept as constants so every call hits the same
+# cached prepared statement on each pooled connection
+TABLE_EXISTS_SQL = """
+    SELECT EXISTS (
+        SELECT FROM information_schema.tables 
+        WHERE table_schema = 'public' 
+        AND table_name = $1
+    )
+"""
+TABLE_INFO_SQL = """
+    SELECT 
+        column_name, 
+        data_type, 
+        is_nullable, 
+        column_default
+    FROM information_schema.columns 
+    WHERE table_schema = 'public' 
+    AND table_name = $1
+    ORDER BY ordinal_position
+"""
+HEALTH_CHECK_SQL = "SELECT 1"
+
+# Pooled connections idle this long (seconds) are closed and reopened lazily
+MAX_INACTIVE_CONNECTION_LIFETIME = 600
+
 class DatabaseManager:
+    # Schema SQL by path, read once per process
+    _schema_sql: Dict[Path, str] = {}
+    
     def __init__(self):
         """Initialize database manager with connection pool"""
         self.pool: Optional[asyncpg.Pool] = None
-        self.is_connected = False
         
         # Database configuration from enhanced settings
-        self.host = DATABASE_SETTINGS.get('host', 'localhost')
-        self.port = DATABASE_SETTINGS.get('port', 5432)
-        self.database = DATABASE_SETTINGS.get('database', 'job_market_data')
-        self.username = DATABASE_SETTINGS.get('username', 'postgres')
-        self.password = DATABASE_SETTINGS.get('password', 'working')
-        self.min_connections = DATABASE_SETTINGS.get('min_connections', 5)
-        self.max_connections = DATABASE_SETTINGS.get('max_connections', 20)
-        self.connection_timeout = DATABASE_SETTINGS.get('connection_timeout', 60)
-        self.command_timeout = DATABASE_SETTINGS.get('command_timeout', 30)
-        self.ssl_mode = DATABASE_SETTINGS.get('ssl_mode', 'prefer')
-        self.enable_logging = DATABASE_SETTINGS.get('enable_logging', True)
+        self.cfg: DatabaseConfig = DB_CONFIG
         
         # Connection statistics
         self.connection_stats = {
@@ -60,56 +106,81 @@ class DatabaseManager:
             'failed_queries': 0
         }
         
-        logger.info(f"DatabaseManager initialized for {self.host}:{self.port}/{self.database}")
-        logger.info(f"Connection pool: {self.min_connections}-{self.max_connections}, SSL: {self.ssl_mode}")
+        # Connection parameters are fixed for the manager's lifetime; build them once
+        self._dsn = f"postgresql://{self.cfg.username}:{self.cfg.password}@{self.cfg.host}:{self.cfg.port}/{self.cfg.database}"
+        if self.cfg.ssl_mode and self.cfg.ssl_mode != 'prefer':
+            self._dsn += f"?sslmode={self.cfg.ssl_mode}"
+        self._server_settings = {
+            'jit': 'off',  # Disable JIT for faster small queries
+            'timezone': 'UTC',  # Use UTC timezone
+            'tcp_keepalives_idle': '60'  # Notice dead peers on long-idle pooled connections
+        }
+        
+        logger.info(f"DatabaseManager initialized for {self.cfg.host}:{self.cfg.port}/{self.cfg.database}")
+        logger.info(f"Connection pool: {self.cfg.min_connections}-{self.cfg.max_connections}, SSL: {self.cfg.ssl_mode}")
+    
+    def __getattr__(self, name):
+        """Expose config fields as before (db_manager.host etc.); only hit on misses"""
+        if name in DatabaseConfig.__dataclass_fields__:
+            return getattr(self.cfg, name)
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+    
+    @property
+    def is_connected(self) -> bool:
+        """True while a pool exists and has not been closed"""
+        return self.pool is not None and not self.pool.is_closing()
     
-    async def connect(self) -> bool:
-        """Establish connection pool to PostgreSQL database"""
+    async def connect(self, upgrade_schema: bool = True) -> bool:
+        """Establish connection pool to PostgreSQL database
+        
+        upgrade_schema=False skips ensure_schema_current, for callers that run the
+        migrations themselves (scripts/setup_database.py).
+        """
         try:
             self.connection_stats['total_connections'] += 1
             logger.info("Connecting to PostgreSQL database...")
             
-            # Build connection string with SSL mode
-            if self.ssl_mode and self.ssl_mode != 'prefer':
-                dsn = f"postgresql://{self.username}:{self.password}@{self.host}:{self.port}/{self.database}?sslmode={self.ssl_mode}"
-            else:
-                dsn = f"postgresql://{self.username}:{self.password}@{self.host}:{self.port}/{self.database}"
-            
             # Create connection pool with enhanced settings
             self.pool = await asyncpg.create_pool(
-                dsn,
-                min_size=self.min_connections,
-                max_size=self.max_connections,
-                command_timeout=self.command_timeout,
-                init=self._init_connection if self.enable_logging else None,
-                server_settings={
-                    'jit': 'off',  # Disable JIT for faster small queries
-                    'timezone': 'UTC'  # Use UTC timezone
-                }
+                self._dsn,
+                min_size=self.cfg.min_connections,
+                max_size=self.cfg.max_connections,
+                command_timeout=self.cfg.command_timeout,
+                statement_cache_size=STATEMENT_CACHE_SIZE,
+                init=self._init_connection,
+                max_inactive_connection_lifetime=MAX_INACTIVE_CONNECTION_LIFETIME,
+                server_settings=self._server_settings
             )
             
-            # Test connection
-            async with self.pool.acquire() as conn:
-                result = await conn.fetchval("SELECT version()")
-                if self.enable_logging:
+            # create_pool already opened min_size connections; the version probe is only for the log
+            if self.cfg.enable_logging:
+                async with self.pool.acquire() as conn:
+                    result = await conn.fetchval("SELECT version()")
                     logger.info(f"Connected to PostgreSQL: {result[:50]}...")
             
-            self.is_connected = True
+            if upgrade_schema:
+                await self.ensure_schema_current()
+            
             self.connection_stats['successful_connections'] += 1
             logger.info(f"Database connection pool established successfully")
-            logger.info(f"Pool configuration: {self.min_connections}-{self.max_connections} connections, timeout: {self.command_timeout}s")
+            logger.info(f"Pool configuration: {self.cfg.min_connections}-{self.cfg.max_connections} connections, timeout: {self.cfg.command_timeout}s")
             return True
             
         except Exception as e:
             logger.error(f"Failed to connect to database: {e}")
             self.connection_stats['failed_connections'] += 1
-            self.is_connected = False
+            # A pool that failed its test query must not count as connected
+            if self.pool is not None:
+                self.pool.terminate()
+                self.pool = None
             return False
     
     async def _init_connection(self, conn):
         """Initialize connection with custom settings"""
-        if self.enable_logging:
-            logger.debug(f"Initializing database connection {id(conn)}")
+        for json_type in ('json', 'jsonb'):
+            await conn.set_type_codec(json_type, encoder=_json_encode, decoder=_json_decode,
+                                      schema='pg_catalog')
+        logger.debug("Initializing database connection %d", id(conn))
     
     async def disconnect(self):
         """Close all database connections"""
@@ -120,7 +191,6 @@ class DatabaseManager:
             except Exception as e:
                 logger.error(f"Error closing database pool: {e}")
         
-        self.is_connected = False
         self.pool = None
     
     @asynccontextmanager
@@ -144,37 +214,51 @@ class DatabaseManager:
             async with conn.transaction():
                 yield conn
     
-    async def execute_query(self, query: str, *args) -> List[Dict[str, Any]]:
-        """Execute SELECT query and return results as list of dictionaries"""
+    async def execute_query(self, query: str, *args) -> List[asyncpg.Record]:
+        """Execute SELECT query and return the rows (read-only, indexable by column name)"""
         try:
             self.connection_stats['total_queries'] += 1
             async with self.get_connection() as conn:
-                rows = await conn.fetch(query, *args)
-                result = [dict(row) for row in rows]
-                if self.enable_logging:
-                    logger.debug(f"Query executed successfully, returned {len(result)} rows")
+                result = await conn.fetch(query, *args)
+                logger.debug("Query executed successfully, returned %d rows", len(result))
                 return result
         except Exception as e:
             self.connection_stats['failed_queries'] += 1
             logger.error(f"Query execution failed: {e}")
-            if self.enable_logging:
+            if self.cfg.enable_logging:
                 logger.error(f"Query: {query}")
             raise
     
-    async def execute_single(self, query: str, *args) -> Optional[Dict[str, Any]]:
-        """Execute SELECT query and return single result"""
+    async def execute_single(self, query: str, *args) -> Optional[asyncpg.Record]:
+        """Execute SELECT query and return single result (read-only record)"""
         try:
             self.connection_stats['total_queries'] += 1
             async with self.get_connection() as conn:
-                row = await conn.fetchrow(query, *args)
-                result = dict(row) if row else None
-                if self.enable_logging:
-                    logger.debug(f"Single query executed successfully, returned {'1 row' if result else 'no rows'}")
+                result = await conn.fetchrow(query, *args)
+                logger.debug("Single query executed successfully, returned %s", '1 row' if result else 'no rows')
                 return result
         except Exception as e:
             self.connection_stats['failed_queries'] += 1
             logger.error(f"Single query execution failed: {e}")
-            if self.enable_logging:
+            if self.cfg.enable_logging:
+                logger.error(f"Query: {query}")
+            raise
+    
+    async def iter_query(self, query: str, *args, prefetch: int = 1000) -> AsyncIterator[asyncpg.Record]:
+        """
+        Stream SELECT results through a server-side cursor (prefer over execute_query
+        beyond ~10k rows; memory stays bounded by prefetch)
+        """
+        self.connection_stats['total_queries'] += 1
+        try:
+            # Cursors only live inside a transaction
+            async with self.get_transaction() as conn:
+                async for record in conn.cursor(query, *args, prefetch=prefetch):
+                    yield record
+        except Exception as e:
+            self.connection_stats['failed_queries'] += 1
+            logger.error(f"Streaming query failed: {e}")
+            if self.cfg.enable_logging:
                 logger.error(f"Query: {query}")
             raise
     
@@ -183,7 +267,7 @@ class DatabaseManager:
         try:
             async with self.get_connection() as conn:
                 result = await conn.execute(query, *args)
-                logger.debug(f"Command executed: {result}")
+                logger.debug("Command executed: %s", result)
                 return result
         except Exception as e:
             logger.error(f"Command execution failed: {e}")
@@ -195,35 +279,57 @@ class DatabaseManager:
         try:
             async with self.get_connection() as conn:
                 result = await conn.executemany(query, args_list)
-                logger.debug(f"Batch command executed: {result}")
+                logger.debug("Batch command executed: %s", result)
                 return result
         except Exception as e:
             logger.error(f"Batch execution failed: {e}")
             logger.error(f"Query: {query}")
             raise
     
+    async def copy_records(self, table: str, columns, records) -> str:
+        """Bulk-insert records (tuples in column order) with COPY ... FROM STDIN"""
+        try:
+            async with self.get_connection() as conn:
+                result = await conn.copy_records_to_table(table, records=records, columns=columns)
+                logger.debug("Copy executed: %s", result)
+                return result
+        except Exception as e:
+            logger.error(f"Copy into {table} failed: {e}")
+            raise
+    
     async def check_table_exists(self, table_name: str) -> bool:
         """Check if table exists in database"""
-        query = """
-            SELECT EXISTS (
-                SELECT FROM information_schema.tables 
-                WHERE table_schema = 'public' 
-                AND table_name = $1
-            )
-        """
-        result = await self.execute_single(query, table_name)
-        return result['exists'] if result else False
+        async with self.get_connection() as conn:
+            return bool(await conn.fetchval(TABLE_EXISTS_SQL, table_name))
+    
+    async def ensure_schema_current(self):
+        """Run pending migrations and re-apply schema.sql if the database predates SCHEMA_VERSION"""
+        async with self.get_connection() as conn:
+            if await conn.fetchval("SELECT to_regclass('jobs')") is None:
+                # No schema yet: scripts/setup_database.py (or Docker initdb) creates it
+                return
+            if (await conn.fetchval("SELECT to_regclass('schema_version')") is not None
+                    and await conn.fetchval(SCHEMA_VERSION_SQL, SCHEMA_VERSION)):
+                return
+        
+        logger.info(f"Database schema is older than {SCHEMA_VERSION}, upgrading...")
+        await self.create_tables_from_schema()
     
     async def create_tables_from_schema(self, schema_path: str = None):
         """Create tables from SQL schema file"""
-        if not schema_path:
-            schema_path = Path(__file__).parent / "schema.sql"
+        schema_path = Path(schema_path) if schema_path else Path(__file__).parent / "schema.sql"
         
         try:
-            with open(schema_path, 'r', encoding='utf-8') as f:
-                schema_sql = f.read()
+            schema_sql = self._schema_sql.get(schema_path)
+            if schema_sql is None:
+                schema_sql = self._schema_sql[schema_path] = schema_path.read_text(encoding='utf-8')
+            
+            from .migrations import run_migrations
             
             async with self.get_transaction() as conn:
+                # Concurrent upgraders wait here; the migrations then find nothing left to do
+                await conn.execute("SELECT pg_advisory_xact_lock($1)", SCHEMA_LOCK_ID)
+                await run_migrations(conn)
                 await conn.execute(schema_sql)
             
             logger.info(f"Database schema created from {schema_path}")
@@ -235,25 +341,14 @@ class DatabaseManager:
             logger.error(f"Failed to create schema: {e}")
             raise
     
-    async def get_table_info(self, table_name: str) -> List[Dict[str, Any]]:
+    async def get_table_info(self, table_name: str) -> List[asyncpg.Record]:
         """Get table column information"""
-        query = """
-            SELECT 
-                column_name, 
-                data_type, 
-                is_nullable, 
-                column_default
-            FROM information_schema.columns 
-            WHERE table_schema = 'public' 
-            AND table_name = $1
-            ORDER BY ordinal_position
-        """
-        return await self.execute_query(query, table_name)
+        return await self.execute_query(TABLE_INFO_SQL, table_name)
     
     async def get_health_status(self) -> Dict[str, Any]:
         """Get database health and connection status"""
         try:
-            if not self.is_connected or not self.pool:
+            if not self.is_connected:
                 return {
                     'status': 'disconnected',
                     'error': 'No database connection'
@@ -269,25 +364,25 @@ class DatabaseManager:
             
             # Test query
             async with self.get_connection() as conn:
-                start_time = asyncio.get_event_loop().time()
-                await conn.fetchval("SELECT 1")
-                query_time = (asyncio.get_event_loop().time() - start_time) * 1000
+                start_ns = time.perf_counter_ns()
+                await conn.fetchval(HEALTH_CHECK_SQL)
+                query_time = (time.perf_counter_ns() - start_ns) / 1e6
             
             return {
                 'status': 'healthy',
-                'database': self.database,
-                'host': self.host,
-                'port': self.port,
-                'ssl_mode': self.ssl_mode,
+                'database': self.cfg.database,
+                'host': self.cfg.host,
+                'port': self.cfg.port,
+                'ssl_mode': self.cfg.ssl_mode,
                 'pool_info': pool_info,
                 'query_time_ms': round(query_time, 2),
                 'connection_stats': self.connection_stats,
                 'settings': {
-                    'min_connections': self.min_connections,
-                    'max_connections': self.max_connections,
-                    'connection_timeout': self.connection_timeout,
-                    'command_timeout': self.command_timeout,
-                    'logging_enabled': self.enable_logging
+                    'min_connections': self.cfg.min_connections,
+                    'max_connections': self.cfg.max_connections,
+                    'connection_timeout': self.cfg.connection_timeout,
+                    'command_timeout': self.cfg.command_timeout,
+                    'logging_enabled': self.cfg.enable_logging
                 }
             }
             
@@ -302,23 +397,16 @@ class DatabaseManager:
         """Get detailed connection and query statistics"""
         stats = self.connection_stats.copy()
         
-        # Calculate derived statistics
+        # Calculate derived statistics (one reciprocal per denominator)
         total_connections = stats['total_connections']
         total_queries = stats['total_queries']
+        inv_connections = 100.0 / total_connections if total_connections else 0.0
+        inv_queries = 100.0 / total_queries if total_queries else 0.0
         
-        if total_connections > 0:
-            stats['connection_success_rate'] = (stats['successful_connections'] / total_connections) * 100
-            stats['connection_failure_rate'] = (stats['failed_connections'] / total_connections) * 100
-        else:
-            stats['connection_success_rate'] = 0
-            stats['connection_failure_rate'] = 0
-        
-        if total_queries > 0:
-            stats['query_success_rate'] = ((total_queries - stats['failed_queries']) / total_queries) * 100
-            stats['query_failure_rate'] = (stats['failed_queries'] / total_queries) * 100
-        else:
-            stats['query_success_rate'] = 0
-            stats['query_failure_rate'] = 0
+        stats['connection_success_rate'] = stats['successful_connections'] * inv_connections
+        stats['connection_failure_rate'] = stats['failed_connections'] * inv_connections
+        stats['query_success_rate'] = (total_queries - stats['failed_queries']) * inv_queries
+        stats['query_failure_rate'] = stats['failed_queries'] * inv_queries
         
         # Add pool information if connected
         if self.pool:
@@ -339,9 +427,9 @@ db_manager = DatabaseManager()
 DatabaseConnection = DatabaseManager
 
 # Convenience functions for common operations
-async def init_database() -> bool:
+async def init_database(upgrade_schema: bool = True) -> bool:
     """Initialize database connection"""
-    return await db_manager.connect()
+    return await db_manager.connect(upgrade_schema=upgrade_schema)
 
 async def close_database():
     """Close database connection"""
@@ -386,4 +474,12 @@ if __name__ == "__main__":
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
     
-    asyncio.run(test_connection())
\ No newline at end of file
+    # uvloop is optional (not available on Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
+    init_runtime()
+    asyncio.run(test_connection())
@@ -6,15 +6,52 @@ Includes bulk insert operations, duplicate handling, and data transformation
 
 import asyncio
 import json
-import pandas as pd
 import logging
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Iterable
 import hashlib
 from datetime import datetime
 import uuid
 import sys
+import asyncpg
 import re
+import html
+import itertools
+import collections
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+# pandas is only needed for CSV input
+try:
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+try:
+    import pyarrow  # only used through pandas' pyarrow CSV engine
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    from selectolax.parser import HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
 
 # Add parent directories to path for imports
 sys.path.append(str(Path(__file__).parent))
@@ -24,11 +61,11 @@ try:
     from .connection import db_manager, init_database, close_database
     # Try to import from config package
     sys.path.append(str(Path(__file__).parent.parent / "config"))
-    from settings import DATABASE_SETTINGS, VALIDATION_SETTINGS, DATA_CLEANING_SETTINGS
+    from settings import DATABASE_SETTINGS, VALIDATION_SETTINGS, DATA_CLEANING_SETTINGS, init_runtime
 except ImportError:
     try:
         # Fallback: try direct import from config directory
-        from config.settings import DATABASE_SETTINGS, VALIDATION_SETTINGS, DATA_CLEANING_SETTINGS
+        from config.settings import DATABASE_SETTINGS, VALIDATION_SETTINGS, DATA_CLEANING_SETTINGS, init_runtime
     except ImportError as e:
         raise ImportError(
             f"[ERROR] Settings import failed: {e}\n"
@@ -38,13 +75,118 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Column order used when bulk-loading jobs
+JOB_COLUMNS = (
+    'id', 'company_id', 'profession', 'salary', 'company_name', 'location',
+    'start_date', 'telephone', 'email', 'job_description', 'ref_nr',
+    'external_link', 'application_link', 'job_type', 'ausbildungsberuf',
+    'application_method', 'contact_person', 'source_url', 'scraped_at',
+    'captcha_solved', 'content_hash', 'status', 'is_valid'
+)
+
+INSERT_JOB_SQL = (
+    f"INSERT INTO jobs ({', '.join(JOB_COLUMNS)}) "
+    f"VALUES ({', '.join(f'${i}' for i in range(1, len(JOB_COLUMNS) + 1))})"
+)
+
+# Batches at least this large go through COPY; smaller ones use one executemany
+COPY_MIN_ROWS = 100
+
+# COPY streams are cut at copy_batch_size rows or roughly this many bytes of text,
+# whichever comes first, so one huge load does not sit in a single COPY buffer
+COPY_MAX_BYTES = 8 * 1024 * 1024
+
+EXISTING_JOB_KEYS_SQL = """
+    SELECT content_hash, ref_nr, source_url FROM jobs
+    WHERE content_hash = ANY($1::bytea[]) OR ref_nr = ANY($2::text[]) OR source_url = ANY($3::text[])
+"""
+
+# NULL parameters never match, so absent keys are simply skipped
+DUPLICATE_JOB_SQL = "SELECT id FROM jobs WHERE content_hash = $1 OR ref_nr = $2 OR source_url = $3 LIMIT 1"
+
+# Rows whose content_hash is already stored are skipped. The explicit target makes the
+# insert fail outright if uq_jobs_content_hash is missing; ref_nr/source_url clashes
+# (normally filtered out beforehand) raise UniqueViolationError instead
+INSERT_JOB_IGNORE_SQL = f"{INSERT_JOB_SQL} ON CONFLICT (content_hash) DO NOTHING RETURNING id"
+
+# Process-pool transform defaults: a few workers, and only for inputs large enough to
+# pay for spawning them (each worker imports this module and builds its own loader)
+TRANSFORM_WORKERS = 2
+TRANSFORM_PARALLEL_MIN_ROWS = 5000
+
+# insert_job_batch runs concurrently; a batch that loses a deadlock is retried whole
+DEADLOCK_RETRIES = 3
+DEADLOCK_BACKOFF = 0.05  # seconds, multiplied by the attempt number
+
+FIND_COMPANIES_SQL = "SELECT id, normalized_name FROM companies WHERE normalized_name = ANY($1::text[])"
+
+# RETURNING only yields rows this call created; names lost to a concurrent insert are re-fetched
+INSERT_COMPANY_SQL = """
+    INSERT INTO companies (id, name, normalized_name, location)
+    VALUES ($1, $2, $3, $4)
+    ON CONFLICT (normalized_name) DO NOTHING
+    RETURNING id, normalized_name
+"""
+
+# Cleaned, stored fields that identify a job for content_hash; hashing what is stored
+# lets migrations recompute the key from the jobs table itself
+CONTENT_KEY_FIELDS = ('profession', 'company_name', 'location', 'ref_nr', 'source_url')
+
+def content_key(values: Iterable[Any]) -> str:
+    """Join CONTENT_KEY_FIELDS values into the string fed to hash_content_key; None counts as empty"""
+    return '|'.join('' if value is None else str(value) for value in values).lower()
+
+def hash_content_key(content_string: str) -> bytes:
+    """Dedup key for a job; only needs to be stable, not cryptographic (16 raw bytes for the BYTEA column)"""
+    return hashlib.blake2b(content_string.encode('utf-8'), digest_size=16).digest()
+
+# Free-text columns cleaned by transform_dataframe
+CSV_TEXT_FIELDS = (
+    'profession', 'salary', 'company_name', 'location', 'job_description', 'ref_nr',
+    'external_link', 'application_link', 'job_type', 'ausbildungsberuf',
+    'application_method', 'contact_person', 'source_url'
+)
+
+# JSON files larger than this are streamed with ijson instead of parsed in one go
+JSON_STREAM_MIN_BYTES = 64 * 1024 * 1024
+
+# Entries kept in JobDataLoader's company id cache before it starts over
+COMPANY_CACHE_MAX = 50_000
+
+# Cleaning patterns, compiled once for the per-job transform loop
+_RE_ARBEITGEBER = re.compile(r'^Arbeitgeber:\s*', re.IGNORECASE)
+_RE_WS = re.compile(r'\s+')
+_RE_PHONE_DE1 = re.compile(r'^\+49\(?\d+\)?\s*\d+[-\s]?\d+')
+_RE_PHONE_DE2 = re.compile(r'^0\d+\s*\d+[-\s]?\d+')
+_RE_EMAIL = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_RE_HTML_TAG = re.compile(r'<[^>]+>')
+
+# German DD.MM.YYYY or ISO YYYY-MM-DD, anywhere in the text ("ab 1.9.2025", "Beginn ab ...")
+_RE_DE_DATE = re.compile(
+    r'(?P<d>\d{1,2})\.(?P<m>\d{1,2})\.(?P<y>\d{4})|(?P<y2>\d{4})-(?P<m2>\d{1,2})-(?P<d2>\d{1,2})'
+)
+
+class _PhoneCharTable(dict):
+    """str.translate table keeping digits, whitespace and +()-, filled lazily per code point"""
+    
+    def __missing__(self, code_point: int):
+        char = chr(code_point)
+        keep = char.isdecimal() or char.isspace() or char in '+()-'
+        self[code_point] = code_point if keep else None
+        return self[code_point]
+
+_PHONE_CHARS = _PhoneCharTable()
+
 class JobDataLoader:
     def __init__(self):
         """Initialize job data loader with enhanced settings"""
         self.db_manager = db_manager
         
         # Configuration from settings
+        # Row-wise inserts plateau around a few hundred rows per batch; COPY keeps
+        # gaining well past that, so it gets its own, much larger batch size
         self.batch_size = DATABASE_SETTINGS.get('batch_size', 100)
+        self.copy_batch_size = DATABASE_SETTINGS.get('copy_batch_size', 5000)
         self.duplicate_strategy = 'skip'  # skip, update, error
         self.validate_on_load = VALIDATION_SETTINGS.get('validate_on_scrape', True)
         self.clean_data_on_load = DATA_CLEANING_SETTINGS.get('clean_data_on_save', True)
@@ -57,6 +199,19 @@ class JobDataLoader:
         self.remove_html = DATA_CLEANING_SETTINGS.get('remove_html_tags', True)
         self.trim_whitespace = DATA_CLEANING_SETTINGS.get('trim_whitespace', True)
         
+        # Worker processes for transforming large inputs (1 = transform inline); inputs
+        # below transform_parallel_min_rows are not worth the worker start-up
+        self.transform_workers = DATABASE_SETTINGS.get('transform_workers', min(TRANSFORM_WORKERS, os.cpu_count() or 1))
+        self.transform_parallel_min_rows = DATABASE_SETTINGS.get('transform_parallel_min_rows', TRANSFORM_PARALLEL_MIN_ROWS)
+        
+        # Batches written concurrently; one pool connection stays free for other queries
+        self.insert_concurrency = max(1, self.db_manager.cfg.max_connections - 1)
+        
+        # normalized company name -> id, shared by all batches of a load (and by
+        # concurrent loads; cleared when the last running load finishes)
+        self._company_cache: Dict[str, uuid.UUID] = {}
+        self._active_loads = 0
+        
         # Quality thresholds
         self.min_quality_score = VALIDATION_SETTINGS.get('min_quality_score', 3.0)
         self.min_completeness = VALIDATION_SETTINGS.get('min_completeness_score', 0.3)
@@ -75,35 +230,30 @@ class JobDataLoader:
         logger.info("JobDataLoader initialized with enhanced settings")
         logger.info(f"Validation enabled: {self.validate_on_load}, Data cleaning: {self.clean_data_on_load}")
         logger.info(f"Quality thresholds - Score: {self.min_quality_score}, Completeness: {self.min_completeness}")
+        logger.info(f"Batch sizes - insert: {self.batch_size}, COPY: {self.copy_batch_size} rows / {COPY_MAX_BYTES // (1024 * 1024)} MiB")
     
-    def generate_content_hash(self, job_data: Dict[str, Any]) -> str:
-        """Generate content hash for duplicate detection"""
-        # Create hash from key fields to identify duplicates
-        content_fields = [
-            str(job_data.get('profession', '')),
-            str(job_data.get('company_name', '')),
-            str(job_data.get('location', '')),
-            str(job_data.get('ref_nr', '')),
-            str(job_data.get('source_url', ''))
-        ]
-        
-        content_string = '|'.join(content_fields).lower()
-        return hashlib.sha256(content_string.encode()).hexdigest()
+    def generate_content_hash(self, job_data: Dict[str, Any]) -> bytes:
+        """Generate content hash for duplicate detection from transformed (stored) job fields"""
+        return hash_content_key(content_key(job_data.get(field) for field in CONTENT_KEY_FIELDS))
     
-    def normalize_company_name(self, company_name: str) -> str:
-        """Normalize company name for deduplication"""
+    def normalize_company_name(self, company_name: str, cleaned: bool = False) -> str:
+        """Normalize company name for deduplication
+        
+        cleaned=True skips the strip/whitespace pass for names that already went
+        through clean_text_field (as in transform_job_data).
+        """
         if not company_name:
             return ""
         
         if not self.normalize_companies:
-            return company_name.strip()
+            return company_name if cleaned else company_name.strip()
         
         # Remove common prefixes and standardize
-        normalized = company_name.strip()
-        normalized = re.sub(r'^Arbeitgeber:\s*', '', normalized, flags=re.IGNORECASE)
+        normalized = company_name if cleaned else company_name.strip()
+        normalized = _RE_ARBEITGEBER.sub('', normalized)
         
-        if self.trim_whitespace:
-            normalized = re.sub(r'\s+', ' ', normalized)  # Multiple spaces to single
+        if self.trim_whitespace and not cleaned:
+            normalized = ' '.join(normalized.split())  # Multiple spaces to single
         
         normalized = normalized.lower()
         
@@ -118,11 +268,10 @@ class JobDataLoader:
             return phone.strip()
         
         # Remove common formatting
-        cleaned = re.sub(r'[^\d+\(\)\-\s]', '', phone.strip())
+        cleaned = phone.strip().translate(_PHONE_CHARS)
         
         # Validate German phone number pattern
-        if re.match(r'^\+49\(?\d+\)?\s*\d+[-\s]?\d+', cleaned) or \
-           re.match(r'^0\d+\s*\d+[-\s]?\d+', cleaned):
+        if _RE_PHONE_DE1.match(cleaned) or _RE_PHONE_DE2.match(cleaned):
             return cleaned
         
         return cleaned if len(cleaned) >= 6 else None
@@ -149,8 +298,7 @@ class JobDataLoader:
             return email
         
         # Enhanced email validation
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if re.match(email_pattern, email):
+        if _RE_EMAIL.match(email):
             # Additional checks for common issues
             if email.count('@') != 1:
                 logger.warning(f"Invalid email format (multiple @): {email}")
@@ -167,33 +315,28 @@ class JobDataLoader:
         return None
     
     def parse_date_string(self, date_str: str) -> Optional[str]:
-        """Parse various German date formats"""
+        """Parse various German date formats to zero-padded YYYY-MM-DD (text around the date is dropped)"""
         if not date_str:
             return None
         
         if not self.parse_german_dates:
             return date_str
         
-        # Common German date patterns
-        date_patterns = [
-            (r'(\d{1,2})\.(\d{1,2})\.(\d{4})', r'\3-\2-\1'),  # DD.MM.YYYY
-            (r'(\d{4})-(\d{1,2})-(\d{1,2})', r'\1-\2-\3'),   # YYYY-MM-DD
-            (r'ab\s+(\d{1,2})\.(\d{1,2})\.(\d{4})', r'\3-\2-\1'),  # ab DD.MM.YYYY
-            (r'Beginn ab\s+(\d{1,2})\.(\d{1,2})\.(\d{4})', r'\3-\2-\1')  # Beginn ab DD.MM.YYYY
-        ]
-        
-        for pattern, replacement in date_patterns:
-            match = re.search(pattern, date_str)
-            if match:
-                try:
-                    parsed_date = re.sub(pattern, replacement, date_str)
-                    logger.debug(f"Parsed German date: {date_str} -> {parsed_date}")
-                    return parsed_date
-                except:
-                    continue
+        match = _RE_DE_DATE.search(date_str)
+        if match:
+            year, month, day = match.group('y', 'm', 'd') if match['y'] else match.group('y2', 'm2', 'd2')
+            parsed_date = f"{year}-{month.zfill(2)}-{day.zfill(2)}"
+            logger.debug("Parsed German date: %s -> %s", date_str, parsed_date)
+            return parsed_date
         
         return date_str  # Return original if no pattern matches
     
+    def _remember_companies(self, company_ids: Dict[str, uuid.UUID]):
+        """Cache committed company ids, starting over once the cache is full"""
+        if len(self._company_cache) + len(company_ids) > COMPANY_CACHE_MAX:
+            self._company_cache.clear()
+        self._company_cache.update(company_ids)
+    
     async def find_or_create_company(self, company_name: str, location: str = None) -> Optional[uuid.UUID]:
         """Find existing company or create new one"""
         if not company_name:
@@ -201,6 +344,8 @@ class JobDataLoader:
         
         try:
             normalized_name = self.normalize_company_name(company_name)
+            if normalized_name in self._company_cache:
+                return self._company_cache[normalized_name]
             
             # Try to find existing company
             existing_company = await self.db_manager.execute_single(
@@ -209,6 +354,7 @@ class JobDataLoader:
             )
             
             if existing_company:
+                self._remember_companies({normalized_name: existing_company['id']})
                 return existing_company['id']
             
             # Create new company
@@ -222,6 +368,7 @@ class JobDataLoader:
             )
             
             self.stats['companies_created'] += 1
+            self._remember_companies({normalized_name: company_id})
             logger.debug(f"Created new company: {company_name}")
             return company_id
             
@@ -229,62 +376,97 @@ class JobDataLoader:
             logger.error(f"Error creating company {company_name}: {e}")
             return None
     
-    async def check_duplicate_job(self, content_hash: str, ref_nr: str, source_url: str) -> Optional[uuid.UUID]:
-        """Check if job already exists in database"""
-        try:
-            # Check by content hash first
-            if content_hash:
-                existing = await self.db_manager.execute_single(
-                    "SELECT id FROM jobs WHERE content_hash = $1",
-                    content_hash
-                )
-                if existing:
-                    return existing['id']
-            
-            # Check by ref_nr
-            if ref_nr:
-                existing = await self.db_manager.execute_single(
-                    "SELECT id FROM jobs WHERE ref_nr = $1",
-                    ref_nr
-                )
-                if existing:
-                    return existing['id']
-            
-            # Check by source_url
-            if source_url:
-                existing = await self.db_manager.execute_single(
-                    "SELECT id FROM jobs WHERE source_url = $1",
-                    source_url
-                )
-                if existing:
-                    return existing['id']
-            
-            return None
+    async def resolve_company_ids(self, conn, jobs: List[Dict[str, Any]]) -> Tuple[Dict[str, uuid.UUID], int]:
+        """Find or create the companies of a batch of jobs; returns ({normalized_name: id}, companies created)
+        
+        Ids already in _company_cache skip the database. The caller adds the result to
+        the cache and the created count to stats once its transaction has committed
+        (see _remember_companies).
+        """
+        company_ids = {}
+        companies = {}
+        for job_data in jobs:
+            normalized_name = job_data.get('normalized_company')
+            if not normalized_name or normalized_name in company_ids or normalized_name in companies:
+                continue
+            cached_id = self._company_cache.get(normalized_name)
+            if cached_id:
+                company_ids[normalized_name] = cached_id
+            else:
+                companies[normalized_name] = (job_data['company_name'], job_data['location'])
+        if not companies:
+            return company_ids, 0
+        
+        rows = await conn.fetch(FIND_COMPANIES_SQL, list(companies))
+        company_ids.update((row['normalized_name'], row['id']) for row in rows)
+        
+        # Sorted so concurrent batches lock new company rows in the same order
+        missing = [
+            (uuid.uuid4(), name, normalized_name, location)
+            for normalized_name, (name, location) in sorted(companies.items())
+            if normalized_name not in company_ids
+        ]
+        created = []
+        if missing:
+            created = await conn.fetchmany(INSERT_COMPANY_SQL, missing)
+            company_ids.update((row['normalized_name'], row['id']) for row in created)
             
+            if len(created) < len(missing):
+                raced = [row[2] for row in missing if row[2] not in company_ids]
+                rows = await conn.fetch(FIND_COMPANIES_SQL, raced)
+                company_ids.update((row['normalized_name'], row['id']) for row in rows)
+        
+        return company_ids, len(created)
+    
+    async def check_duplicate_job(self, content_hash: bytes, ref_nr: str, source_url: str) -> Optional[uuid.UUID]:
+        """Check if job already exists in database (one cached prepared statement, one round trip)"""
+        try:
+            existing = await self.db_manager.execute_single(
+                DUPLICATE_JOB_SQL, content_hash or None, ref_nr or None, source_url or None
+            )
+            return existing['id'] if existing else None
         except Exception as e:
             logger.error(f"Error checking duplicates: {e}")
             return None
     
+    async def fetch_existing_job_keys(self, jobs: List[Dict[str, Any]]) -> Tuple[set, set, set]:
+        """Return the (content_hash, ref_nr, source_url) sets of jobs already stored, in one query"""
+        existing = await self.db_manager.execute_query(
+            EXISTING_JOB_KEYS_SQL,
+            [job['content_hash'] for job in jobs],
+            [job['ref_nr'] for job in jobs if job['ref_nr']],
+            [job['source_url'] for job in jobs if job['source_url']]
+        )
+        return (
+            {bytes(row['content_hash']) for row in existing if row['content_hash'] is not None},
+            {row['ref_nr'] for row in existing},
+            {row['source_url'] for row in existing}
+        )
+    
     def clean_html_content(self, text: str) -> str:
         """Remove HTML tags from text content"""
         if not text or not self.remove_html:
             return text
         
-        # Remove HTML tags
-        cleaned = re.sub(r'<[^>]+>', '', text)
-        # Decode HTML entities
-        cleaned = re.sub(r'&[a-zA-Z]+;', ' ', cleaned)
+        if '<' in text:
+            if SELECTOLAX_AVAILABLE:
+                # C parser strips tags and decodes entities in one pass
+                cleaned = HTMLParser(text).text()
+            else:
+                cleaned = html.unescape(_RE_HTML_TAG.sub('', text))
+        elif '&' in text:
+            cleaned = html.unescape(text)
+        else:
+            cleaned = text
+        
         # Clean up whitespace
         if self.trim_whitespace:
-            cleaned = re.sub(r'\s+', ' ', cleaned).strip()
+            cleaned = ' '.join(cleaned.split())
         
         return cleaned
     
     def transform_job_data(self, raw_job: Dict[str, Any]) -> Dict[str, Any]:
         """Transform raw scraped data to database format with enhanced cleaning"""
-        # Generate content hash
-        content_hash = self.generate_content_hash(raw_job)
-        
         # Clean text fields
         def clean_text_field(field_name: str) -> Optional[str]:
             value = raw_job.get(field_name, '')
@@ -295,8 +477,8 @@ class JobDataLoader:
             text = str(value).strip()
             if self.remove_html:
                 text = self.clean_html_content(text)
-            if self.trim_whitespace:
-                text = re.sub(r'\s+', ' ', text).strip()
+            elif self.trim_whitespace:
+                text = ' '.join(text.split())
             
             return text if text else None
         
@@ -306,6 +488,7 @@ class JobDataLoader:
             'profession': clean_text_field('profession'),
             'salary': clean_text_field('salary'),
             'company_name': clean_text_field('company_name'),
+            'normalized_company': None,
             'location': clean_text_field('location'),
             'start_date': self.parse_date_string(raw_job.get('start_date', '')),
             'telephone': self.clean_phone_number(raw_job.get('telephone', '')),
@@ -325,11 +508,17 @@ class JobDataLoader:
             'source_url': clean_text_field('source_url'),
             'scraped_at': raw_job.get('scraped_at', datetime.utcnow().isoformat()),
             'captcha_solved': raw_job.get('captcha_solved', False),
-            'content_hash': content_hash,
+            'content_hash': None,
             'status': 'active',
             'is_valid': True
         }
         
+        # Hash the cleaned values exactly as they will be stored
+        transformed['content_hash'] = self.generate_content_hash(transformed)
+        
+        if transformed['company_name']:
+            transformed['normalized_company'] = self.normalize_company_name(transformed['company_name'], cleaned=True)
+        
         # Convert scraped_at to proper timestamp
         if isinstance(transformed['scraped_at'], str):
             try:
@@ -342,8 +531,7 @@ class JobDataLoader:
         
         # Calculate data quality score if validation is enabled
         if self.validate_on_load:
-            quality_score = self._calculate_data_quality(transformed)
-            completeness_score = self._calculate_completeness(transformed)
+            quality_score, completeness_score = self._calculate_scores(transformed)
             
             transformed['data_quality_score'] = quality_score
             transformed['completeness_score'] = completeness_score
@@ -360,141 +548,334 @@ class JobDataLoader:
         
         return transformed
     
-    def _calculate_data_quality(self, job_data: Dict[str, Any]) -> float:
-        """Calculate data quality score (0-11) based on field completeness and quality"""
-        score = 0.0
+    def transform_dataframe(self, df: 'pd.DataFrame') -> 'pd.DataFrame':
+        """Column-wise transform_job_data for tabular input; returns one row per job in database format"""
+        n = len(df)
         
-        # Core required fields (weighted scoring)
-        fields_with_weights = [
-            ('profession', 1.0),
-            ('salary', 0.5),  # Often missing in German job postings
-            ('company_name', 1.0),
-            ('location', 1.0),
-            ('start_date', 0.8),
-            ('telephone', 1.0),
-            ('email', 1.0),
-            ('job_description', 1.0),
-            ('ref_nr', 0.8),
-            ('external_link', 0.5),
-            ('application_link', 0.7)
-        ]
+        def column(name: str) -> 'pd.Series':
+            if name in df:
+                return df[name].fillna('').astype(str)
+            return pd.Series('', index=df.index, dtype=object)
         
-        for field_name, weight in fields_with_weights:
-            field_value = job_data.get(field_name)
-            if field_value and str(field_value).strip():
-                field_score = weight
-                
-                # Quality bonuses
-                field_str = str(field_value).strip()
-                
-                # Bonus for longer content (description)
-                if field_name == 'job_description' and len(field_str) > 100:
-                    field_score += 0.2
-                
-                # Penalty for very short important fields
-                if field_name in ['profession', 'company_name'] and len(field_str) < 5:
-                    field_score *= 0.5
-                
+        def non_empty(series: 'pd.Series') -> 'pd.Series':
+            return series.where(series != '', None)
+        
+        out = pd.DataFrame(index=df.index)
+        
+        out['id'] = [uuid.uuid4() for _ in range(n)]
+        
+        for name in CSV_TEXT_FIELDS:
+            text = column(name).str.strip()
+            if self.remove_html:
+                text = text.str.replace(_RE_HTML_TAG, '', regex=True)
+                has_entity = text.str.contains('&', regex=False)
+                text[has_entity] = text[has_entity].map(html.unescape)
+            if self.trim_whitespace:
+                text = text.str.replace(_RE_WS, ' ', regex=True).str.strip()
+            out[name] = non_empty(text)
+        
+        # Same key as generate_content_hash: the cleaned columns, missing -> ''
+        keys = zip(*(out[name] for name in CONTENT_KEY_FIELDS))
+        out['content_hash'] = [hash_content_key(content_key(values)) for values in keys]
+        
+        company = out['company_name'].fillna('')
+        if self.normalize_companies:
+            company = company.str.replace(_RE_ARBEITGEBER, '', regex=True)
+            if self.trim_whitespace:
+                company = company.str.replace(_RE_WS, ' ', regex=True)
+            company = company.str.lower()
+        out['normalized_company'] = non_empty(company.str.strip())
+        
+        email = column('email').str.strip()
+        rejected = (
+            email.str.startswith(('?body=', 'http', 'mailto:')) |
+            email.str.contains('azubi.de', regex=False) |
+            (email.str.len() > 100)
+        )
+        email = email.str.lower()
+        if self.validate_emails:
+            rejected |= ~email.str.match(_RE_EMAIL)
+            rejected |= email.str.startswith('.') | email.str.endswith('.') | email.str.contains('..', regex=False)
+        out['email'] = non_empty(email.mask(rejected, ''))
+        
+        # Phone and date cleanup keep their first-match rules, so they stay per value
+        out['telephone'] = column('telephone').map(self.clean_phone_number)
+        out['start_date'] = column('start_date').map(self.parse_date_string)
+        
+        scraped_at = pd.to_datetime(column('scraped_at'), utc=True, errors='coerce', format='ISO8601')
+        out['scraped_at'] = scraped_at.fillna(pd.Timestamp.now(tz='UTC'))
+        out['captcha_solved'] = column('captcha_solved').str.lower().isin(('true', '1'))
+        out['status'] = 'active'
+        out['is_valid'] = True
+        
+        if self.validate_on_load:
+            score = pd.Series(0.0, index=df.index)
+            filled = 0
+            for name, weight in self._QUALITY_FIELDS:
+                values = out[name].fillna('')
+                present = values != ''
+                field_score = present * weight
+                if name == 'job_description':
+                    field_score += (present & (values.str.len() > 100)) * 0.2
+                elif name in self._SHORT_PENALTY_FIELDS:
+                    field_score = field_score.where(values.str.len() >= 5, field_score * 0.5)
                 score += field_score
+                filled += present
+            
+            out['data_quality_score'] = score.clip(upper=11.0)
+            out['completeness_score'] = filled / len(self._QUALITY_FIELDS)
+            out['is_valid'] = ((out['data_quality_score'] >= self.min_quality_score) &
+                               (out['completeness_score'] >= self.min_completeness))
+        
+        if self.clean_data_on_load:
+            self.stats['data_cleaned'] += n
         
-        return min(score, 11.0)
+        return out
     
-    def _calculate_completeness(self, job_data: Dict[str, Any]) -> float:
-        """Calculate completeness score (0-1) based on required fields"""
-        required_fields = [
-            'profession', 'salary', 'company_name', 'location',
-            'start_date', 'telephone', 'email', 'job_description',
-            'ref_nr', 'external_link', 'application_link'
-        ]
+    # Core required fields (weighted scoring)
+    _QUALITY_FIELDS = (
+        ('profession', 1.0),
+        ('salary', 0.5),  # Often missing in German job postings
+        ('company_name', 1.0),
+        ('location', 1.0),
+        ('start_date', 0.8),
+        ('telephone', 1.0),
+        ('email', 1.0),
+        ('job_description', 1.0),
+        ('ref_nr', 0.8),
+        ('external_link', 0.5),
+        ('application_link', 0.7)
+    )
+    
+    # Important fields whose very short values are penalized
+    _SHORT_PENALTY_FIELDS = frozenset(('profession', 'company_name'))
+    
+    def _calculate_scores(self, job_data: Dict[str, Any]) -> Tuple[float, float]:
+        """Data quality (0-11) and completeness (0-1) scores in one pass over the fields
         
-        completed_fields = sum(
-            1 for field in required_fields 
-            if job_data.get(field) and str(job_data.get(field)).strip()
-        )
+        Expects transformed jobs, whose fields are already strings or None.
+        """
+        score = 0.0
+        completed_fields = 0
+        
+        for field_name, weight in self._QUALITY_FIELDS:
+            field_value = job_data.get(field_name)
+            if not field_value or not (field_value := field_value.strip()):
+                continue
+            completed_fields += 1
+            
+            # Bonus for longer content (description)
+            if field_name == 'job_description':
+                if len(field_value) > 100:
+                    weight += 0.2
+            # Penalty for very short important fields
+            elif len(field_value) < 5 and field_name in self._SHORT_PENALTY_FIELDS:
+                weight *= 0.5
+            
+            score += weight
         
-        return completed_fields / len(required_fields)
+        return min(score, 11.0), completed_fields / len(self._QUALITY_FIELDS)
     
     async def insert_job_batch(self, jobs: List[Dict[str, Any]]) -> Tuple[int, int]:
-        """Insert batch of jobs into database"""
-        inserted_count = 0
+        """Insert batch of valid jobs into database, letting the unique indexes reject duplicates"""
+        new_jobs = []
         duplicate_count = 0
         
-        try:
-            async with self.db_manager.get_transaction() as conn:
-                for job_data in jobs:
+        if not jobs:
+            return 0, 0
+        
+        # Jobs already stored are filtered here so they cost no company upsert;
+        # the unique indexes still catch rows inserted concurrently
+        seen_hashes, seen_refs, seen_urls = await self.fetch_existing_job_keys(jobs)
+        
+        for job_data in jobs:
+            # Seen sets grow as we go, so duplicates within the batch are dropped too
+            ref_nr, source_url = job_data['ref_nr'], job_data['source_url']
+            if (job_data['content_hash'] in seen_hashes or (ref_nr and ref_nr in seen_refs)
+                    or (source_url and source_url in seen_urls)):
+                duplicate_count += 1
+                continue
+            seen_hashes.add(job_data['content_hash'])
+            if ref_nr:
+                seen_refs.add(ref_nr)
+            if source_url:
+                seen_urls.add(source_url)
+            new_jobs.append(job_data)
+        
+        if not new_jobs:
+            return 0, duplicate_count
+        
+        for attempt in range(1, DEADLOCK_RETRIES + 1):
+            try:
+                async with self.db_manager.get_transaction() as conn:
+                    company_ids, companies_created = await self.resolve_company_ids(conn, new_jobs)
+                    for job_data in new_jobs:
+                        job_data['company_id'] = company_ids.get(job_data['normalized_company'])
+                    
+                    records = [tuple(job_data[column] for column in JOB_COLUMNS) for job_data in new_jobs]
+                    failed_count = 0
                     try:
-                        # Skip invalid jobs if validation is enabled
-                        if self.validate_on_load and not job_data.get('is_valid', True):
-                            self.stats['validation_failures'] += 1
-                            logger.debug(f"Skipping invalid job: {job_data.get('ref_nr', 'no-ref')}")
-                            continue
-                        
-                        # Check for duplicates
-                        existing_id = await self.check_duplicate_job(
-                            job_data['content_hash'],
-                            job_data['ref_nr'],
-                            job_data['source_url']
-                        )
-                        
-                        if existing_id:
-                            duplicate_count += 1
-                            logger.debug(f"Duplicate job found: {job_data.get('ref_nr', 'no-ref')}")
-                            continue
-                        
-                        # Find or create company
-                        company_id = await self.find_or_create_company(
-                            job_data['company_name'],
-                            job_data['location']
-                        )
-                        job_data['company_id'] = company_id
-                        
-                        # Insert job
-                        await conn.execute(
-                            """
-                            INSERT INTO jobs (
-                                id, company_id, profession, salary, company_name, location,
-                                start_date, telephone, email, job_description, ref_nr,
-                                external_link, application_link, job_type, ausbildungsberuf,
-                                application_method, contact_person, source_url, scraped_at,
-                                captcha_solved, content_hash, status, is_valid
-                            ) VALUES (
-                                $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13,
-                                $14, $15, $16, $17, $18, $19, $20, $21, $22, $23
-                            )
-                            """,
-                            job_data['id'], job_data['company_id'], job_data['profession'],
-                            job_data['salary'], job_data['company_name'], job_data['location'],
-                            job_data['start_date'], job_data['telephone'], job_data['email'],
-                            job_data['job_description'], job_data['ref_nr'], job_data['external_link'],
-                            job_data['application_link'], job_data['job_type'], job_data['ausbildungsberuf'],
-                            job_data['application_method'], job_data['contact_person'],
-                            job_data['source_url'], job_data['scraped_at'], job_data['captcha_solved'],
-                            job_data['content_hash'], job_data['status'], job_data['is_valid']
-                        )
-                        
-                        inserted_count += 1
-                        logger.debug(f"Inserted job: {job_data.get('profession', 'no-title')} at {job_data.get('company_name', 'no-company')}")
-                        
-                    except Exception as e:
-                        logger.error(f"Error inserting job: {e}")
-                        logger.error(f"Job data: {job_data.get('ref_nr', 'no-ref')}")
-                        logger.error(f"Job ID: {job_data.get('id', 'no-id')}")
-                        logger.error(f"Company ID: {job_data.get('company_id', 'no-company-id')}")
-                        logger.error(f"Status: {job_data.get('status', 'no-status')}")
-                        logger.error(f"Is Valid: {job_data.get('is_valid', 'no-valid-flag')}")
-                        # Log the actual SQL values for debugging
-                        logger.debug(f"Full job data keys: {list(job_data.keys())}")
-                        self.stats['errors'] += 1
-                        continue
-                        
-        except Exception as e:
-            logger.error(f"Batch insert transaction failed: {e}")
-            raise
+                        # Savepoint: a failed batch leaves the outer transaction usable
+                        async with conn.transaction():
+                            inserted = await conn.fetchmany(INSERT_JOB_IGNORE_SQL, records)
+                    except asyncpg.DeadlockDetectedError:
+                        raise
+                    except asyncpg.PostgresError as e:
+                        logger.warning(f"Batch insert failed ({e}), retrying {len(records)} jobs one by one")
+                        inserted, failed_count = await self._insert_jobs_individually(conn, records)
+                break
+            except asyncpg.DeadlockDetectedError as e:
+                # The whole transaction was rolled back, including any companies it created
+                if attempt == DEADLOCK_RETRIES:
+                    logger.error(f"Batch insert transaction failed: {e}")
+                    raise
+                logger.warning(f"Batch insert deadlocked with a concurrent batch, retrying ({attempt}/{DEADLOCK_RETRIES - 1})")
+                await asyncio.sleep(DEADLOCK_BACKOFF * attempt)
+            except Exception as e:
+                logger.error(f"Batch insert transaction failed: {e}")
+                raise
         
+        self.stats['companies_created'] += companies_created
+        self._remember_companies(company_ids)
+        inserted_count = len(inserted)
+        duplicate_count += len(new_jobs) - inserted_count - failed_count
+        logger.debug(f"Inserted {inserted_count} jobs, {duplicate_count} duplicates skipped")
         return inserted_count, duplicate_count
     
-    async def load_single_job(self, job_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Load a single job into database realtime"""
+    def _copy_chunks(self, records: List[tuple]):
+        """Split COPY records at copy_batch_size rows or COPY_MAX_BYTES of text"""
+        chunk = []
+        chunk_bytes = 0
+        for record in records:
+            record_bytes = sum(len(value) for value in record if isinstance(value, str))
+            if chunk and (len(chunk) >= self.copy_batch_size or chunk_bytes + record_bytes > COPY_MAX_BYTES):
+                yield chunk
+                chunk = []
+                chunk_bytes = 0
+            chunk.append(record)
+            chunk_bytes += record_bytes
+        if chunk:
+            yield chunk
+    
+    async def _insert_jobs_individually(self, conn, records: List[tuple]) -> Tuple[List[Any], int]:
+        """Insert rows one savepoint at a time so a bad row only costs itself; returns (inserted, failed)"""
+        inserted = []
+        failed_count = 0
+        for record in records:
+            try:
+                async with conn.transaction():
+                    row = await conn.fetchrow(INSERT_JOB_IGNORE_SQL, *record)
+            except asyncpg.UniqueViolationError:
+                # Another loader stored the same ref_nr/source_url first: a duplicate, not a failure
+                continue
+            except asyncpg.PostgresError as e:
+                logger.error(f"Error inserting job {record[JOB_COLUMNS.index('ref_nr')] or 'no-ref'}: {e}")
+                self.stats['errors'] += 1
+                failed_count += 1
+                continue
+            if row:
+                inserted.append(row)
+        return inserted, failed_count
+    
+    async def load_jobs_batch(self, raw_jobs: List[Dict[str, Any]]) -> int:
+        """Transform a batch of scraped jobs and bulk-load the new ones in one round trip"""
+        if not self.db_manager.is_connected and not await self.db_manager.connect():
+            logger.error("Failed to connect to database")
+            return 0
+        
+        jobs = []
+        for raw_job in raw_jobs:
+            try:
+                job_data = self.transform_job_data(raw_job)
+            except Exception as e:
+                logger.error(f"Error transforming job data: {e}")
+                self.stats['errors'] += 1
+                continue
+            if self.validate_on_load and not job_data.get('is_valid', True):
+                self.stats['validation_failures'] += 1
+                continue
+            jobs.append(job_data)
+        
+        self.stats['total_processed'] += len(raw_jobs)
+        if not jobs:
+            return 0
+        
+        self._active_loads += 1
+        try:
+            return await self._bulk_load_jobs(jobs)
+        finally:
+            self._end_load()
+    
+    async def _bulk_load_jobs(self, jobs: List[Dict[str, Any]]) -> int:
+        """COPY/executemany the transformed jobs that are not stored yet; returns rows loaded"""
+        # One duplicate query for the whole batch (COPY would abort on a conflicting row)
+        seen_hashes, seen_refs, seen_urls = await self.fetch_existing_job_keys(jobs)
+        
+        new_jobs = []
+        for job_data in jobs:
+            # Empty keys never count: stored rows with a NULL ref_nr put None in seen_refs
+            ref_nr, source_url = job_data['ref_nr'], job_data['source_url']
+            if (job_data['content_hash'] in seen_hashes or (ref_nr and ref_nr in seen_refs)
+                    or (source_url and source_url in seen_urls)):
+                self.stats['duplicates_found'] += 1
+                continue
+            # Also dedupe within the batch itself
+            seen_hashes.add(job_data['content_hash'])
+            if ref_nr:
+                seen_refs.add(ref_nr)
+            if source_url:
+                seen_urls.add(source_url)
+            new_jobs.append(job_data)
+        
+        if not new_jobs:
+            logger.info(f"Bulk loaded 0 jobs ({len(jobs)} duplicates skipped)")
+            return 0
+        
+        async with self.db_manager.get_connection() as conn:
+            company_ids, companies_created = await self.resolve_company_ids(conn, new_jobs)
+        self.stats['companies_created'] += companies_created
+        self._remember_companies(company_ids)
+        for job_data in new_jobs:
+            job_data['company_id'] = company_ids.get(job_data['normalized_company'])
+        
+        # Each COPY chunk (or the single executemany) commits on its own and is all-or-nothing
+        records = [tuple(job_data[column] for column in JOB_COLUMNS) for job_data in new_jobs]
+        use_copy = len(records) >= COPY_MIN_ROWS
+        chunks = list(self._copy_chunks(records)) if use_copy else [records]
+        loaded_count = 0
+        for chunk_number, chunk in enumerate(chunks, 1):
+            try:
+                if use_copy:
+                    await self.db_manager.copy_records('jobs', JOB_COLUMNS, chunk)
+                else:
+                    await self.db_manager.execute_many(INSERT_JOB_SQL, chunk)
+            except asyncpg.PostgresError as e:
+                logger.warning(f"Chunk {chunk_number}/{len(chunks)} failed ({e}); "
+                               f"{chunk_number - 1} chunk(s) with {loaded_count} jobs already committed, "
+                               f"retrying {len(chunk)} jobs one by one")
+            else:
+                loaded_count += len(chunk)
+                continue
+            
+            try:
+                # Same savepoint-per-row fallback as insert_job_batch
+                async with self.db_manager.get_transaction() as conn:
+                    inserted, failed_count = await self._insert_jobs_individually(conn, chunk)
+            except Exception as e:
+                not_loaded = sum(len(rest) for rest in chunks[chunk_number - 1:])
+                logger.error(f"Bulk load stopped at chunk {chunk_number}/{len(chunks)}: {e}; "
+                             f"{loaded_count} jobs committed, {not_loaded} not loaded")
+                self.stats['errors'] += not_loaded
+                break
+            loaded_count += len(inserted)
+            self.stats['duplicates_found'] += len(chunk) - len(inserted) - failed_count
+        
+        self.stats['inserted'] += loaded_count
+        logger.info(f"Bulk loaded {loaded_count} jobs ({len(jobs) - len(new_jobs)} duplicates skipped)")
+        return loaded_count
+    
+    async def load_single_job(self, job_data: Dict[str, Any], stats: Dict[str, int] = None) -> Dict[str, Any]:
+        """Load a single job into database realtime (stats, if given, receives this load's counts)"""
         try:
             # Ensure database connection
             if not self.db_manager.is_connected:
@@ -505,7 +886,7 @@ class JobDataLoader:
                     return {'loaded': 0, 'error': 'Database connection failed'}
             
             # Process single job as list
-            result = await self.process_job_data([job_data], source_file="realtime")
+            result = await self.process_job_data([job_data], source_file="realtime", stats=stats)
             return {'loaded': 1 if result else 0, 'job_id': job_data.get('ref_nr', 'unknown')}
         except Exception as e:
             logger.error(f"Error loading single job: {e}")
@@ -516,8 +897,17 @@ class JobDataLoader:
         try:
             logger.info(f"Loading data from JSON file: {file_path}")
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                raw_jobs = json.load(f)
+            if IJSON_AVAILABLE and os.path.getsize(file_path) > JSON_STREAM_MIN_BYTES:
+                # Stream the top-level array so memory stays at one batch
+                with open(file_path, 'rb') as f:
+                    return await self.process_job_data(
+                        ijson.items(f, 'item', use_float=True), source_file=file_path
+                    )
+            
+            # Typical batch files fit in memory; one orjson parse is fastest for them
+            with open(file_path, 'rb') as f:
+                data = f.read()
+            raw_jobs = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
             
             if not isinstance(raw_jobs, list):
                 logger.error(f"JSON file must contain a list of jobs")
@@ -534,17 +924,96 @@ class JobDataLoader:
         try:
             logger.info(f"Loading data from CSV file: {file_path}")
             
-            df = pd.read_csv(file_path)
-            raw_jobs = df.to_dict('records')
+            if not PANDAS_AVAILABLE:
+                logger.error("pandas is required to load CSV files")
+                return False
             
-            return await self.process_job_data(raw_jobs, source_file=file_path)
+            # Read everything as text so ref_nr/phone numbers keep their leading zeros
+            df = pd.read_csv(file_path, dtype=str, engine='pyarrow' if PYARROW_AVAILABLE else 'c')
+            jobs = self.transform_dataframe(df)
+            
+            # Records are built one batch at a time rather than for the whole file up front
+            batches = (
+                jobs.iloc[i:i + self.batch_size].to_dict('records')
+                for i in range(0, len(jobs), self.batch_size)
+            )
+            return await self.process_job_data(
+                itertools.chain.from_iterable(batches), source_file=file_path, transformed=True
+            )
             
         except Exception as e:
             logger.error(f"Error loading CSV file {file_path}: {e}")
             return False
     
-    async def process_job_data(self, raw_jobs: List[Dict[str, Any]], source_file: str = None) -> bool:
-        """Process and load job data into database"""
+    def _transform_batch(self, raw_batch: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], int]:
+        """Transform a batch of raw jobs; returns (jobs, number of rows that failed)"""
+        batch = []
+        errors = 0
+        for raw_job in raw_batch:
+            try:
+                batch.append(self.transform_job_data(raw_job))
+            except Exception as e:
+                logger.error(f"Error transforming job data: {e}")
+                errors += 1
+        return batch, errors
+    
+    async def _transformed_batches(self, raw_jobs: Iterable[Dict[str, Any]], transformed: bool):
+        """Yield (raw row count, transformed batch) in batch_size chunks of the input"""
+        # Consume the input in batches so streamed files never sit fully in memory
+        raw_jobs = iter(raw_jobs)
+        next_batch = lambda: list(itertools.islice(raw_jobs, self.batch_size))
+        
+        # Read ahead up to the parallel threshold to find out whether workers pay off
+        head = []
+        head_rows = 0
+        parallel = not transformed and self.transform_workers > 1
+        while parallel and head_rows < self.transform_parallel_min_rows:
+            raw_batch = next_batch()
+            if not raw_batch:
+                parallel = False
+                break
+            head.append(raw_batch)
+            head_rows += len(raw_batch)
+        batches = itertools.chain(head, iter(next_batch, []))
+        
+        if not parallel:
+            # Nothing to parallelize (or too little input to pay for worker start-up)
+            for raw_batch in batches:
+                if transformed:
+                    yield len(raw_batch), raw_batch
+                else:
+                    batch, errors = self._transform_batch(raw_batch)
+                    self.stats['errors'] += errors
+                    yield len(raw_batch), batch
+            return
+        
+        # CPU-bound cleaning runs in worker processes while this task writes earlier batches.
+        # spawn, not fork: this process holds a running event loop and an open asyncpg pool
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(max_workers=self.transform_workers,
+                                 mp_context=multiprocessing.get_context('spawn'),
+                                 initializer=_init_transform_worker) as pool:
+            pending = collections.deque()
+            raw_batch = next(batches, None)
+            while raw_batch or pending:
+                while raw_batch and len(pending) < self.transform_workers:
+                    pending.append((len(raw_batch), loop.run_in_executor(pool, transform_job_batch, raw_batch)))
+                    raw_batch = next(batches, None)
+                raw_count, future = pending.popleft()
+                batch, errors = await future
+                self.stats['errors'] += errors
+                if self.clean_data_on_load:
+                    self.stats['data_cleaned'] += len(batch)
+                yield raw_count, batch
+    
+    async def process_job_data(self, raw_jobs: Iterable[Dict[str, Any]], source_file: str = None,
+                               transformed: bool = False, stats: Dict[str, int] = None) -> bool:
+        """Process and load job data into database, one batch at a time (transformed=True skips transform_job_data)
+        
+        Totals are added to self.stats, which concurrent loads share; pass a dict as
+        stats to also get this call's own counts.
+        """
+        self._active_loads += 1
         try:
             # Ensure database connection
             if not self.db_manager.is_connected:
@@ -554,52 +1023,87 @@ class JobDataLoader:
                     logger.error("Failed to connect to database")
                     return False
             
-            total_jobs = len(raw_jobs)
-            logger.info(f"Processing {total_jobs} jobs from {source_file or 'data'}")
-            
-            # Transform data
-            transformed_jobs = []
-            for raw_job in raw_jobs:
-                try:
-                    transformed_job = self.transform_job_data(raw_job)
-                    transformed_jobs.append(transformed_job)
-                except Exception as e:
-                    logger.error(f"Error transforming job data: {e}")
-                    self.stats['errors'] += 1
-                    continue
+            logger.info(f"Processing jobs from {source_file or 'data'}")
             
-            logger.info(f"Transformed {len(transformed_jobs)} jobs successfully")
+            total_jobs = 0
+            total_transformed = 0
+            total_invalid = 0
+            batch_number = 0
             
-            # Insert in batches
-            total_inserted = 0
-            total_duplicates = 0
+            # Inserts run as tasks so parsing/transforming the next batch overlaps the
+            # database writes; the semaphore bounds in-flight batches (and memory)
+            semaphore = asyncio.Semaphore(self.insert_concurrency)
+            tasks = []
             
-            for i in range(0, len(transformed_jobs), self.batch_size):
-                batch = transformed_jobs[i:i + self.batch_size]
-                
+            async def insert_batch(batch_number: int, batch: List[Dict[str, Any]]) -> Tuple[int, int]:
                 try:
                     inserted, duplicates = await self.insert_job_batch(batch)
-                    total_inserted += inserted
-                    total_duplicates += duplicates
-                    
-                    logger.info(f"Batch {i//self.batch_size + 1}: {inserted} inserted, {duplicates} duplicates")
-                    
+                    logger.info(f"Batch {batch_number}: {inserted} inserted, {duplicates} duplicates")
+                    return inserted, duplicates
                 except Exception as e:
                     logger.error(f"Batch insert failed: {e}")
                     self.stats['errors'] += len(batch)
-                    continue
+                    return 0, 0
+                finally:
+                    semaphore.release()
             
-            # Update statistics
-            self.stats['total_processed'] = len(transformed_jobs)
-            self.stats['inserted'] = total_inserted
-            self.stats['duplicates_found'] = total_duplicates
+            try:
+                async for raw_count, batch in self._transformed_batches(raw_jobs, transformed):
+                    batch_number += 1
+                    total_jobs += raw_count
+                    total_transformed += len(batch)
+                    
+                    # Invalid jobs never reach the database code
+                    if self.validate_on_load:
+                        valid_jobs = [job_data for job_data in batch if job_data.get('is_valid', True)]
+                        total_invalid += len(batch) - len(valid_jobs)
+                        batch = valid_jobs
+                    if not batch:
+                        continue
+                    
+                    await semaphore.acquire()
+                    tasks.append(asyncio.create_task(insert_batch(batch_number, batch)))
+                
+                results = await asyncio.gather(*tasks)
+            finally:
+                # If the source raised (or we were cancelled), stop in-flight inserts
+                # and wait for them to roll back instead of leaving them orphaned
+                pending = [task for task in tasks if not task.done()]
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+            total_inserted = sum(inserted for inserted, _ in results)
+            total_duplicates = sum(duplicates for _, duplicates in results)
+            
+            if not total_jobs:
+                logger.warning(f"No jobs found in {source_file or 'data'}")
             
-            logger.info(f"Data loading completed: {total_inserted} inserted, {total_duplicates} duplicates, {self.stats['errors']} errors")
+            # Add this load's totals instead of overwriting those of concurrent loads
+            load_stats = {
+                'total_processed': total_transformed,
+                'inserted': total_inserted,
+                'duplicates_found': total_duplicates,
+                'validation_failures': total_invalid
+            }
+            for key, value in load_stats.items():
+                self.stats[key] += value
+            if stats is not None:
+                stats.update(load_stats)
+            
+            logger.info(f"Data loading completed: {total_jobs} read, {total_inserted} inserted, {total_duplicates} duplicates, {self.stats['errors']} errors")
             return True
             
         except Exception as e:
             logger.error(f"Error processing job data: {e}")
             return False
+        finally:
+            self._end_load()
+    
+    def _end_load(self):
+        """Forget cached company ids once no load is running (concurrent loads share the cache)"""
+        self._active_loads -= 1
+        if not self._active_loads:
+            self._company_cache.clear()
     
     async def load_batch_files(self, data_dir: str) -> bool:
         """Load all batch JSON files from data directory"""
@@ -648,7 +1152,7 @@ class JobDataLoader:
                 ) VALUES ($1, $2, $3, $4, $5, $6)
                 """,
                 session_id, session_name, 'completed', 
-                json.dumps(config or {}), self.stats['inserted'], self.stats['total_processed']
+                config or {}, self.stats['inserted'], self.stats['total_processed']
             )
             
             return session_id
@@ -673,6 +1177,7 @@ class JobDataLoader:
         # Add configuration info
         base_stats['configuration'] = {
             'batch_size': self.batch_size,
+            'copy_batch_size': self.copy_batch_size,
             'validation_enabled': self.validate_on_load,
             'data_cleaning_enabled': self.clean_data_on_load,
             'min_quality_score': self.min_quality_score,
@@ -692,6 +1197,19 @@ class JobDataLoader:
         
         return base_stats
 
+# Per-process loader used by transform_job_batch in pool workers
+_worker_loader = None
+
+def _init_transform_worker():
+    """Process-pool initializer: build the worker's loader once, without repeating its init log"""
+    global _worker_loader
+    logger.setLevel(logging.WARNING)
+    _worker_loader = JobDataLoader()
+
+def transform_job_batch(raw_jobs: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], int]:
+    """Process-pool entry point: transform a batch with this process's own JobDataLoader"""
+    return _worker_loader._transform_batch(raw_jobs)
+
 # Convenience functions
 async def load_job_data_from_json(file_path: str) -> bool:
     """Load job data from JSON file"""
@@ -767,4 +1285,12 @@ async def main():
         logger.error("L Data loading failed")
 
 if __name__ == "__main__":
+    # uvloop is optional (not available on Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
+    init_runtime()
     asyncio.run(main())
\ No newline at end of file
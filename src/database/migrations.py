@@ -0,0 +1,121 @@
+"""
+Data migrations for databases created by older versions of schema.sql
+schema.sql only describes the current schema idempotently; changes that have to
+rewrite existing rows live here and run before schema.sql is (re)applied
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+COLUMN_TYPE_SQL = """
+    SELECT data_type FROM information_schema.columns
+    WHERE table_schema = current_schema() AND table_name = $1 AND column_name = $2
+"""
+
+INDEX_NAMES_SQL = "SELECT indexname FROM pg_indexes WHERE schemaname = current_schema() AND tablename = $1"
+
+DUPLICATE_KEYS_SQL = """
+    SELECT COUNT(*) FROM (
+        SELECT 1 FROM jobs WHERE {column} IS NOT NULL GROUP BY {column} HAVING COUNT(*) > 1
+    ) AS duplicates
+"""
+
+# Keeps the first-scraped row of each key, like the loader skipping later duplicates;
+# rows without scraped_at sort first so they are compared too
+DELETE_DUPLICATES_SQL = """
+    DELETE FROM jobs j USING jobs k
+    WHERE j.{column} = k.{column}
+      AND (COALESCE(k.scraped_at, '-infinity'), k.id) < (COALESCE(j.scraped_at, '-infinity'), j.id)
+"""
+
+# Columns that got a unique index in schema.sql, replacing the plain idx_jobs_* index
+UNIQUE_JOB_KEYS = ('ref_nr', 'content_hash')
+
+class MigrationError(RuntimeError):
+    """A migration cannot run without a decision from the operator"""
+
+# Views that select j.* pin the column type; schema.sql recreates them afterwards
+CONTENT_HASH_VIEWS = ('data_quality_summary', 'jobs_complete')
+
+async def migrate_content_hash_bytea(conn) -> bool:
+    """Convert jobs.content_hash from hex text to BYTEA and rehash every row
+
+    The old sha256 hex digests can never equal the loader's 16-byte blake2b keys,
+    so they are discarded and recomputed from the stored key columns.
+    Returns True if the table needed converting.
+    """
+    from .data_loader import CONTENT_KEY_FIELDS, content_key, hash_content_key
+
+    data_type = await conn.fetchval(COLUMN_TYPE_SQL, 'jobs', 'content_hash')
+    if data_type is None or data_type == 'bytea':
+        return False
+
+    await conn.execute(f"DROP VIEW IF EXISTS {', '.join(CONTENT_HASH_VIEWS)}")
+    await conn.execute("ALTER TABLE jobs ALTER COLUMN content_hash TYPE BYTEA USING NULL")
+
+    rows = await conn.fetch(f"SELECT id, {', '.join(CONTENT_KEY_FIELDS)} FROM jobs")
+    await conn.executemany(
+        "UPDATE jobs SET content_hash = $2 WHERE id = $1",
+        [(row['id'], hash_content_key(content_key(row[field] for field in CONTENT_KEY_FIELDS)))
+         for row in rows]
+    )
+
+    logger.info(f"Migrated jobs.content_hash to BYTEA, rehashed {len(rows)} jobs")
+    return True
+
+async def prepare_unique_job_keys(conn, dedupe_jobs: bool = False) -> bool:
+    """Check ref_nr/content_hash are unique and drop the superseded plain indexes
+
+    schema.sql can only build uq_jobs_ref_nr/uq_jobs_content_hash once each key is
+    unique. Duplicates are only deleted when the operator opted in with dedupe_jobs;
+    otherwise the migration stops with MigrationError.
+    Returns True if anything was changed.
+    """
+    if await conn.fetchval("SELECT to_regclass('jobs')") is None:
+        return False
+
+    indexes = {row['indexname'] for row in await conn.fetch(INDEX_NAMES_SQL, 'jobs')}
+    changed = False
+    if dedupe_jobs:
+        changed = await delete_duplicate_jobs(conn) > 0
+    for column in UNIQUE_JOB_KEYS:
+        if f"uq_jobs_{column}" in indexes:
+            continue
+        duplicates = await conn.fetchval(DUPLICATE_KEYS_SQL.format(column=column))
+        if duplicates:
+            raise MigrationError(
+                f"[ERROR] {duplicates} {column} values occur in more than one job, so "
+                f"uq_jobs_{column} cannot be created. Review them, then run "
+                "python scripts/setup_database.py --dedupe-jobs to keep the first-scraped "
+                "row of each and delete the rest."
+            )
+
+    for column in UNIQUE_JOB_KEYS:
+        if f"idx_jobs_{column}" in indexes:
+            await conn.execute(f"DROP INDEX idx_jobs_{column}")
+            changed = True
+    return changed
+
+async def delete_duplicate_jobs(conn) -> int:
+    """Delete all but the first-scraped job per ref_nr/content_hash (explicit opt-in); returns rows deleted"""
+    deleted = 0
+    for column in UNIQUE_JOB_KEYS:
+        status = await conn.execute(DELETE_DUPLICATES_SQL.format(column=column))
+        count = int(status.split()[-1])
+        if count:
+            logger.warning(f"Deleted {count} jobs with a duplicate {column}")
+        deleted += count
+    return deleted
+
+async def run_migrations(conn, dedupe_jobs: bool = False) -> int:
+    """Apply every pending migration on conn (call inside a transaction); returns how many ran
+
+    The content_hash rewrite comes first so duplicates are judged on the new hashes.
+    """
+    applied = 0
+    if await migrate_content_hash_bytea(conn):
+        applied += 1
+    if await prepare_unique_job_keys(conn, dedupe_jobs=dedupe_jobs):
+        applied += 1
+    return applied
@@ -75,7 +75,7 @@ CREATE TABLE IF NOT EXISTS jobs (
     validation_errors TEXT[],                       -- Array of validation error messages
     
     -- Deduplication
-    content_hash VARCHAR(64),                       -- Hash for duplicate detection
+    content_hash BYTEA,                             -- 16-byte blake2b digest for duplicate detection
     
     -- Indexes and constraints
     CONSTRAINT unique_source_url UNIQUE(source_url)
@@ -86,11 +86,11 @@ CREATE INDEX IF NOT EXISTS idx_jobs_profession ON jobs(profession);
 CREATE INDEX IF NOT EXISTS idx_jobs_company_name ON jobs(company_name);
 CREATE INDEX IF NOT EXISTS idx_jobs_location ON jobs(location);
 CREATE INDEX IF NOT EXISTS idx_jobs_scraped_at ON jobs(scraped_at DESC);
-CREATE INDEX IF NOT EXISTS idx_jobs_ref_nr ON jobs(ref_nr);
+CREATE UNIQUE INDEX IF NOT EXISTS uq_jobs_ref_nr ON jobs(ref_nr);
 CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status);
 CREATE INDEX IF NOT EXISTS idx_jobs_salary ON jobs(salary) WHERE salary IS NOT NULL;
 CREATE INDEX IF NOT EXISTS idx_jobs_email ON jobs(email) WHERE email IS NOT NULL;
-CREATE INDEX IF NOT EXISTS idx_jobs_content_hash ON jobs(content_hash);
+CREATE UNIQUE INDEX IF NOT EXISTS uq_jobs_content_hash ON jobs(content_hash);
 
 -- Composite indexes for common queries
 CREATE INDEX IF NOT EXISTS idx_jobs_company_location ON jobs(company_name, location);
@@ -395,4 +395,8 @@ CREATE TABLE IF NOT EXISTS schema_version (
 
 INSERT INTO schema_version (version, description) 
 VALUES ('1.0.0', 'Initial schema with jobs, companies, contacts, sessions and quality metrics')
+ON CONFLICT (version) DO NOTHING;
+
+INSERT INTO schema_version (version, description)
+VALUES ('1.1.0', 'jobs.content_hash stored as BYTEA')
 ON CONFLICT (version) DO NOTHING;
\ No newline at end of file
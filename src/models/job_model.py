@@ -6,17 +6,42 @@ Ensures data quality and consistency before database insertion
 
 import re
 import uuid
+import string
+import functools
+import itertools
+from concurrent.futures import ProcessPoolExecutor
 import logging
 from datetime import datetime, date
 from typing import Dict, Any, List, Optional, Union, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 import hashlib
-from urllib.parse import urlparse
 import json
 
 logger = logging.getLogger(__name__)
 
+def _hash_content(content: bytes) -> str:
+    """Hex digest for duplicate detection; only needs to be stable, so a 16-byte blake2b"""
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+# Validation/cleaning patterns, compiled once for per-job validation
+_PHONE_RES = (
+    re.compile(r'^\+49\s*\(?\d+\)?\s*\d+[-\s]?\d+'),  # +49 format
+    re.compile(r'^0\d+\s*\d+[-\s]?\d+'),              # 0 format
+    re.compile(r'^\d{3,}-?\d{3,}-?\d{3,}')            # Generic format
+)
+_DATE_RES = (
+    re.compile(r'\d{1,2}\.\d{1,2}\.\d{4}'),    # DD.MM.YYYY
+    re.compile(r'\d{4}-\d{1,2}-\d{1,2}'),      # YYYY-MM-DD
+    re.compile(r'ab\s+\d{1,2}\.\d{1,2}\.\d{4}'),  # ab DD.MM.YYYY
+)
+_TZ_SUFFIX_RE = re.compile(r'[+\-]\d{2}:?\d{2}$')
+_DT_RE = re.compile(r'^(\d{4})-(\d{2})-(\d{2})(?:[T ](\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6}))?)?$')
+_WS_RE = re.compile(r'\s+')
+_ARBEITGEBER_RE = re.compile(r'^Arbeitgeber:\s*', re.IGNORECASE)
+_PHONE_STRIP_RE = re.compile(r'[^\d+\(\)\-\s]')
+_URL_RE = re.compile(r'^[a-zA-Z][a-zA-Z0-9+.\-]*://[^\s/?#]+')  # scheme and netloc present
+
 class JobStatus(Enum):
     """Job status enumeration"""
     ACTIVE = "active"
@@ -41,7 +66,66 @@ class ValidationLevel(Enum):
     MODERATE = "moderate"  # Most required fields must be valid
     LENIENT = "lenient"   # Basic validation only
 
-@dataclass
+# Characters allowed by the classic local@domain.tld email check
+_TLD_OK = frozenset(string.ascii_letters)
+_DOMAIN_OK = frozenset(string.ascii_letters + string.digits + '.-')
+_LOCAL_OK = _DOMAIN_OK | frozenset('_%+')
+
+def _is_valid_email(email: str) -> bool:
+    """Linear check equivalent to ^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\\.[a-zA-Z]{2,}$ (no backtracking)"""
+    local, at, domain = email.partition('@')
+    if not at or not local or not _LOCAL_OK.issuperset(local):
+        return False
+    # The TLD holds letters only, so it must follow the last dot
+    host, dot, tld = domain.rpartition('.')
+    return (bool(dot) and bool(host) and len(tld) >= 2
+            and _DOMAIN_OK.issuperset(host) and _TLD_OK.issuperset(tld))
+
+# Common datetime formats
+_DT_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S.%f",      # ISO format with microseconds
+    "%Y-%m-%dT%H:%M:%S",         # ISO format
+    "%Y-%m-%d %H:%M:%S",         # Standard format
+    "%Y-%m-%d",                  # Date only
+)
+
+@functools.lru_cache(maxsize=4096)
+def _parse_datetime_string(dt_string: str) -> Optional[datetime]:
+    """Parse a datetime string (timezone suffix ignored); None if no format fits
+    
+    Cached because scraped batches repeat the same timestamps; datetimes are
+    immutable, so sharing results is safe.
+    """
+    # Remove timezone info for parsing
+    dt_string = _TZ_SUFFIX_RE.sub('', dt_string)
+    dt_string = dt_string.replace('Z', '')
+    
+    # Fast path: the ISO-like formats in one match and one constructor call
+    match = _DT_RE.match(dt_string)
+    if match:
+        year, month, day, hour, minute, second, fraction = match.groups()
+        try:
+            return datetime(
+                int(year), int(month), int(day),
+                int(hour or 0), int(minute or 0), int(second or 0),
+                int(fraction.ljust(6, '0')) if fraction else 0
+            )
+        except ValueError:
+            pass
+    
+    for fmt in _DT_FORMATS:
+        try:
+            return datetime.strptime(dt_string, fmt)
+        except ValueError:
+            continue
+    return None
+
+@functools.lru_cache(maxsize=4096)
+def _is_known_date_format(date_string: str) -> bool:
+    """Whether a start_date contains one of the common German date formats"""
+    return any(pattern.search(date_string) for pattern in _DATE_RES)
+
+@dataclass(slots=True)
 class ValidationResult:
     """Result of data validation"""
     is_valid: bool
@@ -50,7 +134,7 @@ class ValidationResult:
     quality_score: float = 0.0
     completeness_score: float = 0.0
 
-@dataclass
+@dataclass(slots=True)
 class JobModel:
     """
     Job data model representing a single job posting
@@ -120,39 +204,20 @@ class JobModel:
         if not dt_string:
             return datetime.utcnow()
         
-        # Common datetime formats
-        formats = [
-            "%Y-%m-%dT%H:%M:%S.%f",      # ISO format with microseconds
-            "%Y-%m-%dT%H:%M:%S",         # ISO format
-            "%Y-%m-%d %H:%M:%S",         # Standard format
-            "%Y-%m-%d",                  # Date only
-        ]
-        
-        # Remove timezone info for parsing
-        dt_string = re.sub(r'[+\-]\d{2}:?\d{2}$', '', dt_string)
-        dt_string = dt_string.replace('Z', '')
-        
-        for fmt in formats:
-            try:
-                return datetime.strptime(dt_string, fmt)
-            except ValueError:
-                continue
-        
-        logger.warning(f"Could not parse datetime: {dt_string}")
-        return datetime.utcnow()
+        parsed = _parse_datetime_string(dt_string)
+        if parsed is None:
+            logger.warning(f"Could not parse datetime: {dt_string}")
+            return datetime.utcnow()
+        return parsed
     
     def _generate_content_hash(self) -> str:
         """Generate content hash for duplicate detection"""
-        content_fields = [
-            str(self.profession or ''),
-            str(self.company_name or ''),
-            str(self.location or ''),
-            str(self.ref_nr or ''),
-            str(self.source_url or '')
-        ]
-        
-        content_string = '|'.join(content_fields).lower().strip()
-        return hashlib.sha256(content_string.encode()).hexdigest()
+        # One f-string builds the key without the intermediate list and str() calls
+        content_string = (
+            f"{self.profession or ''}|{self.company_name or ''}|{self.location or ''}"
+            f"|{self.ref_nr or ''}|{self.source_url or ''}"
+        )
+        return _hash_content(content_string.lower().strip().encode())
     
     def validate(self, level: ValidationLevel = ValidationLevel.MODERATE) -> ValidationResult:
         """Validate job data according to specified level"""
@@ -178,8 +243,7 @@ class JobModel:
         self._validate_text_fields(result)
         
         # Calculate quality scores
-        result.completeness_score = self._calculate_completeness_score()
-        result.quality_score = self._calculate_quality_score()
+        result.completeness_score, result.quality_score = self._compute_scores()
         
         # Set validation level specific rules
         if level == ValidationLevel.STRICT:
@@ -203,8 +267,7 @@ class JobModel:
     def _validate_email(self, result: ValidationResult):
         """Validate email format"""
         if self.email:
-            email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-            if not re.match(email_pattern, self.email.strip().lower()):
+            if not _is_valid_email(self.email.strip().lower()):
                 result.errors.append(f"Invalid email format: {self.email}")
     
     def _validate_telephone(self, result: ValidationResult):
@@ -212,13 +275,10 @@ class JobModel:
         if self.telephone:
             phone = self.telephone.strip()
             # German phone number patterns
-            valid_patterns = [
-                r'^\+49\s*\(?\d+\)?\s*\d+[-\s]?\d+',  # +49 format
-                r'^0\d+\s*\d+[-\s]?\d+',              # 0 format
-                r'^\d{3,}-?\d{3,}-?\d{3,}'            # Generic format
-            ]
-            
-            if not any(re.match(pattern, phone) for pattern in valid_patterns):
+            for pattern in _PHONE_RES:
+                if pattern.match(phone):
+                    break
+            else:
                 result.warnings.append(f"Unusual telephone format: {self.telephone}")
     
     def _validate_urls(self, result: ValidationResult):
@@ -230,25 +290,14 @@ class JobModel:
         ]
         
         for field_name, url in urls_to_check:
-            if url:
-                try:
-                    parsed = urlparse(url)
-                    if not parsed.scheme or not parsed.netloc:
-                        result.errors.append(f"Invalid URL format in {field_name}: {url}")
-                except Exception:
-                    result.errors.append(f"Invalid URL in {field_name}: {url}")
+            if url and not _URL_RE.match(url):
+                result.errors.append(f"Invalid URL format in {field_name}: {url}")
     
     def _validate_dates(self, result: ValidationResult):
         """Validate date fields"""
         if self.start_date:
             # Try to parse common German date formats
-            date_patterns = [
-                r'\d{1,2}\.\d{1,2}\.\d{4}',    # DD.MM.YYYY
-                r'\d{4}-\d{1,2}-\d{1,2}',      # YYYY-MM-DD
-                r'ab\s+\d{1,2}\.\d{1,2}\.\d{4}',  # ab DD.MM.YYYY
-            ]
-            
-            if not any(re.search(pattern, self.start_date) for pattern in date_patterns):
+            if not _is_known_date_format(self.start_date):
                 result.warnings.append(f"Unusual date format: {self.start_date}")
     
     def _validate_text_fields(self, result: ValidationResult):
@@ -270,53 +319,44 @@ class JobModel:
                 if '<' in field_value and '>' in field_value:
                     result.warnings.append(f"{field_name} may contain HTML: {field_value[:50]}...")
     
-    def _calculate_completeness_score(self) -> float:
-        """Calculate data completeness score (0-1)"""
-        required_fields = [
-            self.profession, self.salary, self.company_name, self.location,
-            self.start_date, self.telephone, self.email, self.job_description,
-            self.ref_nr, self.external_link, self.application_link
-        ]
-        
-        completed_fields = sum(1 for field in required_fields if field and str(field).strip())
-        return completed_fields / len(required_fields)
-    
-    def _calculate_quality_score(self) -> float:
-        """Calculate overall data quality score (0-11)"""
-        score = 0
-        
+    def _compute_scores(self) -> Tuple[float, float]:
+        """Completeness (0-1) and data quality (0-11) scores in one pass over the 11 required fields"""
         # Score each required field
-        fields_with_weights = [
-            (self.profession, 1.0),
-            (self.salary, 0.5),  # Often missing in German job postings
-            (self.company_name, 1.0),
-            (self.location, 1.0),
-            (self.start_date, 0.8),
-            (self.telephone, 1.0),
-            (self.email, 1.0),
-            (self.job_description, 1.0),
-            (self.ref_nr, 0.8),
-            (self.external_link, 0.5),
-            (self.application_link, 0.7)
-        ]
+        fields_with_weights = (
+            ('profession', self.profession, 1.0),
+            ('salary', self.salary, 0.5),  # Often missing in German job postings
+            ('company_name', self.company_name, 1.0),
+            ('location', self.location, 1.0),
+            ('start_date', self.start_date, 0.8),
+            ('telephone', self.telephone, 1.0),
+            ('email', self.email, 1.0),
+            ('job_description', self.job_description, 1.0),
+            ('ref_nr', self.ref_nr, 0.8),
+            ('external_link', self.external_link, 0.5),
+            ('application_link', self.application_link, 0.7)
+        )
         
-        for field_value, weight in fields_with_weights:
-            if field_value and str(field_value).strip():
-                # Additional quality checks
-                field_str = str(field_value).strip()
-                field_score = weight
-                
-                # Bonus for longer content (for description)
-                if field_value == self.job_description and len(field_str) > 100:
-                    field_score += 0.2
-                
-                # Penalty for very short important fields
-                if field_value in [self.profession, self.company_name] and len(field_str) < 5:
-                    field_score *= 0.5
-                
-                score += field_score
+        score = 0.0
+        completed_fields = 0
+        for field_name, field_value, weight in fields_with_weights:
+            if not field_value:
+                continue
+            field_str = str(field_value).strip()
+            if not field_str:
+                continue
+            completed_fields += 1
+            
+            # Bonus for longer content (for description)
+            if field_name == 'job_description':
+                if len(field_str) > 100:
+                    weight += 0.2
+            # Penalty for very short important fields
+            elif field_name in ('profession', 'company_name') and len(field_str) < 5:
+                weight *= 0.5
+            
+            score += weight
         
-        return min(score, 11.0)  # Cap at 11
+        return completed_fields / len(fields_with_weights), min(score, 11.0)  # Cap at 11
     
     def clean_data(self):
         """Clean and normalize data fields"""
@@ -327,32 +367,37 @@ class JobModel:
             'ausbildungsberuf', 'application_method', 'contact_person'
         ]
         
+        hashed_before = (self.profession, self.company_name, self.location, self.ref_nr, self.source_url)
+        
         for field_name in string_fields:
             field_value = getattr(self, field_name)
             if field_value:
                 # Basic cleaning
                 cleaned = str(field_value).strip()
-                cleaned = re.sub(r'\s+', ' ', cleaned)  # Multiple spaces to single
+                cleaned = _WS_RE.sub(' ', cleaned)  # Multiple spaces to single
                 
                 # Field-specific cleaning
                 if field_name == 'company_name':
-                    cleaned = re.sub(r'^Arbeitgeber:\s*', '', cleaned, flags=re.IGNORECASE)
+                    cleaned = _ARBEITGEBER_RE.sub('', cleaned)
                 elif field_name == 'email':
                     cleaned = cleaned.lower()
                 elif field_name == 'telephone':
-                    cleaned = re.sub(r'[^\d+\(\)\-\s]', '', cleaned)
+                    cleaned = _PHONE_STRIP_RE.sub('', cleaned)
                 
                 setattr(self, field_name, cleaned if cleaned else None)
         
-        # Update content hash after cleaning
-        self.content_hash = self._generate_content_hash()
+        # Update content hash after cleaning (only if a hashed field changed)
+        if hashed_before != (self.profession, self.company_name, self.location, self.ref_nr, self.source_url):
+            self.content_hash = self._generate_content_hash()
         self.updated_at = datetime.utcnow()
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert job model to dictionary"""
         data = {}
         
-        for field_name, field_value in self.__dict__.items():
+        # Slotted instances have no __dict__; walk the declared fields instead
+        for field_name in self.__dataclass_fields__:
+            field_value = getattr(self, field_name)
             if isinstance(field_value, datetime):
                 data[field_name] = field_value.isoformat()
             elif isinstance(field_value, uuid.UUID):
@@ -468,18 +513,20 @@ class JobModelValidator:
         for job in jobs:
             result = job.validate(self.validation_level)
             results.append(result)
-            
-            # Update statistics
-            self.stats['total'] += 1
-            if result.is_valid:
-                self.stats['valid'] += 1
-            else:
-                self.stats['invalid'] += 1
-            if result.warnings:
-                self.stats['warnings'] += 1
+            self.record(result)
         
         return results
     
+    def record(self, result: ValidationResult):
+        """Update statistics with one validation result (also used for results from worker processes)"""
+        self.stats['total'] += 1
+        if result.is_valid:
+            self.stats['valid'] += 1
+        else:
+            self.stats['invalid'] += 1
+        if result.warnings:
+            self.stats['warnings'] += 1
+    
     def get_validation_report(self) -> Dict[str, Any]:
         """Get validation statistics report"""
         if self.stats['total'] == 0:
@@ -492,13 +539,54 @@ class JobModelValidator:
             'warning_percentage': (self.stats['warnings'] / self.stats['total']) * 100
         }
 
+# Below this many jobs, worker start-up costs more than the parallel work saves
+PARALLEL_MIN_JOBS = 256
+PARALLEL_CHUNKSIZE = 64
+
+def _model_and_validate(scraped_data: Dict[str, Any],
+                        validation_level: ValidationLevel) -> Tuple[Optional[JobModel], Optional[ValidationResult]]:
+    """Worker: build and validate one job model; (None, None) if the data is unusable"""
+    try:
+        job_model = JobModel.from_scraped_data(scraped_data)
+    except Exception as e:
+        logger.error(f"Error creating job model: {e}")
+        return None, None
+    return job_model, job_model.validate(validation_level)
+
+def _clean_to_dict(scraped_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Worker: clean one scraped job, returning the original data if cleaning fails"""
+    try:
+        job_model = JobModel.from_scraped_data(scraped_data)
+        job_model.clean_data()
+        return job_model.to_dict()
+    except Exception as e:
+        logger.error(f"Error cleaning job data: {e}")
+        # Return original data if cleaning fails
+        return scraped_data
+
 # Utility functions
 def validate_scraped_jobs(scraped_jobs: List[Dict[str, Any]], 
-                         validation_level: ValidationLevel = ValidationLevel.MODERATE) -> Tuple[List[JobModel], Dict[str, Any]]:
-    """Validate scraped jobs and return models with validation report"""
+                         validation_level: ValidationLevel = ValidationLevel.MODERATE,
+                         parallel: bool = True) -> Tuple[List[JobModel], Dict[str, Any]]:
+    """Validate scraped jobs and return models with validation report
+    
+    Large inputs are spread over a process pool unless parallel=False.
+    """
     validator = JobModelValidator(validation_level)
     job_models = []
     
+    if parallel and len(scraped_jobs) > PARALLEL_MIN_JOBS:
+        with ProcessPoolExecutor() as executor:
+            outcomes = executor.map(
+                _model_and_validate, scraped_jobs, itertools.repeat(validation_level),
+                chunksize=PARALLEL_CHUNKSIZE
+            )
+            for job_model, result in outcomes:
+                if job_model is not None:
+                    job_models.append(job_model)
+                    validator.record(result)
+        return job_models, validator.get_validation_report()
+    
     # Convert to job models
     for scraped_data in scraped_jobs:
         try:
@@ -514,21 +602,13 @@ def validate_scraped_jobs(scraped_jobs: List[Dict[str, Any]],
     
     return job_models, validation_report
 
-def clean_scraped_jobs(scraped_jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """Clean scraped jobs and return cleaned dictionaries"""
-    cleaned_jobs = []
-    
-    for scraped_data in scraped_jobs:
-        try:
-            job_model = JobModel.from_scraped_data(scraped_data)
-            job_model.clean_data()
-            cleaned_jobs.append(job_model.to_dict())
-        except Exception as e:
-            logger.error(f"Error cleaning job data: {e}")
-            # Return original data if cleaning fails
-            cleaned_jobs.append(scraped_data)
+def clean_scraped_jobs(scraped_jobs: List[Dict[str, Any]], parallel: bool = True) -> List[Dict[str, Any]]:
+    """Clean scraped jobs and return cleaned dictionaries (process pool for large inputs)"""
+    if parallel and len(scraped_jobs) > PARALLEL_MIN_JOBS:
+        with ProcessPoolExecutor() as executor:
+            return list(executor.map(_clean_to_dict, scraped_jobs, chunksize=PARALLEL_CHUNKSIZE))
     
-    return cleaned_jobs
+    return [_clean_to_dict(scraped_data) for scraped_data in scraped_jobs]
 
 # Example usage and testing
 def main():
@@ -208,10 +208,15 @@ class Manual2CaptchaClient:
             logger.debug(f"Failed to report CAPTCHA: {e}")
 
 class CaptchaSolver:
-    def __init__(self):
-        """Initialize multi-strategy CAPTCHA solver"""
+    def __init__(self, strategies: Optional[list] = None, cpu_pool=None):
+        """Initialize multi-strategy CAPTCHA solver
+        
+        With a ``cpu_pool`` (ProcessPoolExecutor) TrOCR inference runs in worker
+        processes, each loading its own model, instead of on the event loop.
+        """
         # Strategy configuration
-        self.strategies = CAPTCHA_SETTINGS.get('solving_strategies', ['trocr', '2captcha', 'manual'])
+        self.strategies = strategies or CAPTCHA_SETTINGS.get('solving_strategies', ['trocr', '2captcha', 'manual'])
+        self.cpu_pool = cpu_pool
         self.trocr_attempts = CAPTCHA_SETTINGS.get('trocr_attempts', 3)
         self.twocaptcha_attempts = CAPTCHA_SETTINGS.get('twocaptcha_attempts', 3)
         self.manual_timeout = CAPTCHA_SETTINGS.get('manual_timeout', 300)
@@ -254,7 +259,9 @@ class CaptchaSolver:
         # Initialize TrOCR if available
         if 'trocr' in self.strategies and TROCR_AVAILABLE:
             try:
-                self._load_trocr_model()
+                # Pool workers load the model themselves; don't hold a copy here too
+                if self.cpu_pool is None:
+                    self._load_trocr_model()
                 available_strategies.append('trocr')
                 logger.info("TrOCR strategy initialized successfully")
             except Exception as e:
@@ -390,6 +397,20 @@ class CaptchaSolver:
             logger.error(f"Error extracting text with TrOCR: {e}")
             return "", 0.0
     
+    def ocr_image(self, image_data: bytes) -> Optional[Tuple[str, float]]:
+        """Preprocess and run TrOCR on raw CAPTCHA bytes; None if preprocessing failed"""
+        processed_image = self.preprocess_image_for_trocr(image_data)
+        if processed_image is None:
+            return None
+        return self.extract_text_with_trocr(processed_image)
+    
+    async def _run_ocr(self, image_data: bytes) -> Optional[Tuple[str, float]]:
+        """Run TrOCR off the event loop (process pool if configured, else a thread)"""
+        if self.cpu_pool is not None:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.cpu_pool, solve_captcha_image_sync, image_data)
+        return await asyncio.to_thread(self.ocr_image, image_data)
+    
     def _estimate_confidence(self, text: str, image: Image.Image) -> float:
         """Estimate confidence based on text characteristics and image quality"""
         try:
@@ -540,7 +561,7 @@ class CaptchaSolver:
     
     async def _solve_with_trocr(self, page: Page, captcha_selector: str, input_selector: str, submit_selector: str) -> bool:
         """Solve CAPTCHA using TrOCR model"""
-        if not TROCR_AVAILABLE or not self.model:
+        if not TROCR_AVAILABLE or (not self.model and self.cpu_pool is None):
             logger.warning("TrOCR not available")
             return False
         
@@ -556,14 +577,12 @@ class CaptchaSolver:
                     logger.error("Failed to capture CAPTCHA image")
                     continue
                 
-                # Preprocess image for TrOCR
-                processed_image = self.preprocess_image_for_trocr(image_data)
-                if processed_image is None:
+                # Preprocess and extract text with TrOCR (CPU-bound, off the event loop)
+                ocr_result = await self._run_ocr(image_data)
+                if ocr_result is None:
                     logger.error("Failed to preprocess image")
                     continue
-                
-                # Extract text using TrOCR model
-                extracted_text, confidence = self.extract_text_with_trocr(processed_image)
+                extracted_text, confidence = ocr_result
                 
                 if not extracted_text:
                     logger.warning("No text extracted, reloading CAPTCHA...")
@@ -843,6 +862,16 @@ class CaptchaSolver:
 
 
 # Utility functions
+# TrOCR-only solver owned by a ProcessPoolExecutor worker (model loaded once per process)
+_worker_solver = None
+
+def solve_captcha_image_sync(image_data: bytes) -> Optional[Tuple[str, float]]:
+    """Process-pool entry point: OCR CAPTCHA bytes with this worker's TrOCR model"""
+    global _worker_solver
+    if _worker_solver is None:
+        _worker_solver = CaptchaSolver(strategies=['trocr'])
+    return _worker_solver.ocr_image(image_data)
+
 async def is_captcha_present(page: Page, selector: str) -> bool:
     """Check if CAPTCHA is present on page"""
     try:
@@ -11,13 +11,16 @@ import logging
 from urllib.parse import urljoin, urlparse
 import json
 from pathlib import Path
+from contextlib import nullcontext
 
 logger = logging.getLogger(__name__)
 
 class ContactScraper:
-    def __init__(self, context=None):
+    def __init__(self, context=None, request_sem: Optional[asyncio.Semaphore] = None):
         """Initialize contact scraper with browser context"""
         self.context = context
+        # Optional semaphore shared with other scrapers to cap concurrent navigations
+        self.request_sem = request_sem
         self.session_contacts = {}  # Cache for session
         
         # German-specific contact page patterns
@@ -55,6 +58,10 @@ class ContactScraper:
             r'0\d{3,5}[\s\-\/]\d{6,8}',                  # Standard German format
         ]
     
+    def _request_slot(self):
+        """Concurrency slot for a page navigation (no-op without a shared semaphore)"""
+        return self.request_sem if self.request_sem is not None else nullcontext()
+    
     async def extract_basic_contact(self, page: Page) -> Dict[str, str]:
         """Extract basic contact info from current job page"""
         contact_info = {'phone': None, 'email': None, 'contact_person': None}
@@ -171,8 +178,9 @@ class ContactScraper:
             
             # Create new page for company website
             company_page = await self.context.new_page()
-            await company_page.goto(website_url, timeout=15000)
-            await company_page.wait_for_load_state('networkidle', timeout=8000)
+            async with self._request_slot():
+                await company_page.goto(website_url, timeout=15000)
+                await company_page.wait_for_load_state('networkidle', timeout=8000)
             
             # Start with homepage
             contact_info = await self._scrape_page_for_contacts(company_page)
@@ -326,8 +334,9 @@ class ContactScraper:
                 logger.debug(f"Scraping contact page: {url}")
                 
                 contact_page = await self.context.new_page()
-                await contact_page.goto(url, timeout=10000)
-                await contact_page.wait_for_load_state('networkidle', timeout=5000)
+                async with self._request_slot():
+                    await contact_page.goto(url, timeout=10000)
+                    await contact_page.wait_for_load_state('networkidle', timeout=5000)
                 
                 page_contact_info = await self._scrape_page_for_contacts(contact_page)
                 await contact_page.close()
@@ -554,10 +563,19 @@ class ContactScraper:
         for job in jobs_without_contacts:
             # Try multiple strategies to find contact info
             contact_info = {'phone': None, 'email': None, 'contact_person': None}
+            fetched = False
             
             # Strategy 1: Enhanced application link scraping
-            if job.get('application_link'):
-                website_contacts = await self.scrape_company_website(job['application_link'])
+            # (many jobs share one company page, so each link is only scraped once per session)
+            application_link = job.get('application_link')
+            if application_link:
+                website_contacts = self.session_contacts.get(application_link)
+                if website_contacts is None:
+                    website_contacts = await self.scrape_company_website(application_link)
+                    self.session_contacts[application_link] = website_contacts
+                    fetched = True
+                else:
+                    logger.debug("Reusing contacts for already scraped page: %s", application_link)
                 contact_info.update({k: v for k, v in website_contacts.items() if v})
             
             # Strategy 2: Company name search (if no application link)
@@ -573,8 +591,9 @@ class ContactScraper:
             
             processed_jobs.append(updated_job)
             
-            # Respectful delay
-            await asyncio.sleep(3)
+            # Respectful delay (only after actually hitting a site)
+            if fetched:
+                await asyncio.sleep(3)
         
         return processed_jobs
     
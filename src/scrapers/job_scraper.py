@@ -12,6 +12,7 @@ Key Features:
 """
 
 import asyncio
+import collections
 import logging
 import json
 from pathlib import Path
@@ -58,6 +59,7 @@ class JobScraper(JobScraperV1):
             'validation_failures': 0,
             'cleaning_failures': 0,
             'database_failures': 0,
+            'database_duplicates': 0,
             'realtime_enhancements': 0,
             'enhancement_successes': 0,
             'enhancement_failures': 0,
@@ -270,10 +272,10 @@ class JobScraper(JobScraperV1):
                     from scrapers.contact_scraper import ContactScraper
                     # Use current browser context if available
                     if hasattr(self, 'context') and self.context:
-                        self.contact_scraper = ContactScraper(context=self.context)
+                        self.contact_scraper = ContactScraper(context=self.context, request_sem=self.request_sem)
                     else:
                         # Will create its own browser context
-                        self.contact_scraper = ContactScraper()
+                        self.contact_scraper = ContactScraper(request_sem=self.request_sem)
                 except Exception as e:
                     logger.error(f"Failed to initialize contact scraper: {e}")
                     self.contact_scraper_available = False
@@ -337,62 +339,84 @@ class JobScraper(JobScraperV1):
             self.v2_stats['enhancement_failures'] += 1
             return True, job_data  # Continue even if enhancement system failed
     
+    async def _process_job_v2(self, job_data: Dict[str, Any],
+                              load_stats: Dict[str, int] = None) -> Optional[Dict[str, Any]]:
+        """Run a single job through validation, cleaning, enhancement and DB load (load_stats receives the loader's counts)"""
+        self.v2_stats['scraped_count'] += 1
+        
+        # Step 1: Comprehensive validation
+        if self.enable_comprehensive_validation:
+            is_valid, errors, enhanced_data = await self.comprehensive_validate_job(job_data)
+            
+            if not is_valid:
+                self.v2_stats['validation_failures'] += 1
+                logger.warning(f"Validation failed for {job_data.get('ref_nr', 'unknown')}: {errors}")
+                return None  # Skip invalid jobs
+            
+            job_data = enhanced_data
+        
+        # Step 2: Enhanced cleaning
+        if self.enable_enhanced_cleaning:
+            cleaned_success, cleaned_data = await self.enhanced_clean_job(job_data)
+            
+            if not cleaned_success:
+                self.v2_stats['cleaning_failures'] += 1
+                logger.warning(f"Cleaning failed for {job_data.get('ref_nr', 'unknown')}")
+                return None  # Skip failed cleaning
+            
+            job_data = cleaned_data
+            self.v2_stats['cleaned_count'] += 1
+        
+        # Step 2.5: Realtime contact enhancement (if missing contact info)
+        if self.enable_realtime_enhancement:
+            enhanced_success, enhanced_data = await self.realtime_contact_enhancement(job_data)
+            
+            if enhanced_success:
+                job_data = enhanced_data
+            else:
+                logger.warning(f"Realtime enhancement failed for {job_data.get('ref_nr', 'unknown')}")
+        
+        # Step 3: Single database load
+        if self.enable_single_db_load and self.db_loader:
+            try:
+                result = await self.db_loader.load_single_job(job_data, stats=load_stats)
+                if result and result.get('loaded', 0) > 0:
+                    self.v2_stats['loaded_count'] += 1
+                    logger.info(f"[DATABASE] {job_data.get('ref_nr', 'unknown')} loaded to database")
+                else:
+                    self.v2_stats['database_failures'] += 1
+                    logger.warning(f"[ERROR] Database load failed: {job_data.get('ref_nr', 'unknown')}")
+                    
+            except Exception as e:
+                self.v2_stats['database_failures'] += 1
+                logger.error(f"Database error for {job_data.get('ref_nr', 'unknown')}: {e}")
+        
+        return job_data
+    
     async def save_progress_v2(self, scraped_jobs: List[Dict], batch_number: int = None):
         """V2 Save progress with comprehensive validation, cleaning, and single DB load"""
         try:
-            processed_jobs = []
+            # Bound concurrent per-job work (enhancement + DB load) by the configured batch size
+            sem = asyncio.Semaphore(max(1, self.batch_size))
             
-            for job_data in scraped_jobs:
-                self.v2_stats['scraped_count'] += 1
-                
-                # Step 1: Comprehensive validation
-                if self.enable_comprehensive_validation:
-                    is_valid, errors, enhanced_data = await self.comprehensive_validate_job(job_data)
-                    
-                    if not is_valid:
-                        self.v2_stats['validation_failures'] += 1
-                        logger.warning(f"Validation failed for {job_data.get('ref_nr', 'unknown')}: {errors}")
-                        continue  # Skip invalid jobs
-                    
-                    job_data = enhanced_data
-                
-                # Step 2: Enhanced cleaning
-                if self.enable_enhanced_cleaning:
-                    cleaned_success, cleaned_data = await self.enhanced_clean_job(job_data)
-                    
-                    if not cleaned_success:
-                        self.v2_stats['cleaning_failures'] += 1
-                        logger.warning(f"Cleaning failed for {job_data.get('ref_nr', 'unknown')}")
-                        continue  # Skip failed cleaning
-                    
-                    job_data = cleaned_data
-                    self.v2_stats['cleaned_count'] += 1
-                
-                # Step 2.5: Realtime contact enhancement (if missing contact info)
-                if self.enable_realtime_enhancement:
-                    enhanced_success, enhanced_data = await self.realtime_contact_enhancement(job_data)
-                    
-                    if enhanced_success:
-                        job_data = enhanced_data
-                    else:
-                        logger.warning(f"Realtime enhancement failed for {job_data.get('ref_nr', 'unknown')}")
-                
-                # Step 3: Single database load
-                if self.enable_single_db_load and self.db_loader:
-                    try:
-                        result = await self.db_loader.load_single_job(job_data)
-                        if result and result.get('loaded', 0) > 0:
-                            self.v2_stats['loaded_count'] += 1
-                            logger.info(f"[DATABASE] {job_data.get('ref_nr', 'unknown')} loaded to database")
-                        else:
-                            self.v2_stats['database_failures'] += 1
-                            logger.warning(f"[ERROR] Database load failed: {job_data.get('ref_nr', 'unknown')}")
-                            
-                    except Exception as e:
-                        self.v2_stats['database_failures'] += 1
-                        logger.error(f"Database error for {job_data.get('ref_nr', 'unknown')}: {e}")
-                
-                processed_jobs.append(job_data)
+            async def _bounded(job_data: Dict[str, Any], load_stats: Dict[str, int]) -> Optional[Dict[str, Any]]:
+                async with sem:
+                    return await self._process_job_v2(job_data, load_stats)
+            
+            # Each job gets its own loader stats; they are merged once all jobs are done
+            task_stats = [{} for _ in scraped_jobs]
+            
+            # TaskGroup cancels the remaining jobs if one fails or the run is cancelled
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(_bounded(job_data, load_stats))
+                         for job_data, load_stats in zip(scraped_jobs, task_stats)]
+            
+            processed_jobs = [task.result() for task in tasks if task.result() is not None]
+            
+            batch_load_stats = collections.Counter()
+            for load_stats in task_stats:
+                batch_load_stats.update(load_stats)
+            self.v2_stats['database_duplicates'] += batch_load_stats['duplicates_found']
             
             # Still save to files as backup (but not the primary method)
             if processed_jobs:
@@ -404,7 +428,8 @@ class JobScraper(JobScraperV1):
                 self.v2_stats['data_quality_score'] = quality_score
             
             logger.info(f"[V2] Batch processed: {len(processed_jobs)} jobs")
-            logger.info(f"   [DATABASE] Loaded to DB: {self.v2_stats['loaded_count']}")
+            logger.info(f"   [DATABASE] Loaded to DB: {self.v2_stats['loaded_count']} "
+                        f"(this batch: {batch_load_stats['inserted']} new, {batch_load_stats['duplicates_found']} duplicates)")
             logger.info(f"   [ENHANCE] Realtime enhancements: {self.v2_stats['realtime_enhancements']}")
             logger.info(f"   [SUCCESS] Enhancement successes: {self.v2_stats['enhancement_successes']}")
             logger.info(f"   [QUALITY] Quality score: {self.v2_stats['data_quality_score']:.1%}")
@@ -15,6 +15,7 @@ from datetime import datetime
 import time
 import sys
 import importlib.util
+from contextlib import nullcontext
 
 # Add config and utils to path
 sys.path.append(str(Path(__file__).parent.parent / "config"))
@@ -24,11 +25,11 @@ sys.path.append(str(Path(__file__).parent.parent / "database"))
 # Import settings - no fallback, fail fast if not configured
 try:
     from settings import (SCRAPER_SETTINGS, BROWSER_SETTINGS, CAPTCHA_SETTINGS, 
-                         VALIDATION_SETTINGS, FILE_MANAGEMENT_SETTINGS, PATHS)
+                         VALIDATION_SETTINGS, FILE_MANAGEMENT_SETTINGS, PATHS, init_runtime)
 except ImportError:
     try:
         from config.settings import (SCRAPER_SETTINGS, BROWSER_SETTINGS, CAPTCHA_SETTINGS,
-                                   VALIDATION_SETTINGS, FILE_MANAGEMENT_SETTINGS, PATHS)
+                                   VALIDATION_SETTINGS, FILE_MANAGEMENT_SETTINGS, PATHS, init_runtime)
     except ImportError as e:
         raise ImportError(
             f"[ERROR] Settings import failed: {e}\n"
@@ -93,13 +94,40 @@ try:
 except ImportError:
     logger = logging.getLogger(__name__)
 
+def build_context_settings() -> Dict:
+    """Browser context options from BROWSER_SETTINGS (shared with the full pipeline)"""
+    context_settings = {
+        'user_agent': BROWSER_SETTINGS.get('user_agent', 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'),
+        'viewport': BROWSER_SETTINGS.get('viewport', {'width': 1920, 'height': 1080}),
+        'storage_state': None  # Will be saved after first CAPTCHA solve
+    }
+    
+    # Add optional settings if available
+    if 'timezone_id' in BROWSER_SETTINGS:
+        context_settings['timezone_id'] = BROWSER_SETTINGS['timezone_id']
+    if 'locale' in BROWSER_SETTINGS:
+        context_settings['locale'] = BROWSER_SETTINGS['locale']
+    
+    return context_settings
+
 class JobScraper:
-    def __init__(self, auto_solve_captcha: bool = True, use_sessions: bool = None, validate_data: bool = None):
+    def __init__(self, auto_solve_captcha: bool = True, use_sessions: bool = None, validate_data: bool = None,
+                 request_sem: Optional[asyncio.Semaphore] = None, rate_limiter=None, context=None,
+                 cpu_pool=None):
         """Initialize the job scraper with enhanced configuration"""
         self.browser = None
         self.context = None
+        # Optional browser context owned by the caller; used instead of launching a browser
+        self.shared_context = context
+        # Optional ProcessPoolExecutor for TrOCR inference (owned by the caller)
+        self.cpu_pool = cpu_pool
+        # Optional semaphore shared with other scrapers to cap concurrent navigations
+        self.request_sem = request_sem
+        # Optional RateLimiter for arbeitsagentur.de job pages (shared with the link scraper)
+        self.rate_limiter = rate_limiter
         self.scraped_count = 0
         self.failed_count = 0
+        self.last_scraped_jobs = []  # Records from the most recent run(), for callers
         self.auto_solve_captcha = auto_solve_captcha
         
         # Enhanced settings from config
@@ -158,7 +186,7 @@ class JobScraper:
         self.captcha_solver = None
         if auto_solve_captcha and CAPTCHA_SOLVER_AVAILABLE:
             try:
-                self.captcha_solver = CaptchaSolver()
+                self.captcha_solver = CaptchaSolver(cpu_pool=self.cpu_pool)
                 logger.info("[SUCCESS] CAPTCHA auto-solver initialized")
             except Exception as e:
                 logger.warning(f"[ERROR] Failed to initialize CAPTCHA solver: {e}")
@@ -226,6 +254,10 @@ class JobScraper:
             ]
         }
     
+    def _request_slot(self):
+        """Concurrency slot for a page navigation (no-op without a shared semaphore)"""
+        return self.request_sem if self.request_sem is not None else nullcontext()
+    
     async def load_job_urls(self, csv_path: str) -> List[Dict]:
         """Load job URLs from CSV file"""
         try:
@@ -238,6 +270,13 @@ class JobScraper:
     
     async def setup_browser(self):
         """Setup Playwright browser with enhanced configuration"""
+        if self.shared_context is not None:
+            # The caller owns (and closes) this context; self.browser stays None
+            self.context = self.shared_context
+            self.external_handler = ExternalLinkHandler(self.context)
+            logger.info("[SUCCESS] Using shared browser context")
+            return
+        
         playwright = await async_playwright().start()
         
         # Use settings for browser configuration
@@ -247,19 +286,7 @@ class JobScraper:
         )
         
         # Create context with enhanced settings
-        context_settings = {
-            'user_agent': BROWSER_SETTINGS.get('user_agent', 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'),
-            'viewport': BROWSER_SETTINGS.get('viewport', {'width': 1920, 'height': 1080}),
-            'storage_state': None  # Will be saved after first CAPTCHA solve
-        }
-        
-        # Add optional settings if available
-        if 'timezone_id' in BROWSER_SETTINGS:
-            context_settings['timezone_id'] = BROWSER_SETTINGS['timezone_id']
-        if 'locale' in BROWSER_SETTINGS:
-            context_settings['locale'] = BROWSER_SETTINGS['locale']
-        
-        self.context = await self.browser.new_context(**context_settings)
+        self.context = await self.browser.new_context(**build_context_settings())
         
         # Initialize external link handler AFTER context is created
         self.external_handler = ExternalLinkHandler(self.context)
@@ -651,8 +678,9 @@ class JobScraper:
             
             # Create new page for application link (separate from main page)
             app_page = await self.context.new_page()
-            await app_page.goto(application_url, timeout=30000)
-            await app_page.wait_for_load_state('networkidle', timeout=10000)
+            async with self._request_slot():
+                await app_page.goto(application_url, timeout=30000)
+                await app_page.wait_for_load_state('networkidle', timeout=10000)
             
             # Get full page content
             page_content = await app_page.content()
@@ -666,8 +694,9 @@ class JobScraper:
                 for path in contact_paths:
                     try:
                         contact_url = f"{base_url}{path}"
-                        await app_page.goto(contact_url, timeout=10000)
-                        await app_page.wait_for_load_state('networkidle', timeout=5000)
+                        async with self._request_slot():
+                            await app_page.goto(contact_url, timeout=10000)
+                            await app_page.wait_for_load_state('networkidle', timeout=5000)
                         
                         contact_page_content = await app_page.content()
                         contact_page_info = await self.extract_contact_from_text(contact_page_content)
@@ -700,8 +729,11 @@ class JobScraper:
             
             # Navigate to job page with crash detection
             try:
-                await page.goto(job_url, timeout=30000)
-                await page.wait_for_load_state('networkidle', timeout=15000)
+                if self.rate_limiter:
+                    await self.rate_limiter.acquire()
+                async with self._request_slot():
+                    await page.goto(job_url, timeout=30000)
+                    await page.wait_for_load_state('networkidle', timeout=15000)
             except Exception as nav_error:
                 if "Page crashed" in str(nav_error) or "Target page, context or browser has been closed" in str(nav_error):
                     logger.warning(f"[CRASH] Page crash detected for {job_url}")
@@ -716,7 +748,8 @@ class JobScraper:
                             except:
                                 pass
                         
-                        # Reinitialize browser
+                        # Reinitialize browser (privately; the crash may have taken a shared one down)
+                        self.shared_context = None
                         await self.setup_browser()
                         
                         # Get new page from fresh browser
@@ -948,7 +981,8 @@ class JobScraper:
                     except:
                         pass
                 
-                # Reinitialize browser
+                # Reinitialize browser (privately; the crash may have taken a shared one down)
+                self.shared_context = None
                 await self.setup_browser()
                 
                 # Get new page from fresh browser
@@ -1374,7 +1408,7 @@ class JobScraper:
                 self.auto_solve_captcha = auto_solve_captcha
                 if auto_solve_captcha and not self.captcha_solver and CAPTCHA_SOLVER_AVAILABLE:
                     try:
-                        self.captcha_solver = CaptchaSolver()
+                        self.captcha_solver = CaptchaSolver(cpu_pool=self.cpu_pool)
                         logger.info("[SUCCESS] CAPTCHA auto-solver initialized")
                     except Exception as e:
                         logger.warning(f"[ERROR] Failed to initialize CAPTCHA solver: {e}")
@@ -1420,6 +1454,7 @@ class JobScraper:
             logger.info(f"[DEBUG] Max jobs per session: {self.max_jobs_per_session}")
             
             scraped_jobs = await self.process_jobs_batch(job_urls, batch_size=self.batch_size)
+            self.last_scraped_jobs = scraped_jobs
             
             # Combine with existing data
             all_jobs = existing_jobs + scraped_jobs
@@ -1480,4 +1515,5 @@ async def main():
             scraper.file_manager.cleanup_session()
 
 if __name__ == "__main__":
+    init_runtime()
     asyncio.run(main())
\ No newline at end of file
@@ -1,8 +1,10 @@
+import csv
 import os
 import pandas as pd
 import time
 import json
 import sys
+from contextlib import nullcontext
 from pathlib import Path
 from playwright.async_api import async_playwright
 
@@ -10,7 +12,7 @@ from playwright.async_api import async_playwright
 sys.path.append(str(Path(__file__).parent.parent / "config"))
 
 try:
-    from settings import PATHS, SCRAPER_SETTINGS
+    from settings import PATHS, SCRAPER_SETTINGS, init_runtime
 except ImportError as e:
     raise ImportError(
         f"[ERROR] Settings import failed: {e}\n"
@@ -19,8 +21,12 @@ except ImportError as e:
 
 
 class JobURLScraper:
-    def __init__(self, url):
+    def __init__(self, url, rate_limiter=None, context=None):
         self.url = url
+        # Optional browser context owned by the caller (e.g. the full pipeline)
+        self.context = context
+        # Optional RateLimiter shared with the job scraper (same host)
+        self.rate_limiter = rate_limiter
         # Use centralized paths from settings
         self.input_dir = PATHS['input_dir']
         self.temp_dir = PATHS['temp_dir']
@@ -237,11 +243,18 @@ class JobURLScraper:
         all_job_urls = existing_urls if existing_urls else set()
         
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=SCRAPER_SETTINGS.get('headless', True))
-                page = await browser.new_page()
+            # Reuse the caller's browser context when given, otherwise run a private browser
+            async with (nullcontext() if self.context else async_playwright()) as p:
+                browser = None
+                if self.context:
+                    page = await self.context.new_page()
+                else:
+                    browser = await p.chromium.launch(headless=SCRAPER_SETTINGS.get('headless', True))
+                    page = await browser.new_page()
                 
                 print(f"Navigating to: {self.url}")
+                if self.rate_limiter:
+                    await self.rate_limiter.acquire()
                 await page.goto(self.url)
                 
                 # Wait for initial page load
@@ -258,6 +271,8 @@ class JobURLScraper:
                     for _ in range(start_page - 1):
                         load_more_btn = page.locator("#ergebnisliste-ladeweitere-button")
                         if await load_more_btn.is_visible():
+                            if self.rate_limiter:
+                                await self.rate_limiter.acquire()
                             await load_more_btn.click()
                             await page.wait_for_load_state("networkidle")
                             time.sleep(0.5)
@@ -314,6 +329,8 @@ class JobURLScraper:
                         print("Clicking 'Weitere Ergebnisse'...")
                         
                         try:
+                            if self.rate_limiter:
+                                await self.rate_limiter.acquire()
                             await load_more_btn.click()
                             
                             # Wait for network idle
@@ -340,7 +357,10 @@ class JobURLScraper:
                         print("No more 'Weitere Ergebnisse' button - scraping complete!")
                         break
                 
-                await browser.close()
+                if browser:
+                    await browser.close()
+                else:
+                    await page.close()
                 
                 processing_time = time.time() - start_time
                 print(f"\n=== SCRAPING COMPLETE ===")
@@ -415,16 +435,28 @@ class JobURLScraper:
             print(f"No existing CSV found at '{csv_path}'")
             return None
     
-    async def incremental_scrape(self):
+    def load_existing_url_set(self):
+        """Return the job URLs in the saved CSV as a set, without building a DataFrame"""
+        csv_path = PATHS['input_csv']
+        
+        if not os.path.exists(csv_path):
+            return set()
+        try:
+            with open(csv_path, 'r', encoding='utf-8-sig', newline='') as f:
+                return {row['job_url'] for row in csv.DictReader(f) if row.get('job_url')}
+        except Exception as e:
+            print(f"Error loading CSV: {e}")
+            return set()
+    
+    async def incremental_scrape(self, existing_urls=None):
         """Re-scrape to find new jobs and update existing data"""
         print("Starting incremental scrape to find new jobs...")
         
-        # Load existing URLs
-        existing_df = self.load_job_urls_from_csv()
-        existing_urls = set()
+        # Load existing URLs (callers that already have them pass the set in)
+        if existing_urls is None:
+            existing_urls = self.load_existing_url_set()
         
-        if existing_df is not None:
-            existing_urls = set(existing_df['job_url'].tolist())
+        if existing_urls:
             print(f"Found {len(existing_urls)} existing job URLs")
         else:
             print("No existing data found, performing full scrape...")
@@ -485,15 +517,16 @@ class JobURLScraper:
         except Exception as e:
             print(f"Failed to save update report: {e}")
     
-    async def run_scraping(self):
+    async def run_scraping(self, existing_urls=None):
         """Main method to run the scraping process"""
         print("Starting job URL scraping...")
         
         # Check if we already have scraped URLs
-        existing_df = self.load_job_urls_from_csv()
+        if existing_urls is None:
+            existing_urls = self.load_existing_url_set()
         
-        if existing_df is not None:
-            print(f"Found existing {len(existing_df)} job URLs.")
+        if existing_urls:
+            print(f"Found existing {len(existing_urls)} job URLs.")
             print("Options:")
             print("1. Skip scraping (use existing data)")
             print("2. Full re-scrape (replace all data)")
@@ -502,9 +535,9 @@ class JobURLScraper:
             choice = input("Choose option (1/2/3): ").strip()
             
             if choice == '1':
-                return existing_df
+                return self.load_job_urls_from_csv()
             elif choice == '3':
-                return await self.incremental_scrape()
+                return await self.incremental_scrape(existing_urls)
             # choice == '2' or any other input will continue to full scrape
         
         # Full scrape all job URLs
@@ -518,6 +551,8 @@ class JobURLScraper:
 
 # Example usage
 if __name__ == "__main__":
+    init_runtime()
+    
     # URL from the assignment
     url = "https://www.arbeitsagentur.de/jobsuche/suche?angebotsart=4&ausbildungsart=0&arbeitszeit=vz&branche=22;1;2;9;3;5;7;10;11;16;12;21;26;15;17;19;20;8;23;29&veroeffentlichtseit=7&sort=veroeffdatum"
     
@@ -11,6 +11,7 @@ import logging
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
+from functools import cached_property
 import shutil
 import uuid
 import hashlib
@@ -21,7 +22,7 @@ import sys
 # Import centralized settings
 sys.path.append(str(Path(__file__).parent.parent / "config"))
 try:
-    from settings import PATHS, FILE_MANAGEMENT_SETTINGS
+    from settings import PATHS, FILE_MANAGEMENT_SETTINGS, init_runtime
 except ImportError as e:
     raise ImportError(
         f"[ERROR] Settings import failed: {e}\n"
@@ -114,6 +115,7 @@ class FileManager:
             with open(lock_file, 'w') as f:
                 f.write(f"locked_at={datetime.now().isoformat()}\n")
                 f.write(f"process_id={os.getpid()}\n")
+            self._invalidate_statistics()
             
             logger.debug(f"Created session lock for {session_id}")
             return True
@@ -128,6 +130,7 @@ class FileManager:
             lock_file = self.output_dir / session_id / ".session_lock"
             if lock_file.exists():
                 lock_file.unlink()
+                self._invalidate_statistics()
                 logger.debug(f"Removed session lock for {session_id}")
         except Exception as e:
             logger.warning(f"Failed to remove session lock: {e}")
@@ -143,6 +146,7 @@ class FileManager:
             existing_session = self.find_active_session()
             if existing_session and self.create_session_lock(existing_session):
                 self.current_session_id = existing_session
+                self._invalidate_statistics()
                 self.session_start_time = datetime.now()
                 logger.info(f"Resumed existing session: {existing_session}")
                 return existing_session
@@ -158,6 +162,7 @@ class FileManager:
             self.create_session_lock(session_name)
         
         self.current_session_id = session_name
+        self._invalidate_statistics()
         self.session_start_time = datetime.now()
         
         # Create session directory
@@ -259,6 +264,7 @@ class FileManager:
             else:
                 df.to_csv(csv_path, index=False, encoding='utf-8')
             
+            self._invalidate_statistics()
             logger.info(f"Saved batch {batch_number}: {len(jobs)} jobs to {json_path.name}")
             logger.info(f"Updated progress CSV: {csv_path.name}")
             
@@ -324,6 +330,7 @@ class FileManager:
                     backup_path = backup_session_dir / file_path.name
                     shutil.copy2(file_path, backup_path)
                     files_backed_up += 1
+            self._invalidate_statistics()
             
             logger.info(f"Backed up {files_backed_up} files to {backup_session_dir}")
             return True
@@ -390,6 +397,7 @@ class FileManager:
             csv_path = source_dir / f"{output_filename}.csv"
             df = pd.DataFrame(unique_jobs)
             df.to_csv(csv_path, index=False, encoding='utf-8')
+            self._invalidate_statistics()
             
             logger.info(f"Consolidated files saved:")
             logger.info(f"  JSON: {json_path}")
@@ -411,6 +419,7 @@ class FileManager:
                 if temp_file.is_file() and temp_file.stat().st_mtime < cutoff_time:
                     temp_file.unlink()
                     cleaned_count += 1
+            self._invalidate_statistics()
             
             logger.info(f"Cleaned {cleaned_count} temporary files older than {older_than_hours} hours")
             
@@ -446,27 +455,35 @@ class FileManager:
             if not session_dir.exists():
                 return {}
             
-            # Count batch files
-            batch_files = list(session_dir.glob("scraped_jobs_batch_*.json"))
+            # One directory pass for names, batch count and sizes (DirEntry caches stat)
+            files = []
+            batch_files_count = 0
+            total_size = 0
+            with os.scandir(session_dir) as it:
+                for entry in it:
+                    if not entry.is_file():
+                        continue
+                    files.append(entry.name)
+                    total_size += entry.stat().st_size
+                    if entry.name.startswith("scraped_jobs_batch_") and entry.name.endswith(".json"):
+                        batch_files_count += 1
             
-            # Load progress CSV if exists
+            # Count progress CSV rows without building a DataFrame
             csv_path = session_dir / "scraped_jobs_progress.csv"
             total_jobs = 0
             if csv_path.exists():
-                df = pd.read_csv(csv_path)
-                total_jobs = len(df)
+                with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+                    total_jobs = max(0, sum(1 for _ in csv.reader(f)) - 1)
             
-            # Calculate file sizes
-            total_size = sum(f.stat().st_size for f in session_dir.iterdir() if f.is_file())
             total_size_mb = total_size / (1024 * 1024)
             
             stats = {
                 'session_id': session_id or self.current_session_id or 'default',
                 'session_dir': str(session_dir),
-                'batch_files_count': len(batch_files),
+                'batch_files_count': batch_files_count,
                 'total_jobs': total_jobs,
                 'total_size_mb': round(total_size_mb, 2),
-                'files': [f.name for f in session_dir.iterdir() if f.is_file()]
+                'files': files
             }
             
             return stats
@@ -475,6 +492,27 @@ class FileManager:
             logger.error(f"Error getting session statistics: {e}")
             return {}
     
+    @cached_property
+    def _cached_statistics(self) -> Dict[str, Any]:
+        """Current session statistics, computed on first access and reused until files change"""
+        return self.get_session_statistics()
+    
+    @property
+    def statistics(self) -> Dict[str, Any]:
+        """Memoized statistics for the current session; a copy, so callers cannot alter the cache"""
+        stats = dict(self._cached_statistics)
+        if 'files' in stats:
+            stats['files'] = list(stats['files'])
+        return stats
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Memoized statistics for the current session (see ``statistics``)"""
+        return self.statistics
+    
+    def _invalidate_statistics(self):
+        """Drop memoized statistics after writing or deleting files, or switching sessions"""
+        self.__dict__.pop('_cached_statistics', None)
+    
     def list_available_sessions(self) -> List[Dict[str, Any]]:
         """List all available scraping sessions"""
         try:
@@ -510,6 +548,7 @@ class FileManager:
                 return False
             
             self.current_session_id = session_id
+            self._invalidate_statistics()
             self.session_start_time = datetime.now()
             
             logger.info(f"Resumed scraping session: {session_id}")
@@ -578,4 +617,5 @@ async def main():
 
 if __name__ == "__main__":
     import asyncio
+    init_runtime()
     asyncio.run(main())
\ No newline at end of file
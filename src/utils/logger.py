@@ -8,7 +8,7 @@ import logging.handlers
 import sys
 from pathlib import Path
 
-def setup_logger(name, log_file, level=logging.INFO):
+def setup_logger(name, log_file, level=logging.INFO, max_bytes=50*1024*1024):
     """
     Set up a logger with both file and console handlers
     
@@ -16,6 +16,7 @@ def setup_logger(name, log_file, level=logging.INFO):
         name: Logger name (e.g., 'scrapers.job_scraper')
         log_file: Path to log file (e.g., 'scraper.log')
         level: Logging level (default: INFO)
+        max_bytes: Size at which the log file rotates (default: 50MB)
     
     Returns:
         Configured logger instance
@@ -35,11 +36,12 @@ def setup_logger(name, log_file, level=logging.INFO):
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     
-    # File handler with rotation
+    # File handler with rotation (entry points without init_runtime may not have the dir yet)
     try:
+        Path(log_file).parent.mkdir(parents=True, exist_ok=True)
         file_handler = logging.handlers.RotatingFileHandler(
             log_file,
-            maxBytes=50*1024*1024,  # 50MB
+            maxBytes=max_bytes,
             backupCount=5,
             encoding='utf-8'
         )
@@ -59,9 +61,11 @@ def setup_logger(name, log_file, level=logging.INFO):
 
 def get_scraper_logger(component_name):
     """Get logger for scraper components"""
-    from config.settings import PATHS, LOGGING_SETTINGS
+    try:
+        from settings import PATHS, LOG_LEVEL_INT, LOG_FILE_MAX_BYTES
+    except ImportError:
+        from config.settings import PATHS, LOG_LEVEL_INT, LOG_FILE_MAX_BYTES
     
-    log_level = getattr(logging, LOGGING_SETTINGS.get('level', 'INFO'))
     logs_dir = Path(PATHS['logs_dir'])
     
     if 'job_scraper' in component_name:
@@ -79,11 +83,14 @@ def get_scraper_logger(component_name):
     else:
         log_file = logs_dir / 'scraper.log'
     
-    return setup_logger(component_name, log_file, log_level)
+    return setup_logger(component_name, log_file, LOG_LEVEL_INT, LOG_FILE_MAX_BYTES)
 
 def get_error_logger():
     """Get logger specifically for errors"""
-    from config.settings import PATHS
+    try:
+        from settings import PATHS
+    except ImportError:
+        from config.settings import PATHS
     
     logs_dir = Path(PATHS['logs_dir'])
     error_log_file = logs_dir / 'errors.log'
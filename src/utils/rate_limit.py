@@ -0,0 +1,42 @@
+"""
+Rate limiting for scrapers
+Token bucket that smooths request rate against a single host (arbeitsagentur.de)
+"""
+
+import asyncio
+import time
+
+
+class RateLimiter:
+    """
+    Async token bucket limiter
+
+    Tokens refill continuously at ``requests_per_second``; each ``acquire()``
+    consumes one token and waits when the bucket is empty. ``burst`` caps how
+    many requests may go out back-to-back after an idle period.
+    """
+
+    def __init__(self, requests_per_second: float = 3, burst: int = None):
+        if requests_per_second <= 0:
+            raise ValueError("requests_per_second must be positive")
+
+        self.rate = float(requests_per_second)
+        self.capacity = float(burst if burst is not None else max(1, int(requests_per_second)))
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        """Add tokens earned since the last refill"""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+
+    async def acquire(self):
+        """Wait until a request may be sent"""
+        async with self._lock:
+            self._refill()
+            while self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= 1
@@ -0,0 +1,211 @@
+"""
+Persistent URL status cache for scrapers
+Remembers which job URLs were already scraped (or are gone) so repeated pipeline
+runs can skip them until the entry expires
+"""
+
+import csv
+import hashlib
+import logging
+import math
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+# Import centralized settings
+sys.path.append(str(Path(__file__).parent.parent / "config"))
+try:
+    from settings import PATHS
+except ImportError as e:
+    raise ImportError(
+        f"[ERROR] Settings import failed: {e}\n"
+        "Please ensure src/config/settings.py exists and contains PATHS"
+    )
+
+logger = logging.getLogger(__name__)
+
+# Statuses that mean "no need to scrape again until the TTL expires"
+SKIP_STATUSES = ('valid', '404')
+
+# Stay well below SQLite's bound-parameter limit
+_QUERY_CHUNK = 500
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over URL hashes, persisted as raw bytes
+    
+    Used as a negative pre-check: a URL not in the filter was definitely never
+    cached, so the sqlite lookup can be skipped. Past ``capacity`` the false
+    positive rate rises, which only costs extra lookups, never wrong answers.
+    """
+    
+    def __init__(self, capacity: int = 100_000, error_rate: float = 1e-3):
+        self.num_bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+    
+    def _positions(self, url_hash: str):
+        """Bit positions via double hashing of the 128-bit URL digest"""
+        digest = bytes.fromhex(url_hash)
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+    
+    def add(self, url_hash: str):
+        for pos in self._positions(url_hash):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+    
+    def __contains__(self, url_hash: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(url_hash))
+    
+    def load(self, path: Path) -> bool:
+        """Load bits saved by save(); False if missing or sized for other settings"""
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return False
+        if len(data) != len(self.bits):
+            return False
+        self.bits[:] = data
+        return True
+    
+    def save(self, path: Path):
+        tmp_path = path.with_suffix('.tmp')
+        tmp_path.write_bytes(self.bits)
+        tmp_path.replace(path)
+
+
+class URLStatusCache:
+    def __init__(self, db_path: str = None):
+        """Open (or create) the sqlite cache file and its Bloom filter"""
+        self.db_path = Path(db_path) if db_path else Path(PATHS['cache_dir']) / 'url_status.db'
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.bloom_path = self.db_path.with_name('seen_urls.bloom')
+
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS url_status (
+                url_hash TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                checked_at INTEGER NOT NULL
+            )
+            """
+        )
+        self.conn.commit()
+        
+        self.bloom = BloomFilter()
+        if not self.bloom.load(self.bloom_path):
+            # Missing or stale filter: rebuild from the table so it has no false negatives
+            for (url_hash,) in self.conn.execute("SELECT url_hash FROM url_status"):
+                self.bloom.add(url_hash)
+
+    @staticmethod
+    def hash_url(url: str) -> str:
+        """Short, stable key for a URL"""
+        return hashlib.blake2b(url.encode('utf-8'), digest_size=16).hexdigest()
+
+    def get_statuses(self, urls: Iterable[str]) -> Dict[str, tuple]:
+        """Return {url_hash: (status, checked_at)} for the cached URLs"""
+        return self._get_statuses_by_hash({self.hash_url(url) for url in urls})
+
+    def _get_statuses_by_hash(self, hashes: Iterable[str]) -> Dict[str, tuple]:
+        hashes = list(hashes)
+        found = {}
+        for i in range(0, len(hashes), _QUERY_CHUNK):
+            chunk = hashes[i:i + _QUERY_CHUNK]
+            placeholders = ','.join('?' * len(chunk))
+            rows = self.conn.execute(
+                f"SELECT url_hash, status, checked_at FROM url_status WHERE url_hash IN ({placeholders})",
+                chunk
+            )
+            for url_hash, status, checked_at in rows:
+                found[url_hash] = (status, checked_at)
+        return found
+
+    def filter_fresh(self, urls: List[str], ttl_days: int = 7,
+                     skip_statuses: Iterable[str] = SKIP_STATUSES) -> List[str]:
+        """Return the URLs that still need scraping (unknown, failed, or expired)"""
+        skip_statuses = frozenset(skip_statuses)
+        cutoff = int(time.time()) - ttl_days * 86400
+        hashes = [self.hash_url(url) for url in urls]
+        # Only URLs the Bloom filter may have seen need a sqlite lookup
+        cached = self._get_statuses_by_hash({h for h in hashes if h in self.bloom})
+
+        fresh = []
+        for url, url_hash in zip(urls, hashes):
+            entry = cached.get(url_hash)
+            if entry and entry[0] in skip_statuses and entry[1] >= cutoff:
+                continue
+            fresh.append(url)
+
+        logger.info(f"URL cache: {len(urls) - len(fresh)}/{len(urls)} URLs skipped (ttl={ttl_days}d)")
+        return fresh
+
+    def mark_many(self, statuses: Dict[str, str]):
+        """Record {url: status} for a batch of scraped URLs"""
+        now = int(time.time())
+        rows = [(self.hash_url(url), status, now) for url, status in statuses.items()]
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO url_status (url_hash, status, checked_at) VALUES (?, ?, ?)",
+            rows
+        )
+        self.conn.commit()
+        for url_hash, _, _ in rows:
+            self.bloom.add(url_hash)
+        self.bloom.save(self.bloom_path)
+
+    def mark(self, url: str, status: str):
+        """Record the status of a single URL"""
+        self.mark_many({url: status})
+
+    def close(self):
+        """Close the sqlite connection"""
+        self.conn.close()
+
+
+def classify_scraped_job(job: Dict) -> str:
+    """Map a scraped job record to a cache status"""
+    error = job.get('error')
+    if error:
+        return '404' if '404' in str(error) else 'error'
+    if not job.get('captcha_solved') and not job.get('is_external_redirect') \
+            and not job.get('email') and not job.get('telephone'):
+        # Contact details stayed behind the CAPTCHA; worth another attempt
+        return 'stale_captcha'
+    return 'valid'
+
+
+def write_pending_job_urls(cache: URLStatusCache, job_urls_path: Path, pending_path: Path,
+                           ttl_days: int = 7, scraped_urls: Optional[Set[str]] = None) -> Path:
+    """Copy the job_urls.csv rows that still need scraping to pending_path
+    
+    Known 404s are always skipped. URLs cached as 'valid' are only skipped when
+    scraped_urls (the resumed progress) still holds them; None means no resume.
+    """
+    # link_job writes job_urls.csv with a BOM; utf-8-sig keeps it out of the header
+    with open(job_urls_path, 'r', encoding='utf-8-sig', newline='') as f:
+        reader = csv.DictReader(f)
+        fieldnames = reader.fieldnames
+        rows = list(reader)
+    
+    urls = [row['job_url'] for row in rows]
+    pending = set(cache.filter_fresh(urls, ttl_days=ttl_days, skip_statuses=('404',)))
+    if scraped_urls is not None:
+        cached_valid = pending - set(cache.filter_fresh(urls, ttl_days=ttl_days, skip_statuses=SKIP_STATUSES))
+        rescrape = cached_valid - scraped_urls
+        if rescrape:
+            logger.info(f"URL cache: {len(rescrape)} URLs cached as valid are missing from the progress file, scraping them again")
+        pending -= cached_valid & scraped_urls
+    
+    pending_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(pending_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(row for row in rows if row['job_url'] in pending)
+    
+    return pending_path
@@ -0,0 +1,17 @@
+"""
+Shared pytest setup: make src/ packages, the bare `settings` module and scripts/
+importable like the pipeline does
+"""
+
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+for path in (project_root / "src", project_root / "scripts"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+# Appended, not prepended: src/config/selectors.py must not shadow the stdlib module
+config_dir = str(project_root / "src" / "config")
+if config_dir not in sys.path:
+    sys.path.append(config_dir)
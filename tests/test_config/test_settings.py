@@ -0,0 +1,25 @@
+"""
+Tests for runtime initialisation in settings
+"""
+
+import logging
+
+import settings
+
+
+def test_apply_component_levels_sets_configured_levels():
+    component_logger = logging.getLogger('scrapers.contact_scraper')
+    component_logger.setLevel(logging.NOTSET)
+
+    settings.apply_component_levels()
+    assert component_logger.level == logging.WARNING
+    assert logging.getLogger('database.data_loader').level == logging.DEBUG
+
+
+def test_init_runtime_applies_component_levels(monkeypatch):
+    monkeypatch.setattr(settings, 'validate_settings', lambda: [])
+    component_logger = logging.getLogger('scrapers.contact_scraper')
+    component_logger.setLevel(logging.NOTSET)
+
+    assert settings.init_runtime() == []
+    assert component_logger.level == logging.WARNING
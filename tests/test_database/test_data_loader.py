@@ -0,0 +1,285 @@
+"""
+Tests for JobDataLoader duplicate handling against a fake database manager
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+asyncpg = pytest.importorskip("asyncpg")
+
+from database.data_loader import JobDataLoader, JOB_COLUMNS, content_key, hash_content_key
+
+
+class FakeDBManager:
+    """Answers the existing-keys query from an in-memory list and records inserts"""
+
+    is_connected = True
+
+    def __init__(self, stored=()):
+        self.stored = list(stored)
+        self.inserted = []
+
+    async def execute_query(self, query, hashes, refs, urls):
+        return [
+            row for row in self.stored
+            if row['content_hash'] in hashes or row['ref_nr'] in refs or row['source_url'] in urls
+        ]
+
+    @asynccontextmanager
+    async def get_connection(self):
+        yield None
+
+    async def execute_many(self, query, records):
+        self.inserted.extend(records)
+
+    async def copy_records(self, table, columns, records):
+        self.inserted.extend(records)
+
+
+def make_loader(stored=()):
+    loader = JobDataLoader()
+    loader.db_manager = FakeDBManager(stored)
+    loader.validate_on_load = False
+    return loader
+
+
+def stored_row(profession, ref_nr, source_url):
+    key = content_key((profession, None, None, ref_nr, source_url))
+    return {'content_hash': hash_content_key(key), 'ref_nr': ref_nr, 'source_url': source_url}
+
+
+def inserted_urls(loader):
+    url_index = JOB_COLUMNS.index('source_url')
+    return [record[url_index] for record in loader.db_manager.inserted]
+
+
+def test_content_hash_treats_none_as_empty():
+    loader = make_loader()
+    assert (loader.generate_content_hash({'profession': 'Koch', 'ref_nr': None})
+            == loader.generate_content_hash({'profession': 'Koch'}))
+
+
+def test_content_hash_matches_stored_columns():
+    # Migrations rehash legacy rows from the stored columns, so loads must hash the same values
+    loader = make_loader()
+    job = loader.transform_job_data({
+        'profession': '  Koch <b>m/w/d</b> ', 'ref_nr': '10000-1', 'source_url': 'https://example.com/1'
+    })
+    stored = content_key(job[field] for field in ('profession', 'company_name', 'location', 'ref_nr', 'source_url'))
+    assert job['content_hash'] == hash_content_key(stored)
+    assert stored.startswith('koch m/w/d|')
+
+
+@pytest.mark.parametrize('raw, parsed', [
+    ('01.09.2025', '2025-09-01'),
+    ('1.9.2025', '2025-09-01'),
+    ('ab 1.9.2025', '2025-09-01'),
+    ('Beginn ab 01.09.2025', '2025-09-01'),
+    ('2025-9-1', '2025-09-01'),
+    ('ab 2025-09-01', '2025-09-01'),
+    ('ab sofort', 'ab sofort'),
+    ('', None),
+])
+def test_parse_date_string_returns_iso_dates(raw, parsed):
+    # Older loads stored the whole substituted string unpadded (e.g. "ab 2025-9-1")
+    assert make_loader().parse_date_string(raw) == parsed
+
+
+def test_parse_date_string_disabled_keeps_input():
+    loader = make_loader()
+    loader.parse_german_dates = False
+    assert loader.parse_date_string('ab 1.9.2025') == 'ab 1.9.2025'
+
+
+def test_fetch_existing_job_keys_returns_bytes_hashes():
+    row = stored_row('Koch', '10000-1', 'https://example.com/1')
+    loader = make_loader([row])
+    job = loader.transform_job_data({'profession': 'Koch', 'ref_nr': '10000-1', 'source_url': 'https://example.com/1'})
+
+    hashes, refs, urls = asyncio.run(loader.fetch_existing_job_keys([job]))
+    assert hashes == {row['content_hash']}
+    assert job['content_hash'] in hashes
+    assert refs == {'10000-1'}
+    assert urls == {'https://example.com/1'}
+
+
+def test_load_jobs_batch_skips_stored_and_repeated_jobs():
+    loader = make_loader([stored_row('Koch', '10000-1', 'https://example.com/1')])
+    raw_jobs = [
+        {'profession': 'Koch', 'ref_nr': '10000-1', 'source_url': 'https://example.com/1'},
+        {'profession': 'Kellner', 'ref_nr': '10000-2', 'source_url': 'https://example.com/2'},
+        {'profession': 'Kellner', 'ref_nr': '10000-2', 'source_url': 'https://example.com/2b'},
+        {'profession': 'Bäcker', 'ref_nr': '10000-3', 'source_url': 'https://example.com/2'},
+    ]
+
+    assert asyncio.run(loader.load_jobs_batch(raw_jobs)) == 1
+    assert inserted_urls(loader) == ['https://example.com/2']
+    assert loader.stats['duplicates_found'] == 3
+
+
+def test_load_jobs_batch_ignores_missing_ref_nr():
+    # A stored job without ref_nr must not make every ref-less job a duplicate
+    loader = make_loader([stored_row('Koch', None, 'https://example.com/1')])
+    raw_jobs = [
+        {'profession': 'Kellner', 'source_url': 'https://example.com/2'},
+        {'profession': 'Bäcker', 'source_url': 'https://example.com/3'},
+    ]
+
+    assert asyncio.run(loader.load_jobs_batch(raw_jobs)) == 2
+    assert inserted_urls(loader) == ['https://example.com/2', 'https://example.com/3']
+
+
+class DeadlockOnceConnection:
+    """Fails the first job insert with a deadlock, then inserts everything"""
+
+    def __init__(self):
+        self.attempts = 0
+        self.company_inserts = []
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+
+    async def fetch(self, query, names):
+        return []
+
+    async def fetchmany(self, query, records):
+        if 'INSERT INTO companies' in query:
+            self.company_inserts.append([record[2] for record in records])
+            return [{'normalized_name': record[2], 'id': record[0]} for record in records]
+        self.attempts += 1
+        if self.attempts == 1:
+            raise asyncpg.DeadlockDetectedError("deadlock detected")
+        return [{'id': record[0]} for record in records]
+
+
+def test_insert_job_batch_retries_deadlocks_with_sorted_companies():
+    loader = make_loader()
+    conn = DeadlockOnceConnection()
+
+    @asynccontextmanager
+    async def get_transaction():
+        yield conn
+
+    loader.db_manager.get_transaction = get_transaction
+    jobs = [
+        loader.transform_job_data({'profession': 'Koch', 'company_name': name,
+                                   'source_url': f'https://example.com/{n}'})
+        for n, name in enumerate(['Zeta GmbH', 'Alpha AG'])
+    ]
+
+    assert asyncio.run(loader.insert_job_batch(jobs)) == (2, 0)
+    assert conn.attempts == 2
+    assert conn.company_inserts == [['alpha ag', 'zeta gmbh']] * 2
+    assert loader.stats['companies_created'] == 2
+
+
+async def collect_batches(loader, raw_jobs):
+    return [batch async for batch in loader._transformed_batches(raw_jobs, transformed=False)]
+
+
+def raw_jobs_for(count):
+    return [{'profession': 'Koch', 'source_url': f'https://example.com/{n}'} for n in range(count)]
+
+
+def test_small_inputs_are_transformed_inline(monkeypatch):
+    loader = make_loader()
+    loader.transform_workers = 2
+    loader.batch_size = 100
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("process pool started for a small input")
+
+    monkeypatch.setattr('database.data_loader.ProcessPoolExecutor', no_pool)
+    batches = asyncio.run(collect_batches(loader, raw_jobs_for(250)))
+    assert [raw_count for raw_count, _ in batches] == [100, 100, 50]
+
+
+def test_large_inputs_use_spawned_workers():
+    loader = make_loader()
+    loader.transform_workers = 2
+    loader.batch_size = 10
+    loader.transform_parallel_min_rows = 20
+
+    batches = asyncio.run(collect_batches(loader, raw_jobs_for(35)))
+    assert [raw_count for raw_count, _ in batches] == [10, 10, 10, 5]
+    urls = [job['source_url'] for _, batch in batches for job in batch]
+    assert urls == [f'https://example.com/{n}' for n in range(35)]
+
+
+class RowByRowConnection:
+    """Inserts rows one at a time, rejecting the ones whose source_url is in `bad_urls`"""
+
+    def __init__(self, bad_urls):
+        self.bad_urls = bad_urls
+        self.inserted = []
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+
+    async def fetchrow(self, query, *record):
+        if record[JOB_COLUMNS.index('source_url')] in self.bad_urls:
+            raise asyncpg.DataError("value too long")
+        self.inserted.append(record)
+        return {'id': len(self.inserted)}
+
+
+def test_load_jobs_batch_falls_back_to_row_inserts_for_a_failed_chunk():
+    loader = make_loader()
+    loader.copy_batch_size = 100
+    conn = RowByRowConnection({'https://example.com/120'})
+    copied = []
+
+    async def copy_records(table, columns, records):
+        if copied:
+            raise asyncpg.DataError("value too long")
+        copied.extend(records)
+
+    @asynccontextmanager
+    async def get_transaction():
+        yield conn
+
+    loader.db_manager.copy_records = copy_records
+    loader.db_manager.get_transaction = get_transaction
+    loader._company_cache['stale gmbh'] = 'id'
+
+    assert asyncio.run(loader.load_jobs_batch(raw_jobs_for(150))) == 149
+    assert len(copied) == 100
+    assert len(conn.inserted) == 49
+    assert loader.stats['inserted'] == 149
+    assert loader.stats['errors'] == 1
+    assert loader._company_cache == {}
+
+
+def test_concurrent_single_job_loads_keep_their_own_stats_and_the_cache():
+    loader = make_loader()
+
+    async def run():
+        gate = asyncio.Event()
+
+        async def insert_job_batch(jobs):
+            if jobs[0]['source_url'].endswith('/1'):
+                # The second load finishes while this one is still in flight
+                await gate.wait()
+                assert loader._company_cache == {'koch gmbh': 'id'}
+                return 1, 0
+            loader._company_cache['koch gmbh'] = 'id'
+            return 0, 1
+
+        loader.insert_job_batch = insert_job_batch
+        first, second = {}, {}
+        task = asyncio.create_task(loader.load_single_job(
+            {'profession': 'Koch', 'source_url': 'https://example.com/1'}, stats=first))
+        await loader.load_single_job({'profession': 'Koch', 'source_url': 'https://example.com/2'}, stats=second)
+        gate.set()
+        await task
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert (first['inserted'], first['duplicates_found']) == (1, 0)
+    assert (second['inserted'], second['duplicates_found']) == (0, 1)
+    assert (loader.stats['total_processed'], loader.stats['inserted'], loader.stats['duplicates_found']) == (2, 1, 1)
+    assert loader._company_cache == {}
@@ -0,0 +1,61 @@
+"""
+Tests for the data migrations against a scripted fake connection
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("asyncpg")
+
+from database.migrations import MigrationError, prepare_unique_job_keys
+
+
+class FakeConnection:
+    """Answers the catalog queries from fixed data and records every statement run"""
+
+    def __init__(self, indexes=(), duplicates=None):
+        self.indexes = list(indexes)
+        self.duplicates = dict(duplicates or {})
+        self.executed = []
+
+    async def fetchval(self, query, *args):
+        if 'to_regclass' in query:
+            return 'jobs'
+        column = 'ref_nr' if 'GROUP BY ref_nr' in query else 'content_hash'
+        return self.duplicates.get(column, 0)
+
+    async def fetch(self, query, *args):
+        return [{'indexname': name} for name in self.indexes]
+
+    async def execute(self, query, *args):
+        self.executed.append(' '.join(query.split()))
+        if query.lstrip().startswith('DELETE'):
+            column = 'ref_nr' if 'j.ref_nr' in query else 'content_hash'
+            deleted = self.duplicates.pop(column, 0)
+            return f"DELETE {deleted}"
+        return "DROP INDEX"
+
+
+def test_duplicates_stop_the_migration_without_deleting():
+    conn = FakeConnection(duplicates={'ref_nr': 2})
+    with pytest.raises(MigrationError, match="--dedupe-jobs"):
+        asyncio.run(prepare_unique_job_keys(conn))
+    assert not any(statement.startswith('DELETE') for statement in conn.executed)
+
+
+def test_dedupe_opt_in_deletes_then_drops_old_indexes():
+    conn = FakeConnection(indexes=['idx_jobs_ref_nr', 'idx_jobs_content_hash'],
+                          duplicates={'ref_nr': 2})
+    assert asyncio.run(prepare_unique_job_keys(conn, dedupe_jobs=True))
+    deletes = [statement for statement in conn.executed if statement.startswith('DELETE')]
+    assert len(deletes) == 2
+    # Rows without scraped_at still take part in the comparison
+    assert all("COALESCE(k.scraped_at, '-infinity')" in statement for statement in deletes)
+    assert conn.executed[-2:] == ["DROP INDEX idx_jobs_ref_nr", "DROP INDEX idx_jobs_content_hash"]
+
+
+def test_nothing_to_do_once_unique_indexes_exist():
+    conn = FakeConnection(indexes=['uq_jobs_ref_nr', 'uq_jobs_content_hash'])
+    assert not asyncio.run(prepare_unique_job_keys(conn))
+    assert conn.executed == []
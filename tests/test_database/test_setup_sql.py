@@ -0,0 +1,62 @@
+"""
+Tests for the schema.sql statement splitter in scripts/setup_database.py
+"""
+
+import io
+from pathlib import Path
+
+from setup_database import iter_sql_statements
+
+SCHEMA_FILE = Path(__file__).parent.parent.parent / "src" / "database" / "schema.sql"
+
+
+def split(sql: str):
+    return list(iter_sql_statements(io.StringIO(sql)))
+
+
+def test_splits_on_semicolons_and_drops_comments():
+    sql = "CREATE TABLE a (x int); -- first; table\nCREATE TABLE b (y int);\n"
+    assert split(sql) == ["CREATE TABLE a (x int)", "CREATE TABLE b (y int)"]
+
+
+def test_trailing_statement_without_semicolon():
+    assert split("SELECT 1;\nSELECT 2") == ["SELECT 1", "SELECT 2"]
+
+
+def test_semicolon_inside_string_literal():
+    sql = "INSERT INTO t VALUES ('a;b', 'it''s; fine');\nSELECT 1;"
+    assert split(sql) == ["INSERT INTO t VALUES ('a;b', 'it''s; fine')", "SELECT 1"]
+
+
+def test_comment_marker_inside_string_literal():
+    assert split("SELECT '--not a comment;';") == ["SELECT '--not a comment;'"]
+
+
+def test_semicolon_inside_quoted_identifier_and_block_comment():
+    sql = 'SELECT "odd;name" /* a; b */ FROM t;'
+    assert split(sql) == ['SELECT "odd;name" /* a; b */ FROM t']
+
+
+def test_dollar_quoted_bodies_span_lines():
+    sql = (
+        "CREATE FUNCTION f() RETURNS int AS $$\nBEGIN\n    RETURN 1;\nEND;\n$$ LANGUAGE plpgsql;\n"
+        "CREATE FUNCTION g() RETURNS text AS $body$ SELECT '$$;' $body$ LANGUAGE sql;\n"
+    )
+    statements = split(sql)
+    assert len(statements) == 2
+    assert statements[0].endswith("$$ LANGUAGE plpgsql")
+    assert statements[1] == "CREATE FUNCTION g() RETURNS text AS $body$ SELECT '$$;' $body$ LANGUAGE sql"
+
+
+def test_positional_parameters_are_not_dollar_quotes():
+    assert split("SELECT $1; SELECT $2;") == ["SELECT $1", "SELECT $2"]
+
+
+def test_schema_file_splits_into_complete_statements():
+    with open(SCHEMA_FILE, encoding='utf-8') as f:
+        statements = list(iter_sql_statements(f))
+    assert statements
+    # Every function body is kept whole
+    for statement in statements:
+        assert statement.count('$$') % 2 == 0
+    assert any(s.startswith("CREATE TABLE IF NOT EXISTS jobs") for s in statements)
@@ -0,0 +1,88 @@
+"""
+Tests for the JobModel validation helpers
+"""
+
+import hashlib
+from datetime import datetime
+
+import pytest
+
+from models.job_model import (
+    JobModel,
+    _is_known_date_format,
+    _is_valid_email,
+    _parse_datetime_string,
+)
+
+
+@pytest.mark.parametrize("email", [
+    "info@firma.de",
+    "bewerbung.hr+azubi@sub.firma-gmbh.com",
+    "max_mustermann%1@example.org",
+])
+def test_valid_emails(email):
+    assert _is_valid_email(email)
+
+
+@pytest.mark.parametrize("email", [
+    "",
+    "info",
+    "@firma.de",
+    "info@",
+    "info@firma",
+    "info@firma.d",
+    "info@.de",
+    "info@firma.de1",
+    "in fo@firma.de",
+    "info@fir ma.de",
+    "ärger@firma.de",
+])
+def test_invalid_emails(email):
+    assert not _is_valid_email(email)
+
+
+def test_email_check_has_no_backtracking_blowup():
+    # The old regex backtracked on long near-misses like this
+    assert not _is_valid_email("a" * 5000 + "@" + "b." * 5000 + "1")
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("2025-08-22", datetime(2025, 8, 22)),
+    ("2025-08-22T10:15:30", datetime(2025, 8, 22, 10, 15, 30)),
+    ("2025-08-22 10:15:30", datetime(2025, 8, 22, 10, 15, 30)),
+    ("2025-08-22T10:15:30.5", datetime(2025, 8, 22, 10, 15, 30, 500000)),
+    ("2025-08-22T10:15:30Z", datetime(2025, 8, 22, 10, 15, 30)),
+    ("2025-08-22T10:15:30+02:00", datetime(2025, 8, 22, 10, 15, 30)),
+])
+def test_parse_datetime_string(text, expected):
+    assert _parse_datetime_string(text) == expected
+
+
+@pytest.mark.parametrize("text", ["22.08.2025", "2025-13-01", "not a date"])
+def test_parse_datetime_string_rejects_unknown(text):
+    assert _parse_datetime_string(text) is None
+
+
+def test_parse_datetime_string_is_memoized():
+    _parse_datetime_string.cache_clear()
+    first = _parse_datetime_string("2025-08-22T10:15:30")
+    second = _parse_datetime_string("2025-08-22T10:15:30")
+    assert first is second
+    info = _parse_datetime_string.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+def test_known_date_format_is_memoized():
+    _is_known_date_format.cache_clear()
+    assert _is_known_date_format("ab 01.09.2025")
+    assert _is_known_date_format("ab 01.09.2025")
+    assert not _is_known_date_format("sofort")
+    assert _is_known_date_format.cache_info().hits == 1
+
+
+def test_content_hash_is_stable_blake2b():
+    job = JobModel(profession="Koch", company_name="Firma", source_url="https://example.com/1")
+    same = JobModel(profession="KOCH", company_name="Firma", source_url="https://example.com/1")
+    assert job.content_hash == same.content_hash
+    expected = hashlib.blake2b(b"koch|firma|||https://example.com/1", digest_size=16).hexdigest()
+    assert job.content_hash == expected
@@ -0,0 +1,43 @@
+"""
+Tests for FileManager's memoized session statistics
+"""
+
+import pytest
+
+pytest.importorskip("pandas")
+
+from utils import file_manager as fm
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    paths = dict(fm.PATHS)
+    for key in ('input_dir', 'output_dir', 'logs_dir', 'temp_dir', 'backup_dir'):
+        paths[key] = str(tmp_path / key)
+    monkeypatch.setattr(fm, 'PATHS', paths)
+    return fm.FileManager(base_dir=str(tmp_path))
+
+
+def test_statistics_returns_a_copy(manager):
+    stats = manager.statistics
+    stats['total_jobs'] = -1
+    stats['files'].append('bogus.json')
+    assert manager.statistics['total_jobs'] != -1
+    assert 'bogus.json' not in manager.statistics['files']
+
+
+def test_consolidate_refreshes_statistics(manager):
+    manager.save_jobs_batch([{'ref_nr': 'A1', 'profession': 'Koch'}], batch_number=1)
+    before = manager.statistics['files']
+    manager.consolidate_batch_files(output_filename='merged')
+    after = manager.statistics['files']
+    assert 'merged.json' not in before
+    assert {'merged.json', 'merged.csv'} <= set(after)
+
+
+def test_clean_temp_files_refreshes_statistics(manager, monkeypatch):
+    monkeypatch.setattr(manager, 'output_dir', manager.temp_dir)
+    (manager.temp_dir / 'old.tmp').write_text('x')
+    assert 'old.tmp' in manager.statistics['files']
+    manager.clean_temp_files(older_than_hours=-1)
+    assert 'old.tmp' not in manager.statistics['files']
@@ -0,0 +1,56 @@
+"""
+Tests for the token bucket RateLimiter
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from utils.rate_limit import RateLimiter
+
+
+@pytest.mark.parametrize("rate", [0, -1])
+def test_rejects_non_positive_rate(rate):
+    with pytest.raises(ValueError):
+        RateLimiter(rate)
+
+
+def test_capacity_defaults_to_rate():
+    assert RateLimiter(3).capacity == 3
+    assert RateLimiter(0.5).capacity == 1
+    assert RateLimiter(2, burst=5).capacity == 5
+
+
+def test_burst_goes_out_without_waiting():
+    limiter = RateLimiter(1, burst=3)
+
+    async def run():
+        start = time.monotonic()
+        for _ in range(3):
+            await limiter.acquire()
+        return time.monotonic() - start
+
+    assert asyncio.run(run()) < 0.1
+    assert limiter.tokens < 1
+
+
+def test_waits_once_bucket_is_empty():
+    limiter = RateLimiter(20, burst=1)
+
+    async def run():
+        await limiter.acquire()
+        start = time.monotonic()
+        await limiter.acquire()
+        return time.monotonic() - start
+
+    # One token refills in 1/20 s
+    assert asyncio.run(run()) >= 0.04
+
+
+def test_refill_is_capped_at_capacity():
+    limiter = RateLimiter(10, burst=2)
+    limiter.tokens = 0
+    limiter.last_refill -= 60
+    limiter._refill()
+    assert limiter.tokens == 2
@@ -0,0 +1,128 @@
+"""
+Tests for the Bloom filter and the sqlite URL status cache
+"""
+
+import time
+
+import pytest
+
+from utils.url_cache import BloomFilter, URLStatusCache, classify_scraped_job, write_pending_job_urls
+
+
+def url_hash(n: int) -> str:
+    return URLStatusCache.hash_url(f"https://www.arbeitsagentur.de/jobsuche/jobdetail/{n}")
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000)
+    hashes = [url_hash(n) for n in range(1000)]
+    for h in hashes:
+        bloom.add(h)
+    assert all(h in bloom for h in hashes)
+
+
+def test_bloom_filter_false_positive_rate():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    for n in range(1000):
+        bloom.add(url_hash(n))
+    false_positives = sum(url_hash(n) in bloom for n in range(1000, 11000))
+    assert false_positives < 300  # ~1% expected of 10000
+
+
+def test_bloom_filter_round_trip(tmp_path):
+    path = tmp_path / "seen.bloom"
+    bloom = BloomFilter(capacity=100)
+    bloom.add(url_hash(1))
+    bloom.save(path)
+
+    loaded = BloomFilter(capacity=100)
+    assert loaded.load(path)
+    assert url_hash(1) in loaded
+    # Sized for other settings: rejected instead of misread
+    assert not BloomFilter(capacity=1000).load(path)
+    assert not BloomFilter(capacity=100).load(tmp_path / "missing.bloom")
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = URLStatusCache(tmp_path / "url_status.db")
+    yield cache
+    cache.close()
+
+
+def test_filter_fresh_skips_recent_valid_and_404(cache):
+    urls = [f"https://example.com/job/{n}" for n in range(4)]
+    cache.mark_many({urls[0]: 'valid', urls[1]: '404', urls[2]: 'error'})
+    assert cache.filter_fresh(urls) == urls[2:]
+
+
+def test_filter_fresh_rescrapes_expired_entries(cache):
+    url = "https://example.com/job/1"
+    cache.mark(url, 'valid')
+    cache.conn.execute("UPDATE url_status SET checked_at = ?", (int(time.time()) - 8 * 86400,))
+    assert cache.filter_fresh([url], ttl_days=7) == [url]
+
+
+def test_statuses_survive_reopen(tmp_path):
+    db_path = tmp_path / "url_status.db"
+    cache = URLStatusCache(db_path)
+    cache.mark("https://example.com/job/1", '404')
+    cache.close()
+
+    reopened = URLStatusCache(db_path)
+    try:
+        statuses = reopened.get_statuses(["https://example.com/job/1"])
+        assert [status for status, _ in statuses.values()] == ['404']
+        assert reopened.filter_fresh(["https://example.com/job/1"]) == []
+    finally:
+        reopened.close()
+
+
+def test_lookup_is_chunked_below_sqlite_parameter_limit(cache):
+    urls = [f"https://example.com/job/{n}" for n in range(1200)]
+    cache.mark_many({url: 'valid' for url in urls})
+    assert len(cache.get_statuses(urls)) == 1200
+
+
+@pytest.mark.parametrize("job, status", [
+    ({'error': 'HTTP 404'}, '404'),
+    ({'error': 'timeout'}, 'error'),
+    ({'captcha_solved': False}, 'stale_captcha'),
+    ({'email': 'info@firma.de'}, 'valid'),
+    ({'is_external_redirect': True}, 'valid'),
+])
+def test_classify_scraped_job(job, status):
+    assert classify_scraped_job(job) == status
+
+
+def write_job_urls(path, urls):
+    # Same encoding as link_job, BOM included
+    lines = ["job_url,title"] + [f"{url},Job {n}" for n, url in enumerate(urls)]
+    path.write_text("\n".join(lines) + "\n", encoding='utf-8-sig')
+
+
+def pending_urls(path):
+    return [line.split(',')[0] for line in path.read_text(encoding='utf-8').splitlines()[1:]]
+
+
+def test_write_pending_job_urls_reads_bom_csv(cache, tmp_path):
+    urls = [f"https://example.com/job/{n}" for n in range(3)]
+    job_urls_path = tmp_path / "job_urls.csv"
+    write_job_urls(job_urls_path, urls)
+    cache.mark_many({urls[0]: '404', urls[1]: 'valid'})
+
+    pending = write_pending_job_urls(cache, job_urls_path, tmp_path / "pending.csv")
+    assert pending.read_text(encoding='utf-8').startswith("job_url,title")
+    # Without resume only 404s are skipped
+    assert pending_urls(pending) == urls[1:]
+
+
+def test_write_pending_job_urls_keeps_valid_urls_missing_from_progress(cache, tmp_path):
+    urls = [f"https://example.com/job/{n}" for n in range(3)]
+    job_urls_path = tmp_path / "job_urls.csv"
+    write_job_urls(job_urls_path, urls)
+    cache.mark_many({urls[0]: 'valid', urls[1]: 'valid'})
+
+    pending = write_pending_job_urls(cache, job_urls_path, tmp_path / "pending.csv",
+                                     scraped_urls={urls[0]})
+    assert pending_urls(pending) == urls[1:]